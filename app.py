@@ -1,23 +1,23 @@
-import io
-
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+from concurrent.futures import Future
 from functools import wraps
-from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
+import time
 import uuid
 import re
 import base64
 import json
+import config
 import database
+import housekeeping
+import metrics
 
-from services.audio_service import AudioService
-from services.video_service import VideoService
-from services.timeline_service import TimelineService
-from services.llm_service import LLMService
-from services.tts_service import TTSService
+from services.lazy import LazyService
+from services.progress_service import ProgressService
+from services.analysis_pool import AnalysisPool, PoolSaturated
 from resume_extractor import extract_text as extract_resume_text
-from report_generator import build_graphs, build_pdf
 
 app = Flask(__name__)
 CORS(app, supports_credentials=True)
@@ -25,17 +25,22 @@ CORS(app, supports_credentials=True)
 database.init_db()
 
 print("🚀 Booting PrepSpark…")
-audio_svc    = AudioService()
-video_svc    = VideoService()
-timeline_svc = TimelineService()
-llm_svc      = LLMService()
-tts_svc      = TTSService()
+# Services are built on first use (or by warm_up()) so importing this module
+# stays cheap — MediaPipe, Groq, Gemini and TTS clients load only when needed.
+audio_svc    = LazyService("services.audio_service:AudioService")
+timeline_svc = LazyService("services.timeline_service:TimelineService")
+llm_svc      = LazyService("services.llm_service:LLMService", usage_sink=database.record_llm_usage)
+tts_svc      = LazyService("services.tts_service:TTSService")
+progress_svc = ProgressService()
+
+# Video + Praat analysis runs in worker processes, each with its own preloaded models
+analysis_pool = AnalysisPool()
 
 UPLOAD_FOLDER = 'uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
-# Dynamic question limits — imported from llm_service for consistency
-from services.llm_service import MIN_QUESTIONS, MAX_QUESTIONS
+# Dynamic question limits — shared with llm_service via config
+from config import MIN_QUESTIONS, MAX_QUESTIONS
 
 SUPPORTED_LANGUAGES = {
     'hi', 'ta', 'te', 'bn', 'kn', 'ml', 'mr', 'pa', 'gu', 'ur', 'or', 'as',
@@ -48,6 +53,73 @@ SUPPORTED_LANGUAGES = {
 # HELPERS
 # ─────────────────────────────────────────────
 
+# What /ready reports. "cold" → "warming" → "ready" (or "failed").
+_readiness      = {"state": "cold", "components": {}, "seconds": None}
+_readiness_lock = threading.Lock()
+
+
+def warm_up():
+    """
+    Pays every first-use cost before real traffic arrives:
+      • builds the Groq / Gemini / TTS clients (no API calls are made),
+      • starts the analysis workers, each of which runs a synthetic frame
+        through FaceMesh + the emotion net and a synthetic clip through Praat.
+    Records per-component results in the state /ready serves.
+    """
+    steps = [
+        ("audio",            audio_svc.get),
+        ("timeline",         timeline_svc.get),
+        ("llm",              llm_svc.get),
+        ("tts",              lambda: tts_svc.warm_up()),
+        ("analysis_workers", analysis_pool.start),
+    ]
+    t0 = time.perf_counter()
+    components, failed = {}, False
+    for name, step in steps:
+        try:
+            step()
+            components[name] = "ok"
+        except Exception as e:
+            print(f"❌ Warm-up failed for {name}: {e}")
+            components[name] = f"error: {e}"
+            failed = True
+
+    with _readiness_lock:
+        _readiness.update(state="failed" if failed else "ready", components=components,
+                          seconds=round(time.perf_counter() - t0, 2))
+    print(f"{'⚠️ ' if failed else '🔥'} Warm-up {_readiness['state']} in {_readiness['seconds']}s.")
+
+
+def reset_after_fork():
+    """
+    Called in every worker of a pre-fork server (gunicorn.conf.py → post_fork).
+    Drops anything inherited from the master that must not be shared across a
+    fork, so this worker builds its own API clients, MediaPipe graph / ONNX
+    net (inside its analysis pool) and starts cold.
+    """
+    global _readiness_lock, _regenerations_lock
+    for svc in (audio_svc, timeline_svc, llm_svc, tts_svc):
+        svc.reset()
+    analysis_pool.after_fork()
+    _readiness_lock = threading.Lock()
+    _regenerations_lock = threading.Lock()
+    _regenerations.clear()
+    _readiness.update(state="cold", components={}, seconds=None)
+
+
+def start_warm_up() -> bool:
+    """
+    Runs warm_up() in a background thread. Does nothing (returns False) while
+    warming or once ready; a failed warm-up is retried on the next call.
+    """
+    with _readiness_lock:
+        if _readiness["state"] not in ("cold", "failed"):
+            return False
+        _readiness["state"] = "warming"
+    threading.Thread(target=warm_up, daemon=True, name="warm-up").start()
+    return True
+
+
 def require_auth(f):
     @wraps(f)
     def decorated(*args, **kwargs):
@@ -80,16 +152,9 @@ def _validate_language(lang_code: str) -> str:
 
 
 def _build_interview_log(responses: list) -> list:
+    """Report input from database.ResponseRecord rows (metrics columns arrive decoded)."""
     log = []
     for r in responses:
-        try:
-            audio_m = json.loads(r.get("audio_metrics") or "{}")
-        except Exception:
-            audio_m = {}
-        try:
-            video_m = json.loads(r.get("video_metrics") or "{}")
-        except Exception:
-            video_m = {}
         log.append({
             "question_index": r.get("question_index"),
             "question_type":  r.get("question_type", "technical"),
@@ -97,21 +162,54 @@ def _build_interview_log(responses: list) -> list:
             "transcript":     r.get("transcript"),
             "ai_score":       r.get("ai_score", 0),
             "ai_feedback":    r.get("ai_feedback", ""),
-            "audio_metrics":  audio_m,
-            "video_metrics":  video_m,
+            "audio_metrics":  r["audio_metrics"],
+            "video_metrics":  r["video_metrics"],
         })
     return log
 
 
-def _complete_session(session_id: str, session_info: dict):
+def _report_payload(session_id: str, session_info: dict, interview_log: list,
+                    detailed_report: dict) -> dict:
+    """The stored report JSON (analytics is added once generated)."""
+    return {
+        "candidate":       session_info["candidate_name"],
+        "role":            session_info.get("target_role", "Professional"),
+        "session_id":      session_id,
+        "start_time":      session_info.get("start_time", ""),
+        "language":        session_info.get("language", "en"),
+        "has_resume":      bool(session_info.get("resume_text")),
+        "has_jd":          bool(session_info.get("job_description")),
+        "total_questions": len(interview_log),
+        "responses":       interview_log,
+        "report":          detailed_report
+    }
+
+
+def _pdf_session_meta(session_id: str, session_info: dict, interview_log: list) -> dict:
+    return {
+        "candidate_name": session_info["candidate_name"],
+        "target_role":    session_info.get("target_role", "Professional"),
+        "company_name":   session_info.get("company_name", ""),
+        "session_id":     session_id,
+        "start_time":     session_info.get("start_time", ""),
+        "language":       session_info.get("language", "en"),
+        "total_questions": len(interview_log),
+    }
+
+
+def _complete_session(session_id: str, session_info: dict, emit=None):
     """
-    Called once after the final question is answered.
+    Called once after the final question is answered; `emit` (as in
+    _process_submission) gets `report_generating` before the work starts.
     1. Generates LLM narrative report.
     2. Generates structured analytics data (for graphs).
     3. Generates 6 graph images.
     4. Assembles and stores a PDF report.
     5. Marks session COMPLETED.
     """
+    if emit:
+        emit("report_generating", {})
+    from report_generator import build_graphs, build_pdf   # matplotlib + reportlab: only load when reporting
     try:
         print(f"📄 Generating report for session {session_id}…")
         _, responses = database.get_full_session_data(session_id)
@@ -128,21 +226,11 @@ def _complete_session(session_id: str, session_info: dict):
             interview_log,
             language=language,
             resume_text=resume_text,
-            job_description=job_description
+            job_description=job_description,
+            session_id=session_id
         )
 
-        full_payload = {
-            "candidate":       session_info["candidate_name"],
-            "role":            target_role,
-            "session_id":      session_id,
-            "start_time":      session_info.get("start_time", ""),
-            "language":        language,
-            "has_resume":      bool(resume_text),
-            "has_jd":          bool(job_description),
-            "total_questions": len(interview_log),
-            "responses":       interview_log,
-            "report":          detailed_report
-        }
+        full_payload = _report_payload(session_id, session_info, interview_log, detailed_report)
         database.save_report(session_id, full_payload)
 
         # ── Step 2: Analytics data (for graphs) ──
@@ -152,7 +240,8 @@ def _complete_session(session_id: str, session_info: dict):
             target_role=target_role,
             resume_text=resume_text,
             job_description=job_description,
-            language=language
+            language=language,
+            session_id=session_id
         )
 
         # ── Step 3: Generate graph images ──
@@ -161,17 +250,8 @@ def _complete_session(session_id: str, session_info: dict):
 
         # ── Step 4: Build PDF ──
         print("  → Building PDF…")
-        session_meta = {
-            "candidate_name": session_info["candidate_name"],
-            "target_role":    target_role,
-            "company_name":   session_info.get("company_name", ""),
-            "session_id":     session_id,
-            "start_time":     session_info.get("start_time", ""),
-            "language":       language,
-            "total_questions": len(interview_log),
-        }
         pdf_bytes = build_pdf(
-            session_info=session_meta,
+            session_info=_pdf_session_meta(session_id, session_info, interview_log),
             analytics=analytics,
             report=detailed_report,
             responses=interview_log,
@@ -179,14 +259,15 @@ def _complete_session(session_id: str, session_info: dict):
         )
         database.save_pdf_report(session_id, pdf_bytes, analytics)
 
-        # ── Step 5: Inject graph base64 into JSON payload for frontend display ──
+        # ── Step 5: Store graphs as assets; the JSON payload only gets the analytics ──
+        database.save_report_graphs(session_id, graphs)
         full_payload["analytics"] = analytics
-        full_payload["graphs_b64"] = {k: base64.b64encode(v).decode() for k, v in graphs.items()}
         database.save_report(session_id, full_payload)
 
         database.mark_session_completed(session_id)
         print(f"✅ Session {session_id} COMPLETED — {len(interview_log)} questions, "
               f"PDF {len(pdf_bytes)//1024}KB, {len(graphs)} graphs.")
+        _log_llm_usage(session_id)
 
     except Exception as e:
         print(f"⚠️  Report generation failed: {e}")
@@ -198,6 +279,155 @@ def _complete_session(session_id: str, session_info: dict):
             pass
 
 
+def _log_llm_usage(session_id: str):
+    try:
+        total = database.get_llm_usage(session_id)["total"]
+    except Exception:
+        return
+    print(f"🧾 LLM usage for {session_id}: {total['calls']} calls ({total['failures']} failed), "
+          f"{total['prompt_tokens']} prompt / {total['response_tokens']} response tokens, "
+          f"{total['seconds']:.1f}s")
+
+
+# Report regenerations in flight in this process: session_id -> Future.
+# The report page asks for the JSON and the PDF at once, and a refresh asks
+# again; every caller for the same session waits on the one regeneration.
+_regenerations      = {}
+_regenerations_lock = threading.Lock()
+
+
+def _regenerate_report_artifacts(session_id: str, session_info: dict):
+    """
+    Rebuilds whichever of the stored report JSON / PDF / graphs is missing
+    for a completed session. All need the analytics and graphs, so one pass
+    fills them all; what is already stored (narrative, analytics) is reused.
+    """
+    from report_generator import build_graphs, build_pdf   # matplotlib + reportlab: only load when reporting
+    report              = database.get_stored_report(session_id)
+    pdf_path, analytics = database.get_pdf_report(session_id)
+    has_graphs          = database.has_report_graphs(session_id)
+    if report and pdf_path and has_graphs:
+        return      # another request finished it while we were deciding
+
+    missing = [part for part, ok in (("JSON", report), ("PDF", pdf_path), ("graphs", has_graphs)) if not ok]
+    print(f"⚠️  Report {', '.join(missing)} missing for completed session {session_id}. Regenerating…")
+    language        = session_info.get('language', 'en')
+    resume_text     = session_info.get('resume_text') or None
+    job_description = session_info.get('job_description') or None
+    _, responses    = database.get_full_session_data(session_id)
+    interview_log   = _build_interview_log(responses)
+
+    if report:
+        detailed_report = report.get('report', {})
+        analytics       = analytics or report.get('analytics')
+    else:
+        detailed_report = llm_svc.generate_final_report(
+            interview_log,
+            language=language,
+            resume_text=resume_text,
+            job_description=job_description,
+            session_id=session_id
+        )
+    if not analytics:
+        analytics = llm_svc.generate_report_analytics(
+            interview_log,
+            target_role=session_info.get('target_role', 'Professional'),
+            resume_text=resume_text,
+            job_description=job_description,
+            language=language,
+            session_id=session_id
+        )
+    graphs = build_graphs(interview_log, analytics)
+
+    if not pdf_path:
+        pdf_bytes = build_pdf(
+            session_info=_pdf_session_meta(session_id, session_info, interview_log),
+            analytics=analytics,
+            report=detailed_report,
+            responses=interview_log,
+            graphs=graphs
+        )
+        database.save_pdf_report(session_id, pdf_bytes, analytics)
+    database.save_report_graphs(session_id, graphs)
+    if not report:
+        report = _report_payload(session_id, session_info, interview_log, detailed_report)
+        report["analytics"] = analytics
+        database.save_report(session_id, report)
+
+
+def _ensure_report_artifacts(session_id: str, session_info: dict):
+    """
+    Single-flight wrapper around _regenerate_report_artifacts(): the first
+    caller for a session runs it, concurrent callers wait for that run and
+    get its outcome (including its exception). Callers re-read storage after.
+    """
+    with _regenerations_lock:
+        future = _regenerations.get(session_id)
+        leader = future is None
+        if leader:
+            future = _regenerations[session_id] = Future()
+    metrics.inc("prepspark_report_regenerations_total", {"role": "leader" if leader else "waiter"})
+    if not leader:
+        return future.result()
+
+    try:
+        future.set_result(_regenerate_report_artifacts(session_id, session_info))
+    except BaseException as e:     # waiters must never be left blocked
+        future.set_exception(e)
+    finally:
+        with _regenerations_lock:
+            _regenerations.pop(session_id, None)
+    return future.result()
+
+
+# ─────────────────────────────────────────────
+# REQUEST TIMING + METRICS
+# ─────────────────────────────────────────────
+
+@app.before_request
+def _begin_request_trace():
+    request.trace_token = metrics.begin(request.endpoint or "unmatched")
+
+
+@app.after_request
+def _remember_status(response):
+    request.trace_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def _end_request_trace(_exc):
+    token = getattr(request, "trace_token", None)
+    if token is not None:
+        metrics.end(token, getattr(request, "trace_status", 500))
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint (stage and request latency histograms, counters)."""
+    if config.METRICS_TOKEN:
+        token = request.headers.get("Authorization", "").replace("Bearer ", "").strip()
+        if token != config.METRICS_TOKEN:
+            return jsonify({"error": "Unauthorized."}), 401
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+# ─────────────────────────────────────────────
+# READINESS
+# ─────────────────────────────────────────────
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """
+    Load-balancer readiness probe: 200 once this process is warm, 503 until
+    then. The first probe starts the warm-up if boot did not already.
+    """
+    start_warm_up()
+    with _readiness_lock:
+        body = dict(_readiness, ready=_readiness["state"] == "ready")
+    return jsonify(body), 200 if body["ready"] else 503
+
+
 # ─────────────────────────────────────────────
 # AUTH
 # ─────────────────────────────────────────────
@@ -311,91 +541,99 @@ def extract_resume():
 # ─────────────────────────────────────────────
 # START NEW INTERVIEW
 # ─────────────────────────────────────────────
+# The request parsing, session bookkeeping and response shapes below are
+# shared with the async endpoints in asgi.py; only the waiting differs.
 
-@app.route('/start_interview', methods=['POST'])
-@require_auth
-def start_interview():
-    data            = request.get_json() or {}
-    name            = data.get('name', 'Candidate').strip() or 'Candidate'
-    role            = data.get('role', 'Software Developer').strip() or 'Software Developer'
-    language        = _validate_language(data.get('language', 'en'))
+def _parse_interview_setup(data: dict) -> dict:
     resume_text     = (data.get('resume_text') or '').strip() or None
     job_description = (data.get('job_description') or '').strip() or None
+    return {
+        "name":            data.get('name', 'Candidate').strip() or 'Candidate',
+        "role":            data.get('role', 'Software Developer').strip() or 'Software Developer',
+        "language":        _validate_language(data.get('language', 'en')),
+        # Truncate to keep DB and prompts lean
+        "resume_text":     resume_text[:5000] if resume_text else None,
+        "job_description": job_description[:3000] if job_description else None,
+    }
 
-    # Truncate to keep DB and prompts lean
-    if resume_text:
-        resume_text = resume_text[:5000]
-    if job_description:
-        job_description = job_description[:3000]
 
+def _create_interview(setup: dict, user_id) -> str:
     session_id = str(uuid.uuid4())[:8]
     database.create_session(
-        session_id, name, role,
-        user_id=request.user_id,
-        language=language,
-        resume_text=resume_text,
-        job_description=job_description
+        session_id, setup["name"], setup["role"],
+        user_id=user_id,
+        language=setup["language"],
+        resume_text=setup["resume_text"],
+        job_description=setup["job_description"]
     )
+    print(f"🌐 Starting interview | lang={setup['language']} | role={setup['role']} "
+          f"| resume={'yes' if setup['resume_text'] else 'no'} "
+          f"| jd={'yes' if setup['job_description'] else 'no'}")
+    return session_id
 
-    print(f"🌐 Starting interview | lang={language} | role={role} "
-          f"| resume={'yes' if resume_text else 'no'} "
-          f"| jd={'yes' if job_description else 'no'}")
 
-    first_question = llm_svc.generate_opening_question(
-        name, role,
-        resume_text=resume_text,
-        job_description=job_description,
-        language=language
-    )
+def _opening_question_args(setup: dict) -> dict:
+    return {
+        "candidate_name":  setup["name"],
+        "target_role":     setup["role"],
+        "resume_text":     setup["resume_text"],
+        "job_description": setup["job_description"],
+        "language":        setup["language"],
+    }
 
-    audio_b64 = speak(first_question, language=language)
 
-    return jsonify({
+def _start_payload(session_id: str, setup: dict, first_question: str, audio_b64) -> dict:
+    return {
         "session_id":       session_id,
         "question":         first_question,
         "question_index":   1,
         "question_type":    "intro",
         "min_questions":    MIN_QUESTIONS,
         "max_questions":    MAX_QUESTIONS,
-        "language":         language,
-        "has_resume":       bool(resume_text),
-        "has_jd":           bool(job_description),
+        "language":         setup["language"],
+        "has_resume":       bool(setup["resume_text"]),
+        "has_jd":           bool(setup["job_description"]),
         "audio_b64":        audio_b64
-    })
+    }
+
+
+@app.route('/start_interview', methods=['POST'])
+@require_auth
+def start_interview():
+    setup      = _parse_interview_setup(request.get_json() or {})
+    session_id = _create_interview(setup, request.user_id)
+
+    first_question = llm_svc.generate_opening_question(session_id=session_id,
+                                                       **_opening_question_args(setup))
+    audio_b64      = speak(first_question, language=setup["language"])
+
+    return jsonify(_start_payload(session_id, setup, first_question, audio_b64))
 
 
 # ─────────────────────────────────────────────
 # RESUME INTERVIEW (continue interrupted session)
 # ─────────────────────────────────────────────
 
-@app.route('/resume_interview', methods=['GET'])
-@require_auth
-def resume_interview():
-    session_id = request.args.get('session_id', '').strip()
-    if not session_id:
-        return jsonify({"error": "session_id is required."}), 400
-
-    session_info, responses = database.get_full_session_data(session_id)
+def _session_access_error(session_info, user_id, allow_completed: bool = False):
+    """(payload, status) if `user_id` may not continue this session, else None."""
     if not session_info:
-        return jsonify({"error": "Session not found."}), 404
-    if session_info.get('user_id') != request.user_id:
-        return jsonify({"error": "Access denied."}), 403
-    if session_info.get('status') == 'COMPLETED':
-        return jsonify({"error": "This session is already completed."}), 400
+        return {"error": "Session not found."}, 404
+    if session_info.get('user_id') != user_id:
+        return {"error": "Access denied."}, 403
+    if not allow_completed and session_info.get('status') == 'COMPLETED':
+        return {"error": "This session is already completed."}, 400
+    return None
 
-    language        = session_info.get('language', 'en')
-    resume_text     = session_info.get('resume_text') or None
-    job_description = session_info.get('job_description') or None
 
-    answered_indices = {r['question_index'] for r in responses}
+def _plan_resumed_question(session_info: dict, chat_history: list) -> tuple:
+    """(next_index, next_q_type) for a session being picked up again."""
+    answered_indices = {item['q_index'] for item in chat_history}
     next_index = 1
     for i in range(1, MAX_QUESTIONS + 1):
         if i not in answered_indices:
             next_index = i
             break
 
-    chat_history = database.get_chat_history(session_id)
-
     # Determine next question type from chat history coverage
     types_covered = [item.get('q_type', '') for item in chat_history]
     if not types_covered:
@@ -404,49 +642,57 @@ def resume_interview():
         next_q_type = 'intro'
     elif 'behavioural' not in types_covered and len(types_covered) >= 3:
         next_q_type = 'behavioural'
-    elif resume_text and 'resume_probe' not in types_covered and len(types_covered) >= 2:
+    elif session_info.get('resume_text') and 'resume_probe' not in types_covered and len(types_covered) >= 2:
         next_q_type = 'resume_probe'
     else:
         next_q_type = 'technical'
+    return next_index, next_q_type
+
+
+def _resume_question_args(session_info: dict, next_index: int, next_q_type: str,
+                          chat_history: list) -> dict:
+    return {
+        "session_id":      session_info['session_id'],
+        "target_role":     session_info['target_role'],
+        "q_index":         next_index,
+        "q_type":          next_q_type,
+        "chat_history":    chat_history,
+        "language":        session_info.get('language', 'en'),
+        "resume_text":     session_info.get('resume_text') or None,
+        "job_description": session_info.get('job_description') or None,
+    }
+
+
+def _read_resume_question(llm_result: dict, session_info: dict, next_q_type: str) -> tuple:
+    next_question = llm_result.get(
+        'question',
+        f"Let's continue. Can you tell me about your experience with {session_info['target_role']} projects?"
+    )
+    return next_question, llm_result.get('q_type', next_q_type)
 
-    print(f"🔄 Resuming session {session_id} at Q{next_index} [{next_q_type}] | lang={language}…")
-    try:
-        llm_result = llm_svc.generate_resume_question(
-            target_role=session_info['target_role'],
-            q_index=next_index,
-            q_type=next_q_type,
-            chat_history=chat_history,
-            language=language,
-            resume_text=resume_text,
-            job_description=job_description
-        )
-        next_question = llm_result.get(
-            'question',
-            f"Let's continue. Can you tell me about your experience with {session_info['target_role']} projects?"
-        )
-        next_q_type = llm_result.get('q_type', next_q_type)
-    except Exception as e:
-        print(f"⚠️  LLM resume question failed: {e}")
-        next_question = f"Welcome back! Continuing from question {next_index}. Can you tell me about a challenging project you've worked on?"
 
-    audio_b64 = speak(next_question, language=language)
+def _fallback_resume_question(next_index: int) -> str:
+    return f"Welcome back! Continuing from question {next_index}. Can you tell me about a challenging project you've worked on?"
+
 
+def _resume_payload(session_id: str, session_info: dict, chat_history: list, next_index: int,
+                    next_question: str, next_q_type: str, audio_b64) -> dict:
     completed = []
-    for r in responses:
+    for item in chat_history:
         completed.append({
-            "question_index": r["question_index"],
-            "question_text":  r["question_text"],
-            "question_type":  r.get("question_type", "technical"),
-            "transcript":     r.get("transcript", ""),
+            "question_index": item["q_index"],
+            "question_text":  item["q_text"],
+            "question_type":  item.get("q_type") or "technical",
+            "transcript":     item.get("transcript") or "",
         })
 
-    return jsonify({
+    return {
         "session_id":          session_id,
         "candidate_name":      session_info["candidate_name"],
         "target_role":         session_info["target_role"],
-        "language":            language,
-        "has_resume":          bool(resume_text),
-        "has_jd":              bool(job_description),
+        "language":            session_info.get('language', 'en'),
+        "has_resume":          bool(session_info.get('resume_text')),
+        "has_jd":              bool(session_info.get('job_description')),
         "next_question_index": next_index,
         "next_question":       next_question,
         "next_question_type":  next_q_type,
@@ -454,138 +700,369 @@ def resume_interview():
         "max_questions":       MAX_QUESTIONS,
         "completed_responses": completed,
         "audio_b64":           audio_b64
-    })
+    }
+
+
+@app.route('/resume_interview', methods=['GET'])
+@require_auth
+def resume_interview():
+    session_id = request.args.get('session_id', '').strip()
+    if not session_id:
+        return jsonify({"error": "session_id is required."}), 400
+
+    session_info = database.get_session_info(session_id)
+    error = _session_access_error(session_info, request.user_id)
+    if error:
+        return jsonify(error[0]), error[1]
+
+    language     = session_info.get('language', 'en')
+    chat_history = database.get_chat_history(session_id)
+    next_index, next_q_type = _plan_resumed_question(session_info, chat_history)
+
+    print(f"🔄 Resuming session {session_id} at Q{next_index} [{next_q_type}] | lang={language}…")
+    try:
+        llm_result = llm_svc.generate_resume_question(
+            **_resume_question_args(session_info, next_index, next_q_type, chat_history)
+        )
+        next_question, next_q_type = _read_resume_question(llm_result, session_info, next_q_type)
+    except Exception as e:
+        print(f"⚠️  LLM resume question failed: {e}")
+        next_question = _fallback_resume_question(next_index)
+
+    audio_b64 = speak(next_question, language=language)
+
+    return jsonify(_resume_payload(session_id, session_info, chat_history, next_index,
+                                   next_question, next_q_type, audio_b64))
 
 
 # ─────────────────────────────────────────────
 # SUBMIT RESPONSE
 # ─────────────────────────────────────────────
 
+def _parse_submission(form) -> tuple:
+    """(fields, None) from the upload's form fields, or (None, (payload, status))."""
+    fields = {
+        "session_id":  form.get('session_id', '').strip(),
+        "q_text":      form.get('question_text', '').strip(),
+        "q_type":      form.get('question_type', 'technical').strip(),
+        "stream_mode": form.get('stream', '').strip().lower(),
+    }
+    fields["stream"] = fields["stream_mode"] in ('1', 'true', 'yes', 'inline')
+
+    try:
+        fields["q_index"] = int(form.get('question_index', 1))
+    except ValueError:
+        return None, ({"error": "Invalid question_index."}, 400)
+
+    if not fields["session_id"] or not fields["q_text"]:
+        return None, ({"error": "session_id and question_text are required."}, 400)
+    return fields, None
+
+
+def _busy_body(e: PoolSaturated) -> dict:
+    return {"error": "The server is busy analysing other answers. Please retry shortly.",
+            "retry_after": e.retry_after}
+
+
+def _new_job(fields: dict, session_info: dict) -> dict:
+    """Job for one admitted answer (the caller has already taken its analysis slot)."""
+    return {
+        "session_id":   fields["session_id"],
+        "session_info": session_info,
+        "q_index":      fields["q_index"],
+        "q_text":       fields["q_text"],
+        "q_type":       fields["q_type"],
+        "video_path":   os.path.join(UPLOAD_FOLDER, f"{fields['session_id']}_{fields['q_index']}.webm"),
+        "admitted":     True,
+    }
+
+
+def _events_url(submission_id: str) -> str:
+    return f"/submit_response/events?submission_id={submission_id}"
+
+
+def _read_submission() -> tuple:
+    """(fields, session_info, None) for a valid upload, else (None, None, (body, status))."""
+    if 'video' not in request.files:
+        return None, None, ({"error": "No video file provided."}, 400)
+
+    fields, error = _parse_submission(request.form)
+    if error:
+        return None, None, error
+
+    session_info = database.get_session_info(fields["session_id"])
+    error = _session_access_error(session_info, request.user_id)
+    if error:
+        return None, None, error
+    return fields, session_info, None
+
+
 @app.route('/submit_response', methods=['POST'])
 @require_auth
 def submit_response():
-    if 'video' not in request.files:
-        return jsonify({"error": "No video file provided."}), 400
+    """
+    Accepts one recorded answer.
+    With form field stream=1 the upload is acknowledged immediately (202) and
+    processing continues in the background; progress is then read from
+    /submit_response/events. stream=inline sends that same event stream as
+    this response's body, which works however many worker processes serve
+    the app. Without either the request blocks until done.
+    """
+    # Admit before touching request.files / request.form: parsing them reads
+    # and spools the whole video, which a saturated server should refuse unread
+    try:
+        analysis_pool.admit()
+    except PoolSaturated as e:
+        response = jsonify(_busy_body(e))
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response, 429
 
-    session_id     = request.form.get('session_id', '').strip()
-    current_q_text = request.form.get('question_text', '').strip()
-    current_q_type = request.form.get('question_type', 'technical').strip()
+    try:
+        fields, session_info, error = _read_submission()
+    except Exception:
+        analysis_pool.release()
+        raise
+    if error:
+        analysis_pool.release()
+        return jsonify(error[0]), error[1]
 
+    job = _new_job(fields, session_info)
     try:
-        current_q_index = int(request.form.get('question_index', 1))
-    except ValueError:
-        return jsonify({"error": "Invalid question_index."}), 400
+        with metrics.span("upload_save"):
+            request.files['video'].save(job["video_path"])
+
+        if not fields["stream"]:
+            payload, status = _process_submission(job)
+            return jsonify(payload), status
+
+        submission_id = progress_svc.open_channel(request.user_id)
+        progress_svc.publish(submission_id, "upload_received", {"question_index": job["q_index"]})
+        threading.Thread(
+            target=_run_streamed_submission, args=(submission_id, job), daemon=True
+        ).start()
+    except Exception:
+        _release_admission(job)
+        raise
+    if fields["stream_mode"] == 'inline':
+        return _event_stream_response(submission_id)
+    return jsonify({
+        "submission_id": submission_id,
+        "events_url":    _events_url(submission_id)
+    }), 202
 
-    if not session_id or not current_q_text:
-        return jsonify({"error": "session_id and question_text are required."}), 400
 
-    session_info, _ = database.get_full_session_data(session_id)
-    if not session_info:
-        return jsonify({"error": "Session not found."}), 404
-    if session_info.get('user_id') != request.user_id:
-        return jsonify({"error": "Access denied."}), 403
-    if session_info.get('status') == 'COMPLETED':
-        return jsonify({"error": "This session is already completed."}), 400
+@app.route('/submit_response/events', methods=['GET'])
+@require_auth
+def submit_response_events():
+    """
+    Server-Sent Events stream for one streamed submission.
+    Stages: upload_received, audio_extracted, transcript_ready, video_analyzed,
+    timeline_fused, evaluation_ready, then tts_ready (or report_generating after
+    the final answer) — then `done` carrying the same
+    payload the blocking endpoint returns, or `error`.
+    """
+    submission_id = request.args.get('submission_id', '').strip()
+    if not submission_id or not progress_svc.is_owner(submission_id, request.user_id):
+        return jsonify({"error": "Submission not found."}), 404
+    return _event_stream_response(submission_id)
+
+
+# Headers for every SSE response (Flask and ASGI)
+EVENT_STREAM_HEADERS = {
+    "Cache-Control":     "no-cache",
+    "X-Accel-Buffering": "no",    # Stop nginx buffering the stream
+}
 
-    language        = session_info.get('language', 'en')
-    resume_text     = session_info.get('resume_text') or None
-    job_description = session_info.get('job_description') or None
 
-    video_path = os.path.join(UPLOAD_FOLDER, f"{session_id}_{current_q_index}.webm")
-    request.files['video'].save(video_path)
+def _event_stream_response(submission_id: str) -> Response:
+    # Channels live in this process, so under several workers only the worker
+    # that accepted the upload can serve its stream.
+    return Response(
+        progress_svc.stream(submission_id),
+        mimetype='text/event-stream',
+        headers={**EVENT_STREAM_HEADERS, "X-Submission-Id": submission_id}
+    )
+
+
+def _run_streamed_submission(submission_id: str, job: dict):
+    def emit(stage, data=None):
+        progress_svc.publish(submission_id, stage, data)
 
     try:
-        print(f"▶️  Processing Q{current_q_index} [{current_q_type}] — session {session_id} | lang={language}")
+        with metrics.trace("submit_response.background"):
+            payload, status = _process_submission(job, emit=emit)
+    except Exception as e:
+        _release_admission(job)
+        payload, status = {"error": f"Processing failed: {str(e)}"}, 500
+    _publish_outcome(submission_id, payload, status)
 
-        with ThreadPoolExecutor(max_workers=2) as pool:
-            f_video = pool.submit(video_svc.analyze, video_path)
-            f_audio = pool.submit(audio_svc.analyze, video_path, language)
-            video_data = f_video.result()
-            audio_data = f_audio.result()
-        timeline = timeline_svc.fuse(audio_data, video_data)
 
-        transcript     = audio_data.get('transcript', '')
-        global_metrics = audio_data.get('global_metrics', {
+def _publish_outcome(submission_id: str, payload: dict, status: int):
+    if status >= 400:
+        progress_svc.publish(submission_id, "error", {**payload, "status_code": status})
+    else:
+        progress_svc.publish(submission_id, "done", payload)
+
+
+def _release_admission(job: dict):
+    """Gives the job's analysis slot back exactly once."""
+    if job.pop("admitted", False):
+        analysis_pool.release()
+
+
+def _video_done_emitter(emit):
+    return lambda f: emit("video_analyzed", {}) if not f.exception() else None
+
+
+def _fuse_answer(audio_data: dict, video_data: dict) -> dict:
+    """Timeline fusion plus the per-answer numbers the evaluation needs."""
+    with metrics.span("timeline_fuse"):
+        timeline = timeline_svc.fuse(audio_data, video_data)
+    video_summary = video_data.get('summary', {})
+    video_summary['timeline_snippet'] = timeline[:5]
+    return {
+        "timeline":       timeline,
+        "transcript":     audio_data.get('transcript', ''),
+        "global_metrics": audio_data.get('global_metrics', {
             'wpm': 0, 'avg_pitch_hz': 0, 'pitch_variance': 0,
             'jitter_percent': 0, 'duration_seconds': 0
-        })
-        video_summary = video_data.get('summary', {})
-        video_summary['timeline_snippet'] = timeline[:5]
+        }),
+        "video_summary":  video_summary,
+    }
+
+
+def _evaluation_args(job: dict, answer: dict, chat_history: list) -> dict:
+    session_info = job["session_info"]
+    return {
+        "transcript":       answer["transcript"],
+        "timeline":         answer["timeline"],
+        "audio_summary":    answer["global_metrics"],
+        "video_summary":    answer["video_summary"],
+        "session_id":       job["session_id"],
+        "current_question": job["q_text"],
+        "current_q_type":   job["q_type"],
+        "chat_history":     chat_history,
+        "target_role":      session_info['target_role'],
+        "current_q_index":  job["q_index"],
+        "language":         session_info.get('language', 'en'),
+        "resume_text":      session_info.get('resume_text') or None,
+        "job_description":  session_info.get('job_description') or None,
+    }
+
+
+def _record_answer(job: dict, answer: dict, llm_result: dict) -> dict:
+    """Stores the evaluated answer and returns what happens next."""
+    outcome = {
+        "feedback":      llm_result.get('feedback', 'No feedback generated.'),
+        "score":         llm_result.get('score', 0),
+        "next_question": llm_result.get('next_question', ''),
+        "next_q_type":   llm_result.get('next_q_type', 'technical'),
+        # Force completion at max questions
+        "complete":      llm_result.get('interview_complete', False) or job["q_index"] >= MAX_QUESTIONS,
+    }
+    database.save_response(
+        session_id=job["session_id"],
+        q_index=job["q_index"],
+        question=job["q_text"],
+        question_type=job["q_type"],
+        transcript=answer["transcript"],
+        audio_metrics=answer["global_metrics"],
+        video_metrics=answer["video_summary"],
+        timeline=answer["timeline"],
+        ai_feedback=outcome["feedback"],
+        ai_score=outcome["score"]
+    )
+    return outcome
 
-        chat_history = database.get_chat_history(session_id) if current_q_index > 1 else []
 
-        print("🧠 AI evaluation…")
-        llm_result = llm_svc.analyze_response(
-            transcript=transcript,
-            timeline=timeline,
-            audio_summary=global_metrics,
-            video_summary=video_summary,
-            current_question=current_q_text,
-            current_q_type=current_q_type,
-            chat_history=chat_history,
-            target_role=session_info['target_role'],
-            current_q_index=current_q_index,
-            language=language,
-            resume_text=resume_text,
-            job_description=job_description
-        )
+def _evaluation_event(job: dict, outcome: dict) -> dict:
+    return {
+        "status":             "completed" if outcome["complete"] else "next_question",
+        "next_question":      outcome["next_question"],
+        "next_index":         job["q_index"] + 1,
+        "next_type":          outcome["next_q_type"],
+        "feedback_preview":   outcome["feedback"],
+    }
 
-        ai_feedback        = llm_result.get('feedback', 'No feedback generated.')
-        ai_score           = llm_result.get('score', 0)
-        next_question      = llm_result.get('next_question', '')
-        next_q_type        = llm_result.get('next_q_type', 'technical')
-        interview_complete = llm_result.get('interview_complete', False)
 
-        # Force completion at max questions
-        if current_q_index >= MAX_QUESTIONS:
-            interview_complete = True
-
-        database.save_response(
-            session_id=session_id,
-            q_index=current_q_index,
-            question=current_q_text,
-            question_type=current_q_type,
-            transcript=transcript,
-            audio_metrics=global_metrics,
-            video_metrics=video_summary,
-            timeline=timeline,
-            ai_feedback=ai_feedback,
-            ai_score=ai_score
-        )
+def _submission_payload(job: dict, answer: dict, outcome: dict, audio_b64=None) -> dict:
+    # ── Interview complete ──
+    if outcome["complete"]:
+        return {
+            "status":            "completed",
+            "message":           "Session complete.",
+            "closing_message":   outcome["next_question"],
+            "transcript":        answer["transcript"],
+            "questions_answered": job["q_index"]
+        }
+    # ── More questions remaining ──
+    return {
+        "status":           "next_question",
+        "next_question":    outcome["next_question"],
+        "next_index":       job["q_index"] + 1,
+        "next_type":        outcome["next_q_type"],
+        "feedback_preview": outcome["feedback"],
+        "audio_b64":        audio_b64,
+        "transcript":       answer["transcript"]
+    }
+
+
+def _process_submission(job: dict, emit=None):
+    """
+    Runs the full analysis for one answer and returns (payload, http_status).
+    `emit(stage, data)` is called as each stage finishes so a streaming client
+    can show real progress and receive the transcript / next question early.
+    """
+    emit = emit or (lambda stage, data=None: None)
+
+    session_id   = job["session_id"]
+    session_info = job["session_info"]
+    video_path   = job["video_path"]
+    language     = session_info.get('language', 'en')
+
+    try:
+        print(f"▶️  Processing Q{job['q_index']} [{job['q_type']}] — session {session_id} | lang={language}")
+
+        # Video runs in the shared pool while this thread extracts + transcribes
+        # the audio; the Praat metrics then go to the pool as well. The admission
+        # slot only covers this part — LLM and TTS waits don't hold CPU capacity.
+        try:
+            f_video = analysis_pool.analyze_video(video_path)
+            f_video.add_done_callback(_video_done_emitter(emit))
+            audio_data = audio_svc.analyze(
+                video_path, language,
+                on_progress=emit,
+                metrics_runner=analysis_pool.measure_audio
+            )
+            video_data = f_video.result()
+        finally:
+            _release_admission(job)
+        answer = _fuse_answer(audio_data, video_data)
+        emit("timeline_fused", {})
+
+        chat_history = database.get_chat_history(session_id) if job["q_index"] > 1 else []
+
+        print("🧠 AI evaluation…")
+        llm_result = llm_svc.analyze_response(**_evaluation_args(job, answer, chat_history))
+        outcome    = _record_answer(job, answer, llm_result)
 
     except Exception as e:
         print(f"🔥 Processing error: {e}")
         import traceback; traceback.print_exc()
-        if os.path.exists(video_path):
-            os.remove(video_path)
-        return jsonify({"error": f"Processing failed: {str(e)}"}), 500
+        return {"error": f"Processing failed: {str(e)}"}, 500
     finally:
         if os.path.exists(video_path):
             os.remove(video_path)
 
-    # ── Interview complete ──
-    if interview_complete:
-        _complete_session(session_id, session_info)
-        return jsonify({
-            "status":            "completed",
-            "message":           "Session complete.",
-            "closing_message":   next_question,
-            "transcript":        transcript,
-            "questions_answered": current_q_index
-        })
+    emit("evaluation_ready", _evaluation_event(job, outcome))
 
-    # ── More questions remaining ──
-    next_index = current_q_index + 1
-    audio_b64  = speak(next_question, language=language)
-    return jsonify({
-        "status":           "next_question",
-        "next_question":    next_question,
-        "next_index":       next_index,
-        "next_type":        next_q_type,
-        "feedback_preview": ai_feedback,
-        "audio_b64":        audio_b64,
-        "transcript":       transcript
-    })
+    if outcome["complete"]:
+        _complete_session(session_id, session_info, emit)
+        return _submission_payload(job, answer, outcome), 200
+
+    audio_b64 = speak(outcome["next_question"], language=language)
+    emit("tts_ready", {"audio_b64": audio_b64})
+    return _submission_payload(job, answer, outcome, audio_b64), 200
 
 
 # ─────────────────────────────────────────────
@@ -599,7 +1076,7 @@ def get_report():
     if not session_id:
         return jsonify({"error": "session_id is required."}), 400
 
-    session_info, responses = database.get_full_session_data(session_id)
+    session_info = database.get_session_info(session_id)
     if not session_info:
         return jsonify({"error": "Session not found."}), 404
     if session_info.get('user_id') != request.user_id:
@@ -612,42 +1089,58 @@ def get_report():
         }), 400
 
     report = database.get_stored_report(session_id)
-    if not report:
-        print(f"⚠️  Report missing for completed session {session_id}. Regenerating…")
-        language        = session_info.get('language', 'en')
-        resume_text     = session_info.get('resume_text') or None
-        job_description = session_info.get('job_description') or None
-        interview_log   = _build_interview_log(responses)
-        detailed_report = llm_svc.generate_final_report(
-            interview_log,
-            language=language,
-            resume_text=resume_text,
-            job_description=job_description
-        )
-        analytics = llm_svc.generate_report_analytics(
-            interview_log, target_role=session_info["target_role"],
-            resume_text=resume_text, job_description=job_description
-        )
-        graphs = build_graphs(interview_log, analytics)
-        report = {
-            "candidate":       session_info["candidate_name"],
-            "role":            session_info["target_role"],
-            "session_id":      session_id,
-            "start_time":      session_info.get("start_time", ""),
-            "language":        language,
-            "has_resume":      bool(resume_text),
-            "has_jd":          bool(job_description),
-            "total_questions": len(interview_log),
-            "responses":       interview_log,
-            "report":          detailed_report,
-            "analytics":       analytics,
-            "graphs_b64":      {k: base64.b64encode(v).decode() for k, v in graphs.items()},
-        }
-        database.save_report(session_id, report)
+    if not report or not database.has_report_graphs(session_id):
+        try:
+            _ensure_report_artifacts(session_id, session_info)
+        except Exception as e:
+            print(f"🔥 Report regeneration failed: {e}")
+            import traceback; traceback.print_exc()
+            return jsonify({"error": f"Report generation failed: {str(e)}"}), 500
+        report = database.get_stored_report(session_id)
 
+    # References only: the page loads each image from /report_graph
+    report["graphs"] = database.get_report_graphs(session_id)
     return jsonify(report)
 
 
+@app.route('/report_graph', methods=['GET'])
+@require_auth
+def report_graph():
+    """
+    One report chart as PNG. `v` (the version from the report's "graphs"
+    map) makes the URL content-specific, so the browser may cache it for good.
+    """
+    from flask import send_file
+    session_id = request.args.get('session_id', '').strip()
+    name       = request.args.get('name', '').strip()
+    if not session_id or not name:
+        return jsonify({"error": "session_id and name are required."}), 400
+
+    session_info = database.get_session_info(session_id)
+    error = _session_access_error(session_info, request.user_id, allow_completed=True)
+    if error:
+        return jsonify(error[0]), error[1]
+
+    path = database.get_report_graph(session_id, name)
+    if not path and session_info.get('status') == 'COMPLETED' and not database.has_report_graphs(session_id):
+        try:
+            _ensure_report_artifacts(session_id, session_info)
+        except Exception as e:
+            print(f"🔥 Graph regeneration failed: {e}")
+        path = database.get_report_graph(session_id, name)
+    if not path:
+        return jsonify({"error": "Graph not found."}), 404
+
+    digest   = os.path.basename(path)
+    response = send_file(path, mimetype='image/png', etag=digest)   # no-cache: revalidate by ETag
+    response.cache_control.private = True
+    if request.args.get('v') == digest:
+        response.cache_control.no_cache  = None
+        response.cache_control.max_age   = 365 * 24 * 3600
+        response.cache_control.immutable = True
+    return response
+
+
 # ─────────────────────────────────────────────
 # DOWNLOAD PDF REPORT
 # ─────────────────────────────────────────────
@@ -665,7 +1158,7 @@ def download_report():
     if not session_id:
         return jsonify({"error": "session_id is required."}), 400
 
-    session_info, responses = database.get_full_session_data(session_id)
+    session_info = database.get_session_info(session_id)
     if not session_info:
         return jsonify({"error": "Session not found."}), 404
     if session_info.get('user_id') != request.user_id:
@@ -673,67 +1166,102 @@ def download_report():
     if session_info.get('status') != 'COMPLETED':
         return jsonify({"error": "Session is not yet completed."}), 400
 
-    pdf_bytes, analytics = database.get_pdf_report(session_id)
+    pdf_path, _ = database.get_pdf_report(session_id)
 
     # Regenerate if not cached
-    if not pdf_bytes:
-        print(f"⚠️  PDF missing for {session_id}. Regenerating…")
+    if not pdf_path:
         try:
-            language        = session_info.get('language', 'en')
-            resume_text     = session_info.get('resume_text') or None
-            job_description = session_info.get('job_description') or None
-            target_role     = session_info.get('target_role', 'Professional')
-            interview_log   = _build_interview_log(responses)
-
-            stored_report   = database.get_stored_report(session_id)
-            detailed_report = stored_report.get('report', {}) if stored_report else {}
-
-            analytics = llm_svc.generate_report_analytics(
-                interview_log, target_role=target_role,
-                resume_text=resume_text, job_description=job_description
-            )
-            graphs     = build_graphs(interview_log, analytics)
-            session_meta = {
-                "candidate_name": session_info["candidate_name"],
-                "target_role":    target_role,
-                "session_id":     session_id,
-                "start_time":     session_info.get("start_time", ""),
-                "language":       language,
-                "total_questions": len(interview_log),
-            }
-            pdf_bytes = build_pdf(
-                session_info=session_meta,
-                analytics=analytics,
-                report=detailed_report,
-                responses=interview_log,
-                graphs=graphs
-            )
-            database.save_pdf_report(session_id, pdf_bytes, analytics)
+            _ensure_report_artifacts(session_id, session_info)
         except Exception as e:
             print(f"🔥 PDF regeneration failed: {e}")
             import traceback; traceback.print_exc()
             return jsonify({"error": f"PDF generation failed: {str(e)}"}), 500
+        pdf_path, _ = database.get_pdf_report(session_id)
 
     candidate_name = session_info.get('candidate_name', 'candidate').replace(' ', '_')
     filename       = f"PrepSpark_Report_{candidate_name}_{session_id}.pdf"
 
+    # Served from the blob store file: the WSGI server can sendfile() it, and
+    # the file name is the content hash, which makes a strong ETag
     return send_file(
-        io.BytesIO(pdf_bytes),
+        pdf_path,
         mimetype='application/pdf',
         as_attachment=True,
-        download_name=filename
+        download_name=filename,
+        etag=os.path.basename(pdf_path)
     )
 
 
+# ─────────────────────────────────────────────
+# LLM USAGE
+# ─────────────────────────────────────────────
+
+@app.route('/llm_usage', methods=['GET'])
+@require_auth
+def llm_usage():
+    """Per-method Gemini call counts, prompt/response sizes and time for one session."""
+    session_id = request.args.get('session_id', '').strip()
+    if not session_id:
+        return jsonify({"error": "session_id is required."}), 400
+
+    session_info = database.get_session_info(session_id)
+    error = _session_access_error(session_info, request.user_id, allow_completed=True)
+    if error:
+        return jsonify(error[0]), error[1]
+    return jsonify({"session_id": session_id, **database.get_llm_usage(session_id)})
+
+
 # ─────────────────────────────────────────────
 # DASHBOARD
 # ─────────────────────────────────────────────
 
+def _encode_cursor(position: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """(start_time, session_id) from a next_cursor value; ValueError if it isn't one."""
+    try:
+        start_time, session_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception:
+        raise ValueError(cursor)
+    if not isinstance(start_time, str) or not isinstance(session_id, str):
+        raise ValueError(cursor)
+    return start_time, session_id
+
+
 @app.route('/my_interviews', methods=['GET'])
 @require_auth
 def my_interviews():
-    interviews = database.get_user_interviews(request.user_id)
-    return jsonify({"interviews": interviews})
+    """
+    The user's interviews, newest first, one page at a time. Pass the
+    response's next_cursor as ?cursor= for the following page (null: last page).
+    """
+    try:
+        limit = int(request.args.get('limit', config.DASHBOARD_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "limit must be a whole number."}), 400
+    limit = max(1, min(limit, config.DASHBOARD_MAX_PAGE_SIZE))
+
+    cursor = request.args.get('cursor', '').strip()
+    try:
+        after = _decode_cursor(cursor) if cursor else None
+    except ValueError:
+        return jsonify({"error": "Invalid cursor."}), 400
+
+    interviews, next_position = database.get_user_interviews(request.user_id, limit, after)
+    return jsonify({
+        "interviews":  interviews,
+        "next_cursor": _encode_cursor(next_position) if next_position else None,
+    })
+
+
+# Under a pre-fork server each worker warms itself (and starts housekeeping)
+# after the fork instead
+if config.EAGER_INIT and not config.PREFORK:
+    start_warm_up()
+if not config.PREFORK:
+    housekeeping.start()
 
 
 if __name__ == '__main__':
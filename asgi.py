@@ -0,0 +1,346 @@
+"""
+asgi.py
+───────
+Async entry point:
+
+    pip install starlette a2wsgi python-multipart uvicorn
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+
+/start_interview, /resume_interview and /submit_response spend most of their
+wall time waiting on Gemini, Groq Whisper and TTS. Here they are async
+handlers built on the async clients (LLMService.*_async,
+AudioService.analyze_async, TTSService.synthesize_async), so one worker can
+keep hundreds of interviews in flight while they wait on the network.
+
+CPU-bound work still leaves the event loop: video and Praat analysis go to
+the AnalysisPool processes, while ffmpeg, SQLite and report generation run in
+threads. Every other route is the unchanged Flask app served through a2wsgi.
+Request parsing, session checks and response shapes are the helpers app.py
+uses, so both modes answer identically.
+"""
+
+import asyncio
+import base64
+import os
+import shutil
+from contextlib import asynccontextmanager
+from functools import wraps
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.datastructures import UploadFile
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+import database
+import metrics
+from app import app as flask_app
+from app import (
+    analysis_pool, audio_svc, llm_svc, progress_svc, tts_svc, PoolSaturated,
+    EVENT_STREAM_HEADERS, _busy_body, _complete_session, _create_interview,
+    _evaluation_args, _evaluation_event, _events_url, _fallback_resume_question,
+    _fuse_answer, _new_job, _opening_question_args, _parse_interview_setup,
+    _parse_submission, _plan_resumed_question, _publish_outcome, _read_resume_question,
+    _record_answer, _release_admission, _resume_payload, _resume_question_args,
+    _session_access_error, _start_payload, _submission_payload, _video_done_emitter,
+)
+
+# Streamed submissions run as tasks; keep a reference so they aren't collected mid-flight
+_background_tasks = set()
+
+
+# ─────────────────────────────────────────────
+# HELPERS
+# ─────────────────────────────────────────────
+
+def require_auth(handler):
+    @wraps(handler)
+    async def decorated(request):
+        token = request.headers.get("Authorization", "").replace("Bearer ", "").strip()
+        user_id = await asyncio.to_thread(database.validate_token, token)
+        if not user_id:
+            return JSONResponse({"error": "Unauthorized. Please log in."}, status_code=401)
+        request.state.user_id = user_id
+        return await handler(request)
+    return decorated
+
+
+async def _ready(service):
+    """
+    The instance behind a LazyService. The first use imports the module and
+    builds the client (or loads models), so that runs in a thread.
+    """
+    if not service.loaded:
+        await asyncio.to_thread(service.get)
+    return service.get()
+
+
+async def speak(text: str, language: str = 'en') -> str | None:
+    """TTS → base64 MP3 through the async client. Returns None if unavailable."""
+    try:
+        audio_bytes = await (await _ready(tts_svc)).synthesize_async(text, voice="onyx", language=language)
+        if audio_bytes:
+            return base64.b64encode(audio_bytes).decode("utf-8")
+    except Exception as e:
+        print(f"⚠️  TTS failed (non-fatal): {e}")
+    return None
+
+
+def _error(error: tuple) -> JSONResponse:
+    return JSONResponse(error[0], status_code=error[1])
+
+
+def _event_stream_response(submission_id: str) -> StreamingResponse:
+    return StreamingResponse(
+        progress_svc.stream_async(submission_id),
+        media_type='text/event-stream',
+        headers={**EVENT_STREAM_HEADERS, "X-Submission-Id": submission_id}
+    )
+
+
+def _save_upload(upload: UploadFile, path: str):
+    with open(path, "wb") as out:
+        shutil.copyfileobj(upload.file, out)
+
+
+# ─────────────────────────────────────────────
+# START / RESUME INTERVIEW
+# ─────────────────────────────────────────────
+
+@require_auth
+async def start_interview(request):
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    setup      = _parse_interview_setup(data or {})
+    session_id = await asyncio.to_thread(_create_interview, setup, request.state.user_id)
+
+    llm            = await _ready(llm_svc)
+    first_question = await llm.generate_opening_question_async(session_id=session_id,
+                                                               **_opening_question_args(setup))
+    audio_b64      = await speak(first_question, language=setup["language"])
+
+    return JSONResponse(_start_payload(session_id, setup, first_question, audio_b64))
+
+
+@require_auth
+async def resume_interview(request):
+    session_id = request.query_params.get('session_id', '').strip()
+    if not session_id:
+        return JSONResponse({"error": "session_id is required."}, status_code=400)
+
+    session_info = await asyncio.to_thread(database.get_session_info, session_id)
+    error = _session_access_error(session_info, request.state.user_id)
+    if error:
+        return _error(error)
+
+    language     = session_info.get('language', 'en')
+    chat_history = await asyncio.to_thread(database.get_chat_history, session_id)
+    next_index, next_q_type = _plan_resumed_question(session_info, chat_history)
+
+    print(f"🔄 Resuming session {session_id} at Q{next_index} [{next_q_type}] | lang={language}…")
+    try:
+        llm_result = await (await _ready(llm_svc)).generate_resume_question_async(
+            **_resume_question_args(session_info, next_index, next_q_type, chat_history)
+        )
+        next_question, next_q_type = _read_resume_question(llm_result, session_info, next_q_type)
+    except Exception as e:
+        print(f"⚠️  LLM resume question failed: {e}")
+        next_question = _fallback_resume_question(next_index)
+
+    audio_b64 = await speak(next_question, language=language)
+
+    return JSONResponse(_resume_payload(session_id, session_info, chat_history, next_index,
+                                        next_question, next_q_type, audio_b64))
+
+
+# ─────────────────────────────────────────────
+# SUBMIT RESPONSE
+# ─────────────────────────────────────────────
+
+@require_auth
+async def submit_response(request):
+    """Same contract as the Flask endpoint, including stream=1 / stream=inline."""
+    # Admit before reading the form: that receives and spools the whole video
+    try:
+        analysis_pool.admit()
+    except PoolSaturated as e:
+        return JSONResponse(_busy_body(e), status_code=429,
+                            headers={"Retry-After": str(e.retry_after)})
+
+    job = None
+    try:
+        async with request.form() as form:
+            video = form.get('video')
+            if not isinstance(video, UploadFile):
+                analysis_pool.release()
+                return JSONResponse({"error": "No video file provided."}, status_code=400)
+
+            fields, error = _parse_submission(form)
+            if not error:
+                session_info = await asyncio.to_thread(database.get_session_info, fields["session_id"])
+                error = _session_access_error(session_info, request.state.user_id)
+            if error:
+                analysis_pool.release()
+                return _error(error)
+
+            job = _new_job(fields, session_info)
+            with metrics.span("upload_save"):
+                await asyncio.to_thread(_save_upload, video, job["video_path"])
+    except Exception:
+        # Before _new_job the slot is ours to give back; after, the job owns it
+        if job:
+            _release_admission(job)
+        else:
+            analysis_pool.release()
+        raise
+
+    if not fields["stream"]:
+        payload, status = await _process_submission(job)
+        return JSONResponse(payload, status_code=status)
+
+    submission_id = progress_svc.open_channel(request.state.user_id)
+    progress_svc.publish(submission_id, "upload_received", {"question_index": job["q_index"]})
+    task = asyncio.create_task(_run_streamed_submission(submission_id, job))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+    if fields["stream_mode"] == 'inline':
+        return _event_stream_response(submission_id)
+    return JSONResponse({
+        "submission_id": submission_id,
+        "events_url":    _events_url(submission_id)
+    }, status_code=202)
+
+
+@require_auth
+async def submit_response_events(request):
+    submission_id = request.query_params.get('submission_id', '').strip()
+    if not submission_id or not progress_svc.is_owner(submission_id, request.state.user_id):
+        return JSONResponse({"error": "Submission not found."}, status_code=404)
+    return _event_stream_response(submission_id)
+
+
+async def _run_streamed_submission(submission_id: str, job: dict):
+    def emit(stage, data=None):
+        progress_svc.publish(submission_id, stage, data)
+
+    try:
+        with metrics.trace("submit_response.background"):
+            payload, status = await _process_submission(job, emit=emit)
+    except Exception as e:
+        _release_admission(job)
+        payload, status = {"error": f"Processing failed: {str(e)}"}, 500
+    _publish_outcome(submission_id, payload, status)
+
+
+async def _process_submission(job: dict, emit=None):
+    """app._process_submission with the network waits awaited instead of blocking."""
+    emit = emit or (lambda stage, data=None: None)
+
+    session_id   = job["session_id"]
+    session_info = job["session_info"]
+    video_path   = job["video_path"]
+    language     = session_info.get('language', 'en')
+
+    try:
+        print(f"▶️  Processing Q{job['q_index']} [{job['q_type']}] — session {session_id} | lang={language}")
+
+        try:
+            # The first submission starts the forkserver and the pool
+            f_video = await asyncio.to_thread(analysis_pool.analyze_video, video_path)
+            f_video.add_done_callback(_video_done_emitter(emit))
+            audio_data = await (await _ready(audio_svc)).analyze_async(
+                video_path, language,
+                on_progress=emit,
+                metrics_runner=analysis_pool.measure_audio_async
+            )
+            video_data = await asyncio.wrap_future(f_video)
+        finally:
+            _release_admission(job)
+        answer = await asyncio.to_thread(_fuse_answer, audio_data, video_data)
+        emit("timeline_fused", {})
+
+        chat_history = (await asyncio.to_thread(database.get_chat_history, session_id)
+                        if job["q_index"] > 1 else [])
+
+        print("🧠 AI evaluation…")
+        llm        = await _ready(llm_svc)
+        llm_result = await llm.analyze_response_async(**_evaluation_args(job, answer, chat_history))
+        outcome    = await asyncio.to_thread(_record_answer, job, answer, llm_result)
+
+    except Exception as e:
+        print(f"🔥 Processing error: {e}")
+        import traceback; traceback.print_exc()
+        return {"error": f"Processing failed: {str(e)}"}, 500
+    finally:
+        if os.path.exists(video_path):
+            os.remove(video_path)
+
+    emit("evaluation_ready", _evaluation_event(job, outcome))
+
+    if outcome["complete"]:
+        # Report graphs and PDF are CPU work; keep them off the event loop
+        await asyncio.to_thread(_complete_session, session_id, session_info, emit)
+        return _submission_payload(job, answer, outcome), 200
+
+    audio_b64 = await speak(outcome["next_question"], language=language)
+    emit("tts_ready", {"audio_b64": audio_b64})
+    return _submission_payload(job, answer, outcome, audio_b64), 200
+
+
+# ─────────────────────────────────────────────
+# APPLICATION
+# ─────────────────────────────────────────────
+
+@asynccontextmanager
+async def _lifespan(_):
+    yield
+    analysis_pool.shutdown()
+
+
+ASYNC_ROUTES = [
+    Route('/start_interview',         start_interview,        methods=['POST']),
+    Route('/resume_interview',        resume_interview,       methods=['GET']),
+    Route('/submit_response',         submit_response,        methods=['POST']),
+    Route('/submit_response/events',  submit_response_events, methods=['GET']),
+]
+ASYNC_PATHS = {route.path for route in ASYNC_ROUTES}
+
+async_app = Starlette(
+    routes=ASYNC_ROUTES,
+    # Same policy as flask_cors.CORS(app, supports_credentials=True)
+    middleware=[Middleware(CORSMiddleware, allow_origin_regex=".*", allow_credentials=True,
+                           allow_methods=["*"], allow_headers=["*"],
+                           expose_headers=["Retry-After", "X-Submission-Id"])],
+    lifespan=_lifespan,
+)
+wsgi_app = WSGIMiddleware(flask_app)
+
+
+async def application(scope, receive, send):
+    """Async routes (and lifespan) go to Starlette, everything else to Flask."""
+    if scope["type"] != "http":
+        await async_app(scope, receive, send)
+    elif scope["path"] in ASYNC_PATHS:
+        await _traced(scope, receive, send)
+    else:
+        await wsgi_app(scope, receive, send)   # Flask traces its own requests
+
+
+async def _traced(scope, receive, send):
+    status = {}
+
+    async def send_and_record(message):
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+        await send(message)
+
+    token = metrics.begin(scope["path"].lstrip("/"))
+    try:
+        await async_app(scope, receive, send_and_record)
+    finally:
+        metrics.end(token, status.get("code", 500))
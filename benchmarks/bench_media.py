@@ -0,0 +1,103 @@
+"""
+bench_media.py
+──────────────
+Cost of the per-answer analysis on fixed synthetic inputs:
+
+  • video    — VideoService.analyze_frames per resolution, reported per
+               analysed frame (decoding excluded: frames are in memory)
+  • audio    — AudioService.measure_samples (Praat pitch, jitter, frame log)
+               per clip length
+  • timeline — TimelineService.fuse at growing word / frame counts
+
+A section whose dependencies are missing is reported with its error.
+
+Run from the repo root:
+    python -m benchmarks.bench_media [--repeat 3] [--only video,audio,timeline] [--out path.json]
+"""
+
+import argparse
+import contextlib
+import io
+
+from benchmarks import fixtures
+from benchmarks.common import quiet, time_call, save_results, print_table
+
+RESOLUTIONS   = [(320, 240), (640, 480), (1280, 720), (1920, 1080)]
+VIDEO_FRAMES  = 30          # analysed frames per run (= 2 s of 30 fps video at stride 2)
+AUDIO_SECONDS = [15, 60, 180]
+FUSE_WORDS    = [150, 600, 2400]
+
+
+def bench_video(repeat: int) -> list:
+    from services.video_service import VideoService
+    with contextlib.redirect_stdout(io.StringIO()):
+        svc = VideoService()
+        svc.warm_up()
+
+    rows = []
+    for width, height in RESOLUTIONS:
+        frames = fixtures.face_frames(width, height, VIDEO_FRAMES)
+        stats  = time_call(quiet(lambda: svc.analyze_frames(fixtures.FrameList(frames))), repeat=repeat)
+        per_frame = {k.replace("_ms", "_ms_per_frame"): round(v / VIDEO_FRAMES, 3)
+                     for k, v in stats.items() if k.endswith("_ms")}
+        rows.append({"name": f"{width}x{height}", "frames": VIDEO_FRAMES, **per_frame})
+        print(f"  video {width}x{height}: {per_frame['median_ms_per_frame']} ms/frame")
+    return rows
+
+
+def bench_audio(repeat: int) -> list:
+    from services.audio_service import AudioService
+    rows = []
+    for seconds in AUDIO_SECONDS:
+        samples = fixtures.voiced_samples(seconds)
+        text    = fixtures.transcript(int(seconds * 2.5))
+        stats   = time_call(quiet(lambda: AudioService.measure_samples(samples, 16000, text)), repeat=repeat)
+        rows.append({"name": f"{seconds}s", **stats})
+        print(f"  audio {seconds}s: {stats['median_ms']} ms")
+    return rows
+
+
+def bench_timeline(repeat: int) -> list:
+    from services.timeline_service import TimelineService
+    with contextlib.redirect_stdout(io.StringIO()):
+        svc = TimelineService()
+
+    rows = []
+    for words in FUSE_WORDS:
+        audio, video = fixtures.fusion_inputs(words)
+        stats = time_call(quiet(lambda: svc.fuse(audio, video)), repeat=repeat)
+        rows.append({"name": f"{words} words", "video_frames": len(video["frame_log"]),
+                     "audio_frames": len(audio["frame_log"]), **stats})
+        print(f"  timeline {words} words: {stats['median_ms']} ms")
+    return rows
+
+
+SECTIONS = {"video": bench_video, "audio": bench_audio, "timeline": bench_timeline}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Video, audio and timeline analysis cost.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default=",".join(SECTIONS), help="comma-separated sections")
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only.split(","):
+        print(f"⏱  {name}…")
+        try:
+            results[name] = SECTIONS[name](args.repeat)
+        except Exception as e:
+            results[name] = [{"name": name, "error": f"{type(e).__name__}: {e}"[:120]}]
+            print(f"  {name}: {results[name][0]['error']}")
+
+    for name, rows in results.items():
+        print(f"\n{name.upper()}")
+        columns = list(dict.fromkeys(c for row in rows for c in row if c != "n"))
+        print_table(rows, columns)
+
+    save_results("media", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+bench_report.py
+───────────────
+Cost of the end-of-interview and upload-time document work on fixed
+synthetic inputs:
+
+  • graphs — report_generator.build_graphs (all six charts) per interview length
+  • pdf    — report_generator.build_pdf with those graphs embedded
+  • resume — resume_extractor.extract_text per file format
+
+Run from the repo root:
+    python -m benchmarks.bench_report [--repeat 3] [--only graphs,pdf,resume] [--out path.json]
+"""
+
+import argparse
+import contextlib
+import io
+
+from benchmarks import fixtures
+from benchmarks.common import quiet, time_call, save_results, print_table
+
+QUESTIONS = [5, 15]     # MIN_QUESTIONS and MAX_QUESTIONS
+
+
+def bench_graphs(repeat: int) -> list:
+    from report_generator import build_graphs
+    rows = []
+    for n in QUESTIONS:
+        log, analytics = fixtures.interview_log(n), fixtures.analytics(n)
+        stats = time_call(quiet(lambda: build_graphs(log, analytics)), repeat=repeat)
+        rows.append({"name": f"{n} questions", **stats})
+        print(f"  graphs {n}q: {stats['median_ms']} ms")
+    return rows
+
+
+def bench_pdf(repeat: int) -> list:
+    from report_generator import build_graphs, build_pdf
+    rows = []
+    for n in QUESTIONS:
+        log, analytics = fixtures.interview_log(n), fixtures.analytics(n)
+        with contextlib.redirect_stdout(io.StringIO()):
+            graphs = build_graphs(log, analytics)
+        pdf_size = {}
+
+        def run():
+            pdf = build_pdf(session_info=fixtures.session_meta(n), analytics=analytics,
+                            report=fixtures.final_report(), responses=log, graphs=graphs)
+            pdf_size["kb"] = len(pdf) // 1024
+
+        stats = time_call(quiet(run), repeat=repeat)
+        rows.append({"name": f"{n} questions", "pdf_kb": pdf_size["kb"], **stats})
+        print(f"  pdf {n}q: {stats['median_ms']} ms ({pdf_size['kb']} KB)")
+    return rows
+
+
+def bench_resume(repeat: int) -> list:
+    from resume_extractor import extract_text
+    rows = []
+    for ext, data in sorted(fixtures.resume_files().items()):
+        _, error = extract_text(data, f"resume{ext}")
+        if error:
+            rows.append({"name": ext, "error": error.splitlines()[0][:120]})
+        else:
+            stats = time_call(lambda: extract_text(data, f"resume{ext}"), repeat=repeat)
+            rows.append({"name": ext, "kb": max(1, len(data) // 1024), **stats})
+        print(f"  resume {ext}: {rows[-1].get('median_ms', rows[-1].get('error'))}")
+    return rows
+
+
+SECTIONS = {"graphs": bench_graphs, "pdf": bench_pdf, "resume": bench_resume}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report graphs, PDF and resume extraction cost.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default=",".join(SECTIONS), help="comma-separated sections")
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only.split(","):
+        print(f"⏱  {name}…")
+        try:
+            results[name] = SECTIONS[name](args.repeat)
+        except Exception as e:
+            results[name] = [{"name": name, "error": f"{type(e).__name__}: {e}"[:120]}]
+            print(f"  {name}: {results[name][0]['error']}")
+
+    for name, rows in results.items():
+        print(f"\n{name.upper()}")
+        columns = list(dict.fromkeys(c for row in rows for c in row if c != "n"))
+        print_table(rows, columns)
+
+    save_results("report", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
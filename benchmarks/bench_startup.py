@@ -0,0 +1,105 @@
+"""
+bench_startup.py
+────────────────
+What booting the app costs, broken down per module:
+
+  • import — seconds to import each module in a fresh interpreter. This is
+    cumulative: it includes everything that module pulls in itself.
+  • init   — seconds to construct each service once its module is imported.
+
+Each measurement runs in its own subprocess so nothing is already cached.
+Modules or services that fail (missing dependency, missing API key) are
+reported with their error instead of a time.
+
+Run from the repo root:
+    python -m benchmarks.bench_startup [--repeat 3] [--out path.json]
+"""
+
+import argparse
+import subprocess
+import sys
+
+from benchmarks.common import REPO_ROOT, summarize, save_results, print_table
+
+MODULES = [
+    "config",
+    "database",
+    "resume_extractor",
+    "report_generator",
+    "services.timeline_service",
+    "services.tts_service",
+    "services.llm_service",
+    "services.audio_service",
+    "services.video_service",
+    "services.analysis_pool",
+    "app",
+]
+
+SERVICES = [
+    ("services.timeline_service", "TimelineService"),
+    ("services.tts_service",      "TTSService"),
+    ("services.llm_service",      "LLMService"),
+    ("services.audio_service",    "AudioService"),
+    ("services.video_service",    "VideoService"),
+]
+
+_IMPORT_SNIPPET = """
+import time
+t = time.perf_counter()
+import {module}
+print("__ELAPSED__", time.perf_counter() - t)
+"""
+
+_INIT_SNIPPET = """
+import time
+from {module} import {cls}
+t = time.perf_counter()
+{cls}()
+print("__ELAPSED__", time.perf_counter() - t)
+"""
+
+
+def _measure(snippet: str) -> float:
+    proc = subprocess.run([sys.executable, "-c", snippet], cwd=REPO_ROOT,
+                          capture_output=True, text=True, timeout=300)
+    for line in proc.stdout.splitlines():
+        if line.startswith("__ELAPSED__"):
+            return float(line.split()[1])
+    err = (proc.stderr.strip().splitlines() or ["no output"])[-1]
+    raise RuntimeError(err)
+
+
+def _run(snippets: dict, repeat: int) -> list:
+    rows = []
+    for label, snippet in snippets.items():
+        try:
+            stats = summarize([_measure(snippet) for _ in range(repeat)])
+            rows.append({"name": label, **stats})
+        except Exception as e:
+            rows.append({"name": label, "error": str(e)[:120]})
+        print(f"  {label}: {rows[-1].get('median_ms', rows[-1].get('error'))}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-module import and init cost.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    print("⏱  Import cost (fresh interpreter per run)…")
+    imports = _run({m: _IMPORT_SNIPPET.format(module=m) for m in MODULES}, args.repeat)
+
+    print("⏱  Service constructor cost…")
+    inits = _run({f"{m}.{c}": _INIT_SNIPPET.format(module=m, cls=c) for m, c in SERVICES}, args.repeat)
+
+    print("\nIMPORT")
+    print_table(imports, ["name", "median_ms", "min_ms", "error"])
+    print("\nINIT")
+    print_table(inits, ["name", "median_ms", "min_ms", "error"])
+
+    save_results("startup", {"imports": imports, "init": inits}, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Shared helpers for the benchmark scripts: timing summaries and JSON results.
+
+Every script writes one JSON file under bench_results/ (or --out) so runs from
+different versions can be diffed side by side.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+REPO_ROOT   = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "bench_results")
+
+
+def summarize(samples: list) -> dict:
+    """Seconds in → milliseconds out (min / median / mean / p95)."""
+    ms = sorted(s * 1000 for s in samples)
+    if not ms:
+        return {"n": 0}
+    return {
+        "n":         len(ms),
+        "min_ms":    round(ms[0], 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "mean_ms":   round(statistics.fmean(ms), 3),
+        "p95_ms":    round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+    }
+
+
+def time_call(fn, repeat: int = 5, warmup: int = 1) -> dict:
+    """Calls fn() `warmup` + `repeat` times and summarizes the timed runs."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t)
+    return summarize(samples)
+
+
+def quiet(fn):
+    """Wraps fn so its prints (the services log every step) don't flood the benchmark output."""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return run
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def save_results(name: str, results: dict, out: str = None) -> str:
+    path = out or os.path.join(RESULTS_DIR, f"{name}.json")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    payload = {
+        "benchmark":  name,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit":     _git_commit(),
+        "python":     sys.version.split()[0],
+        "platform":   platform.platform(),
+        "cpu_count":  os.cpu_count(),
+        "results":    results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+    print(f"💾 Results saved: {path}")
+    return path
+
+
+def print_table(rows: list, columns: list):
+    """rows: list of dicts; columns: keys to show, in order."""
+    widths = {c: max(len(c), *(len(str(r.get(c, ""))) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("─" * widths[c] for c in columns))
+    for r in rows:
+        print("  ".join(str(r.get(c, "")).ljust(widths[c]) for c in columns))
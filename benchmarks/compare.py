@@ -0,0 +1,67 @@
+"""
+compare.py
+──────────
+Diffs two result files from the same benchmark (e.g. before / after a
+change, or two releases) row by row on their median.
+
+Run from the repo root:
+    python -m benchmarks.compare bench_results/media.base.json bench_results/media.json [--threshold 10]
+
+Rows that got slower by more than --threshold percent are marked ▲, faster ones ▼.
+Exits 1 if anything regressed, so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.common import print_table
+
+MEDIAN_KEYS = ("median_ms", "median_ms_per_frame")
+
+
+def _rows(results) -> dict:
+    """Flattens {section: [rows]} (or a bare [rows]) into {"section/name": median}."""
+    sections = results.items() if isinstance(results, dict) else [("", results)]
+    flat = {}
+    for section, rows in sections:
+        if not isinstance(rows, list):
+            continue
+        for row in rows:
+            key = next((k for k in MEDIAN_KEYS if k in row), None)
+            if key is not None:
+                flat[f"{section}/{row.get('name', '?')}".strip("/")] = row[key]
+    return flat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change to flag")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        base = json.load(f)
+    with open(args.current) as f:
+        curr = json.load(f)
+
+    before, after = _rows(base["results"]), _rows(curr["results"])
+    rows, regressed = [], False
+    for name in sorted(before.keys() | after.keys()):
+        old, new = before.get(name), after.get(name)
+        row = {"name": name, "base_ms": old if old is not None else "—", "current_ms": new if new is not None else "—"}
+        if old and new is not None:
+            change = (new - old) / old * 100
+            mark = "▲" if change > args.threshold else "▼" if change < -args.threshold else ""
+            regressed |= mark == "▲"
+            row["change"] = f"{change:+.1f}% {mark}".strip()
+        rows.append(row)
+
+    print(f"{base['benchmark']}: {base.get('commit')} → {curr.get('commit')}\n")
+    print_table(rows, ["name", "base_ms", "current_ms", "change"])
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Fixed synthetic inputs for the benchmarks. Everything is generated from a
+seed, so two runs (or two versions of the code) measure the same work.
+"""
+
+import io
+
+import numpy as np
+
+EMOTIONS = ["Neutral", "Happy", "Surprise", "Sad", "Fear"]
+GAZES    = ["Screen", "Screen", "Screen", "Left", "Down"]
+
+SENTENCE = ("I started by profiling the service and found that most of the latency came from "
+            "serialising large payloads so we switched to a streaming encoder and cached the "
+            "results which cut the p95 in half").split()
+
+
+# ─────────────────────────────────────────────
+# VIDEO
+# ─────────────────────────────────────────────
+
+class FrameList:
+    """
+    In-memory frame source for VideoService.analyze_frames(): yields every
+    2nd index like CaptureFrames, so decoding is not part of the measurement.
+    """
+
+    def __init__(self, frames: list, fps: float = 30.0, stride: int = 2):
+        self.frames      = frames
+        self.fps         = fps
+        self.stride      = stride
+        self.frame_count = 0
+
+    def __iter__(self):
+        for i, frame in enumerate(self.frames):
+            self.frame_count = (i + 1) * self.stride
+            yield i * self.stride, frame
+
+
+def face_frames(width: int, height: int, count: int, seed: int = 0) -> list:
+    """
+    BGR frames with a face-like shape (skin ellipse, eyes, mouth) drifting
+    slightly from frame to frame over a noisy background.
+    """
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:height, 0:width]
+    frames = []
+    for i in range(count):
+        img = rng.integers(40, 70, size=(height, width, 3), dtype=np.uint8)
+        cx = width / 2 + np.sin(i / 7) * width * 0.02
+        cy = height / 2 + np.cos(i / 9) * height * 0.02
+        rx, ry = width * 0.16, height * 0.3
+        face = ((xx - cx) / rx) ** 2 + ((yy - cy) / ry) ** 2 <= 1
+        img[face] = (150, 180, 225)
+        for ex in (cx - rx * 0.4, cx + rx * 0.4):
+            eye = ((xx - ex) / (rx * 0.15)) ** 2 + ((yy - (cy - ry * 0.2)) / (ry * 0.06)) ** 2 <= 1
+            img[eye] = (40, 30, 30)
+        mouth = ((xx - cx) / (rx * 0.35)) ** 2 + ((yy - (cy + ry * 0.45)) / (ry * 0.05)) ** 2 <= 1
+        img[mouth] = (80, 60, 150)
+        frames.append(img)
+    return frames
+
+
+# ─────────────────────────────────────────────
+# AUDIO
+# ─────────────────────────────────────────────
+
+def voiced_samples(seconds: float, sample_rate: int = 16000, seed: int = 0) -> np.ndarray:
+    """
+    int16 speech-like signal: a 110–170 Hz glottal tone with harmonics,
+    syllable-rate amplitude modulation and a short pause every ~4 s.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.3 * t) + rng.normal(0, 1.5, t.size).cumsum() / sample_rate
+    phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+    signal = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2
+    envelope[(t % 4.0) > 3.5] = 0.0
+    signal = signal * envelope + rng.normal(0, 0.01, t.size)
+    return (signal / np.abs(signal).max() * 0.5 * 32767).astype(np.int16)
+
+
+def transcript(words: int) -> str:
+    return " ".join(SENTENCE[i % len(SENTENCE)] for i in range(words))
+
+
+# ─────────────────────────────────────────────
+# TIMELINE
+# ─────────────────────────────────────────────
+
+def fusion_inputs(words: int, video_fps: float = 15.0, seed: int = 0) -> tuple:
+    """
+    (audio_result, video_result) for TimelineService.fuse(): `words` Groq
+    word timestamps at ~150 WPM with occasional long pauses, a video frame log
+    at `video_fps` (CaptureFrames keeps every 2nd frame of 30 fps) and a
+    100 ms audio frame log over the same duration.
+    """
+    rng = np.random.default_rng(seed)
+    anchors, t = [], 0.0
+    for i in range(words):
+        length = 0.25 + rng.random() * 0.2
+        anchors.append({"word": SENTENCE[i % len(SENTENCE)], "start": round(t, 2), "end": round(t + length, 2)})
+        t += length + (2.0 if rng.random() < 0.02 else 0.1)
+    duration = t
+
+    video_log = [{
+        "timestamp": round(i / video_fps, 2),
+        "pitch":     int(rng.normal(0, 12)),
+        "yaw":       int(rng.normal(0, 12)),
+        "roll":      int(rng.normal(0, 5)),
+        "gaze":      GAZES[int(rng.integers(len(GAZES)))],
+        "blink":     bool(rng.random() < 0.05),
+        "emotion":   EMOTIONS[int(rng.integers(len(EMOTIONS)))],
+    } for i in range(int(duration * video_fps))]
+
+    audio_log = [{
+        "timestamp": round(i * 0.1, 2),
+        "pitch":     float(rng.uniform(0, 180)),
+        "volume":    float(rng.uniform(40, 70)),
+    } for i in range(int(duration * 10))]
+
+    return ({"groq_json": {"words": anchors}, "frame_log": audio_log},
+            {"frame_log": video_log})
+
+
+# ─────────────────────────────────────────────
+# REPORT
+# ─────────────────────────────────────────────
+
+def interview_log(questions: int, seed: int = 0) -> list:
+    """The shape app._build_interview_log() hands to build_graphs / build_pdf."""
+    rng = np.random.default_rng(seed)
+    types = ["intro", "technical", "behavioural", "resume_probe", "technical"]
+    return [{
+        "question_index": i + 1,
+        "question_type":  types[i % len(types)],
+        "question":       f"Question {i + 1}: how would you scale a service that handles {1000 * (i + 1)} requests per second?",
+        "transcript":     transcript(120),
+        "ai_score":       int(rng.integers(3, 10)),
+        "ai_feedback":    "Good structure; quantify the impact and discuss the trade-offs you rejected.",
+        "audio_metrics":  {"wpm": int(rng.integers(110, 170)), "avg_pitch_hz": 140.0,
+                           "pitch_variance": 18.5, "jitter_percent": 1.2, "duration_seconds": 60.0},
+        "video_metrics":  {"eye_contact_percent": int(rng.integers(40, 95)),
+                           "dominant_emotion": EMOTIONS[int(rng.integers(len(EMOTIONS)))],
+                           "blink_rate": 14.0},
+    } for i in range(questions)]
+
+
+def analytics(questions: int) -> dict:
+    return {
+        "skills_from_resume": ["Python", "PostgreSQL", "Kafka", "Docker"],
+        "skills_from_jd":     ["Python", "System Design", "Kubernetes"],
+        "skills_matched":     ["Python"],
+        "skills_missing":     ["Kubernetes"],
+        "projects_detected":  ["Payments platform", "Search indexer"],
+        "experience_summary": "Backend engineer with five years of service ownership.",
+        "skill_match": [{"skill": s, "candidate_score": 5 + i % 4, "jd_requirement": 7 + i % 3}
+                        for i, s in enumerate(["Python", "System Design", "Communication",
+                                               "Problem Solving", "Databases", "Cloud"])],
+        "jd_match": {"required_skills_pct": 70, "preferred_skills_pct": 55,
+                     "experience_pct": 65, "overall_fit_pct": 63},
+        "answer_quality": [{"q_index": i + 1, "clarity": 7, "technical_depth": 5 + i % 4,
+                            "relevance": 8, "confidence": 6} for i in range(questions)],
+    }
+
+
+def final_report() -> dict:
+    return {
+        "executive_summary":     "Clear and structured answers with solid technical grounding. " * 3,
+        "recommendation":        "Getting There — Keep Practising",
+        "technical_depth":       "Covered caching, queues and idempotency; trade-offs could go deeper. " * 4,
+        "communication_style":   "Steady pace and clear delivery with few filler words. " * 3,
+        "behavioural_signals":   "Composed, with consistent eye contact through most answers. " * 3,
+        "strengths":             ["Structured thinking", "Ownership", "Clear delivery"],
+        "areas_for_improvement": ["Quantify impact", "Discuss trade-offs", "Shorter introductions"],
+        "coaching_tips":         "Lead with the result, then the approach; prepare two metrics per project. " * 2,
+    }
+
+
+def session_meta(questions: int) -> dict:
+    return {
+        "candidate_name":  "Bench Candidate",
+        "target_role":     "Backend Engineer",
+        "session_id":      "bench001",
+        "start_time":      "2025-01-01T10:00:00",
+        "language":        "en",
+        "total_questions": questions,
+    }
+
+
+# ─────────────────────────────────────────────
+# RESUMES
+# ─────────────────────────────────────────────
+
+def resume_lines(count: int = 60) -> list:
+    return [f"{i + 1}. Led the migration of service {i} to Python 3 and cut p95 latency by {10 + i % 40}%."
+            for i in range(count)]
+
+
+def resume_files() -> dict:
+    """{extension: bytes} for every format whose writer is installed (.doc needs LibreOffice: skipped)."""
+    lines = resume_lines()
+    files = {
+        ".txt": "\n".join(lines).encode(),
+        ".rtf": ("{\\rtf1\\ansi\\deff0 {\\fonttbl {\\f0 Helvetica;}}\\f0\\fs22 "
+                 + "\\par ".join(lines) + "}").encode("latin-1"),
+    }
+
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.pdfgen import canvas
+        buf = io.BytesIO()
+        pdf = canvas.Canvas(buf, pagesize=A4)
+        for page in range(2):
+            y = 800
+            for line in lines[page * 30:(page + 1) * 30]:
+                pdf.drawString(40, y, line)
+                y -= 24
+            pdf.showPage()
+        pdf.save()
+        files[".pdf"] = buf.getvalue()
+    except ImportError:
+        pass
+
+    try:
+        import docx
+        document = docx.Document()
+        for line in lines:
+            document.add_paragraph(line)
+        buf = io.BytesIO()
+        document.save(buf)
+        files[".docx"] = buf.getvalue()
+    except ImportError:
+        pass
+
+    return files
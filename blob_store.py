@@ -0,0 +1,74 @@
+"""
+blob_store.py
+─────────────
+Content-addressed file store for generated binaries (report PDFs).
+
+Each blob is written once under its SHA-256, <BLOB_STORE_DIR>/ab/abcdef…,
+and never modified afterwards. SQLite keeps only the hash, identical content
+is stored once, and a blob can be served straight from disk (sendfile) with
+its hash as the ETag.
+
+A blob may be put() by one writer while another has just dropped its last
+reference, so unreferenced blobs are not deleted on the spot: put() refreshes
+the file's mtime, and housekeeping only deletes a blob that has also been idle
+for BLOB_GC_GRACE_SECONDS (see database.purge_orphan_blobs).
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+import config
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+
+def path_for(digest: str) -> str:
+    if not _DIGEST.match(digest or ""):
+        raise ValueError(f"Not a SHA-256 hex digest: {digest!r}")
+    return os.path.join(os.path.abspath(config.BLOB_STORE_DIR), digest[:2], digest)
+
+
+def put(data: bytes) -> str:
+    """Stores `data` (if not already present) and returns its digest."""
+    digest = hashlib.sha256(data).hexdigest()
+    path   = path_for(digest)
+    try:
+        os.utime(path)      # already stored: mark it in use so the GC leaves it alone
+        return digest
+    except FileNotFoundError:
+        pass
+
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    # Write to a temp file and rename, so readers never see a partial blob
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return digest
+
+
+def exists(digest: str) -> bool:
+    return os.path.exists(path_for(digest))
+
+
+def delete(digest: str, idle_seconds: float = 0) -> bool:
+    """Removes a blob unless it was put() within the last `idle_seconds`. True if removed."""
+    path = path_for(digest)
+    try:
+        if idle_seconds and time.time() - os.stat(path).st_mtime < idle_seconds:
+            return False
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
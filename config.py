@@ -1,3 +1,5 @@
+import os
+
 # --- THRESHOLDS (The Science Numbers) ---
 # Acoustic
 NERVOUS_WPM_THRESHOLD = 160      # > 160 WPM = Rushing/Anxious
@@ -9,4 +11,73 @@ Jitter_THRESHOLD = 0.05         # > 1.5% Jitter = Voice Tremors (Nervousness)
 MIN_EYE_CONTACT_PERCENT = 60     # < 60% = Low Confidence
 
 # Content
-MIN_RELEVANCE_SCORE = 70         # < 70% = Off-topic / Vague
\ No newline at end of file
+MIN_RELEVANCE_SCORE = 70         # < 70% = Off-topic / Vague
+
+# --- INTERVIEW LENGTH ---
+MIN_QUESTIONS = 5   # LLM cannot end the session before this many answers
+MAX_QUESTIONS = 15  # Session is force-ended at this count regardless
+
+# --- STARTUP ---
+# Start warming every service and analysis worker in the background at import instead
+# of on the first /ready probe or request; /ready answers 503 until it has finished
+EAGER_INIT = os.getenv("PREPSPARK_EAGER_INIT", "0") == "1"
+# Set by gunicorn.conf.py: the app is imported in a master process that forks workers
+PREFORK = os.getenv("PREPSPARK_PREFORK", "0") == "1"
+
+# --- METRICS ---
+# When set, /metrics requires "Authorization: Bearer <token>"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# --- STORAGE ---
+# Content-addressed directory for generated report PDFs (see blob_store.py)
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "blob_store")
+# Housekeeping deletes a blob once nothing references it and it has not been
+# written for this long (a concurrent writer may be about to reference it)
+BLOB_GC_GRACE_SECONDS = int(os.getenv("BLOB_GC_GRACE_SECONDS", 3600))
+
+# --- AUTH ---
+# Validated tokens are cached in-process this long (0 disables the cache). A logout
+# takes effect at once in its own process and within this many seconds in others.
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", 30))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", 10000))
+
+# --- DASHBOARD ---
+# Interviews per /my_interviews page when the client doesn't ask, and the most it may ask for
+DASHBOARD_PAGE_SIZE = int(os.getenv("DASHBOARD_PAGE_SIZE", 24))
+DASHBOARD_MAX_PAGE_SIZE = int(os.getenv("DASHBOARD_MAX_PAGE_SIZE", 100))
+
+# --- SESSION STATE CACHE ---
+# Interviews rows and chat histories kept per process (0 disables). Entries are
+# checked against interviews.state_version on every read, so this is a size bound only.
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", 2000))
+
+# --- HOUSEKEEPING ---
+# Seconds between purge passes in each app process (0 disables)
+HOUSEKEEPING_INTERVAL_SECONDS = int(os.getenv("HOUSEKEEPING_INTERVAL_SECONDS", 600))
+# Rows deleted per transaction, so a pass never holds the write lock for long
+HOUSEKEEPING_BATCH_SIZE = int(os.getenv("HOUSEKEEPING_BATCH_SIZE", 500))
+# IN_PROGRESS interviews started longer ago than this are treated as abandoned
+ABANDONED_INTERVIEW_DAYS = int(os.getenv("ABANDONED_INTERVIEW_DAYS", 30))
+
+# --- ANALYSIS CAPACITY (per app process) ---
+# Cores for the CPU-bound video / Praat analysis. With the frame ring every
+# running answer keeps two processes busy (decoder + FaceMesh worker), so the
+# pool then runs half this many workers
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+# Answers allowed to wait for a worker before new uploads get 429
+ANALYSIS_QUEUE_SIZE = int(os.getenv("ANALYSIS_QUEUE_SIZE", ANALYSIS_WORKERS * 2))
+ANALYSIS_RETRY_AFTER_SECONDS = int(os.getenv("ANALYSIS_RETRY_AFTER_SECONDS", 15))
+# Build MediaPipe / ONNX / Praat in each worker as it starts, not on its first answer
+ANALYSIS_PRELOAD_MODELS = os.getenv("ANALYSIS_PRELOAD_MODELS", "1") == "1"
+# How analysis workers (and frame decoders) are started. "forkserver" forks them
+# from a clean single-threaded server process that has imported OpenCV /
+# MediaPipe / Praat and read the model weights once (services/analysis_preload.py),
+# so they share those pages copy-on-write and none inherits locks held by the
+# web server's threads. "fork" would copy those locks. Windows only has "spawn".
+ANALYSIS_START_METHOD = os.getenv("ANALYSIS_START_METHOD", "forkserver" if os.name == "posix" else "spawn")
+
+# --- FRAME RING (decoder process → video workers, shared memory) ---
+FRAME_RING_ENABLED = os.getenv("FRAME_RING_ENABLED", "1") == "1"
+FRAME_RING_SLOTS = int(os.getenv("FRAME_RING_SLOTS", 8))   # ~22 MB per answer being analysed at 720p
+FRAME_RING_MAX_WIDTH = 1280      # Larger frames are downscaled to fit a slot
+FRAME_RING_MAX_HEIGHT = 720
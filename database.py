@@ -1,16 +1,246 @@
 import sqlite3
+import base64
 import json
 import hashlib
+import os
 import secrets
-from datetime import datetime
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import blob_store
+import config
+import metrics
+from metrics import timed
 
 DB_NAME = "interview_db.sqlite"
 
+BUSY_TIMEOUT_SECONDS = 5.0      # how long a writer waits for the lock before "database is locked"
+MIGRATION_BUSY_TIMEOUT_SECONDS = 3600.0     # a starting worker waits this long for another's migrations
+CACHED_STATEMENTS    = 256      # prepared statements kept per connection
+
+
+# ─────────────────────────────────────────────
+# CONNECTIONS
+# ─────────────────────────────────────────────
+# One long-lived connection per thread (sqlite3 connections are not shared
+# across threads), so opening the file, the pragmas and statement preparation
+# are paid once per thread instead of once per query. The database runs in
+# WAL mode: readers never block on the writer and vice versa.
+
+_local = threading.local()
+_inherited = []     # connections opened before a fork: never used or closed in the child
+
+
+def _connect() -> sqlite3.Connection:
+    """This thread's connection, opened on first use (and again in a forked child)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.pid == os.getpid():
+        return conn
+    if conn is not None:
+        _inherited.append(conn)
+
+    conn = sqlite3.connect(DB_NAME, timeout=BUSY_TIMEOUT_SECONDS, cached_statements=CACHED_STATEMENTS)
+    conn.row_factory = sqlite3.Row
+    # synchronous=NORMAL is durable in WAL mode except for the last commits before a power loss
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={int(BUSY_TIMEOUT_SECONDS * 1000)}")
+    _local.conn, _local.pid = conn, os.getpid()
+    return conn
+
+
+def close_connection():
+    """Closes this thread's connection, e.g. before the process forks."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.pid == os.getpid():
+        conn.close()
+    _local.conn = None
+
+
+# Secondary indexes for the hot access paths, created by the migration that
+# introduced each one (see MIGRATIONS).
+# (users.username / users.email are already covered by their UNIQUE indexes.)
+INDEXES = {
+    # every submit / resume / report: a session's answers in question order
+    "idx_responses_session_question":   "responses (session_id, question_index)",
+    # a user's interviews by date
+    "idx_interviews_user_start":        "interviews (user_id, start_time)",
+    # the dashboard: a user's interviews, newest first
+    "idx_session_summaries_user_start": "session_summaries (user_id, start_time, session_id)",
+    # is a PDF blob still referenced before it is deleted
+    "idx_pdf_files_sha256":             "pdf_files (sha256)",
+    "idx_report_graphs_sha256":         "report_graphs (sha256)",
+    # housekeeping: expired tokens, and stale interviews that never finished
+    "idx_auth_sessions_expires":        "auth_sessions (expires_at)",
+    "idx_interviews_status_start":      "interviews (status, start_time)",
+    # blob GC: candidates whose grace period is over
+    "idx_orphan_blobs_since":           "orphan_blobs (since)",
+}
+
+
+# The queries behind the hot paths, shared with check_query_plans()
+SQL_USER_BY_LOGIN = "SELECT * FROM users WHERE username = ? OR email = ?"
+SQL_SESSION_HEADER = (
+    "SELECT session_id, user_id, candidate_name, target_role, start_time, status, language, "
+    "resume_text, job_description, state_version FROM interviews WHERE session_id = ?"
+)
+SQL_CHAT_HISTORY = (
+    "SELECT question_index, question_text as q_text, question_type, transcript, ai_score FROM responses "
+    "WHERE session_id = ? ORDER BY question_index ASC"
+)
+SQL_SESSION_RESPONSES = "SELECT * FROM responses WHERE session_id = ? ORDER BY question_index ASC"
+# Keyset pagination: newest first, session_id breaks start_time ties. The
+# cursor is the last row's (start_time, session_id); the first page passes
+# a cursor that sorts after everything.
+SQL_USER_INTERVIEWS = """
+    SELECT  session_id,
+            candidate_name,
+            target_role,
+            start_time,
+            status,
+            language,
+            has_resume,
+            has_jd,
+            response_count,
+            CASE WHEN scored_count > 0 THEN ROUND(score_total / scored_count, 1) END AS avg_score
+    FROM session_summaries
+    WHERE user_id = ? AND response_count > 0 AND (start_time, session_id) < (?, ?)
+    ORDER BY start_time DESC, session_id DESC
+    LIMIT ?
+"""
+SQL_EXPIRED_TOKENS = "SELECT token FROM auth_sessions WHERE expires_at < ? LIMIT ?"
+SQL_STALE_SESSIONS = "SELECT session_id FROM interviews WHERE status = 'IN_PROGRESS' AND start_time < ? LIMIT ?"
+SQL_ORPHAN_BLOBS = "SELECT sha256 FROM orphan_blobs WHERE since < ? LIMIT ?"
+# Fills session_summaries for interviews that have no row yet (databases from before the table)
+SQL_BACKFILL_SUMMARIES = """
+    INSERT INTO session_summaries
+        (session_id, user_id, candidate_name, target_role, start_time, status, language,
+         has_resume, has_jd, response_count, score_total, scored_count)
+    SELECT  i.session_id, i.user_id, i.candidate_name, i.target_role, i.start_time, i.status, i.language,
+            CASE WHEN i.resume_text IS NOT NULL AND i.resume_text != '' THEN 1 ELSE 0 END,
+            CASE WHEN i.job_description IS NOT NULL AND i.job_description != '' THEN 1 ELSE 0 END,
+            COUNT(r.id),
+            COALESCE(SUM(r.ai_score), 0),
+            COUNT(r.ai_score)
+    FROM interviews i
+    LEFT JOIN responses r ON i.session_id = r.session_id
+    WHERE i.session_id NOT IN (SELECT session_id FROM session_summaries)
+    GROUP BY i.session_id
+"""
+
+
+# ─────────────────────────────────────────────
+# JSON COLUMN CODEC
+# ─────────────────────────────────────────────
+
+# responses.audio_metrics / video_metrics / timeline_json and reports.report_json
+# are stored as one version byte followed by the payload. Rows written before
+# the codec existed are plain TEXT and are still read as-is.
+CODEC_PLAIN = 0     # UTF-8 JSON (values too small to gain from compression)
+CODEC_ZLIB  = 1     # zlib-compressed UTF-8 JSON
+COMPRESSION_LEVEL = 6
+CODEC_COLUMNS = {
+    "responses": ("id", ("audio_metrics", "video_metrics", "timeline_json")),
+    "reports":   ("session_id", ("report_json",)),
+}
+
+
+def _pack(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    packed = zlib.compress(raw, COMPRESSION_LEVEL)
+    if len(packed) < len(raw):
+        return bytes([CODEC_ZLIB]) + packed
+    return bytes([CODEC_PLAIN]) + raw
+
+
+def _unpack(stored):
+    """Text of a stored column value, whichever way it was written (None stays None)."""
+    if stored is None or isinstance(stored, str):
+        return stored
+    version, payload = stored[0], stored[1:]
+    if version == CODEC_ZLIB:
+        return zlib.decompress(payload).decode("utf-8")
+    if version == CODEC_PLAIN:
+        return bytes(payload).decode("utf-8")
+    raise ValueError(f"Unknown column codec version {version}")
+
+
+def encode_json(value) -> bytes:
+    return _pack(json.dumps(value))
+
+
+def decode_json(stored):
+    return json.loads(_unpack(stored))
+
 
 def init_db():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
+    """
+    Brings the database file up to the current schema. A current database
+    costs one PRAGMA read: no table or column introspection.
+    """
+    # Migrations that move blobs, recompress rows or VACUUM hold the write lock
+    # far longer than a request would, so wait them out instead of failing boot
+    conn = sqlite3.connect(DB_NAME, timeout=MIGRATION_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < len(MIGRATIONS):
+            # WAL is a property of the database file: set once, every later connection uses it
+            conn.execute("PRAGMA journal_mode=WAL")
+            if _migrate(conn.cursor()):
+                conn.execute("VACUUM")   # give the space moved-out data took back to the filesystem
+            version = len(MIGRATIONS)
+        elif version > len(MIGRATIONS):
+            print(f"⚠️  {DB_NAME} is at schema v{version}, newer than this code (v{len(MIGRATIONS)})")
+    finally:
+        conn.close()
+    print(f"💽 Database ready: {DB_NAME} (schema v{version})")
 
+
+# ─────────────────────────────────────────────
+# SCHEMA MIGRATIONS
+# ─────────────────────────────────────────────
+# PRAGMA user_version is the number of MIGRATIONS applied to the file. Each
+# one runs in its own BEGIN IMMEDIATE transaction together with its version
+# bump, so workers starting at once take turns (waiting up to
+# MIGRATION_BUSY_TIMEOUT_SECONDS for the lock) and the later ones find
+# nothing left to do. Migrations are append-only: never edit or reorder one
+# that has shipped, add a new one instead. They are written to also be safe
+# on databases created before versioning (user_version 0, tables present).
+
+def _migrate(c) -> int:
+    """Applies the pending migrations; returns how many rows of data they moved out."""
+    moved = 0
+    while True:
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            version = c.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(MIGRATIONS):
+                c.execute("COMMIT")
+                return moved
+            name, migrate = MIGRATIONS[version]
+            moved += migrate(c) or 0
+            c.execute(f"PRAGMA user_version = {version + 1}")
+            c.execute("COMMIT")
+        except BaseException:
+            c.execute("ROLLBACK")
+            raise
+        print(f"  ↳ Schema v{version + 1}: {name}")
+
+
+def _create_indexes(c, *names):
+    for name in names:
+        c.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {INDEXES[name]}")
+
+
+def _add_column(c, table: str, column: str, declaration: str):
+    """ALTER TABLE … ADD COLUMN, unless a pre-versioning database already has it."""
+    if column not in [r[1] for r in c.execute(f"PRAGMA table_info({table})")]:
+        c.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+
+def _m_base_schema(c):
     c.execute('''CREATE TABLE IF NOT EXISTS users (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         username TEXT UNIQUE NOT NULL,
@@ -64,43 +294,180 @@ def init_db():
         FOREIGN KEY(session_id) REFERENCES interviews(session_id)
     )''')
 
-    c.execute('''CREATE TABLE IF NOT EXISTS pdf_reports (
+    # Columns added to the first databases by hand-rolled migrations
+    _add_column(c, "interviews", "user_id", "INTEGER")
+    _add_column(c, "interviews", "language", "TEXT DEFAULT 'en'")
+    _add_column(c, "interviews", "resume_text", "TEXT")
+    _add_column(c, "interviews", "job_description", "TEXT")
+    _add_column(c, "responses", "question_type", "TEXT DEFAULT 'technical'")
+
+
+def _m_llm_usage(c):
+    # One row per (session, Gemini method): running totals for the usage summary
+    c.execute('''CREATE TABLE IF NOT EXISTS llm_usage (
+        session_id TEXT NOT NULL,
+        method TEXT NOT NULL,
+        calls INTEGER NOT NULL DEFAULT 0,
+        failures INTEGER NOT NULL DEFAULT 0,
+        prompt_chars INTEGER NOT NULL DEFAULT 0,
+        prompt_tokens INTEGER NOT NULL DEFAULT 0,
+        response_chars INTEGER NOT NULL DEFAULT 0,
+        response_tokens INTEGER NOT NULL DEFAULT 0,
+        seconds REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (session_id, method),
+        FOREIGN KEY(session_id) REFERENCES interviews(session_id)
+    )''')
+
+
+def _m_hot_path_indexes(c):
+    _create_indexes(c, "idx_responses_session_question", "idx_interviews_user_start")
+
+
+def _m_pdf_files(c) -> int:
+    # The PDF itself lives in blob_store under its SHA-256; this row only points to it
+    c.execute('''CREATE TABLE IF NOT EXISTS pdf_files (
         session_id TEXT PRIMARY KEY,
-        pdf_data BLOB NOT NULL,
+        sha256 TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
         analytics_json TEXT NOT NULL,
         generated_at TEXT NOT NULL,
         FOREIGN KEY(session_id) REFERENCES interviews(session_id)
     )''')
+    _create_indexes(c, "idx_pdf_files_sha256")
+    return _move_pdf_blobs_to_store(c)
+
+
+def _m_report_graphs(c) -> int:
+    # Report chart PNGs, also in blob_store; the report JSON only names them
+    c.execute('''CREATE TABLE IF NOT EXISTS report_graphs (
+        session_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        sha256 TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        PRIMARY KEY (session_id, name),
+        FOREIGN KEY(session_id) REFERENCES interviews(session_id)
+    )''')
+    _create_indexes(c, "idx_report_graphs_sha256")
+    return _move_report_graphs_to_store(c)
+
+
+def _m_state_version(c):
+    _add_column(c, "interviews", "state_version", "INTEGER NOT NULL DEFAULT 0")
+
+
+def _m_session_summaries(c):
+    # One row per interview, kept current by create_session / save_response /
+    # mark_session_completed in the same transaction: the dashboard reads only this
+    c.execute('''CREATE TABLE IF NOT EXISTS session_summaries (
+        session_id TEXT PRIMARY KEY,
+        user_id INTEGER,
+        candidate_name TEXT,
+        target_role TEXT,
+        start_time TEXT,
+        status TEXT,
+        language TEXT,
+        has_resume INTEGER NOT NULL DEFAULT 0,
+        has_jd INTEGER NOT NULL DEFAULT 0,
+        response_count INTEGER NOT NULL DEFAULT 0,
+        score_total REAL NOT NULL DEFAULT 0,
+        scored_count INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY(session_id) REFERENCES interviews(session_id)
+    )''')
+    _create_indexes(c, "idx_session_summaries_user_start")
+    backfilled = c.execute(SQL_BACKFILL_SUMMARIES).rowcount
+    if backfilled > 0:
+        print(f"  ↳ Migrated: {backfilled} session summaries")
+
+
+def _move_pdf_blobs_to_store(c) -> int:
+    """Moves PDFs from the old pdf_reports BLOB table into blob_store, then drops the table."""
+    c.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'pdf_reports'")
+    if not c.fetchone():
+        return 0
+    sessions = [r[0] for r in c.execute("SELECT session_id FROM pdf_reports")]
+    for session_id in sessions:     # one BLOB in memory at a time
+        pdf_data, analytics_json, generated_at = c.execute(
+            "SELECT pdf_data, analytics_json, generated_at FROM pdf_reports WHERE session_id = ?",
+            (session_id,)
+        ).fetchone()
+        c.execute(
+            "INSERT OR IGNORE INTO pdf_files (session_id, sha256, size_bytes, analytics_json, generated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (session_id, blob_store.put(bytes(pdf_data)), len(pdf_data), analytics_json, generated_at)
+        )
+    c.execute("DROP TABLE pdf_reports")
+    print(f"  ↳ Migrated: {len(sessions)} PDF(s) from pdf_reports to {config.BLOB_STORE_DIR}/")
+    return len(sessions)
+
+
+def _move_report_graphs_to_store(c) -> int:
+    """Moves base64 graphs embedded in older report_json rows into report_graphs."""
+    sessions = [r[0] for r in c.execute(
+        "SELECT session_id FROM reports WHERE typeof(report_json) = 'text' AND instr(report_json, '\"graphs_b64\"') > 0"
+    )]
+    for session_id in sessions:
+        (report_json,) = c.execute("SELECT report_json FROM reports WHERE session_id = ?",
+                                   (session_id,)).fetchone()
+        try:
+            report = decode_json(report_json)
+        except ValueError:
+            continue
+        for name, b64 in (report.pop("graphs_b64", None) or {}).items():
+            png = base64.b64decode(b64)
+            c.execute(
+                "INSERT OR IGNORE INTO report_graphs (session_id, name, sha256, size_bytes) VALUES (?, ?, ?, ?)",
+                (session_id, name, blob_store.put(png), len(png))
+            )
+        c.execute("UPDATE reports SET report_json = ? WHERE session_id = ?", (encode_json(report), session_id))
+    if sessions:
+        print(f"  ↳ Migrated: graphs of {len(sessions)} report(s) to {config.BLOB_STORE_DIR}/")
+    return len(sessions)
+
 
-    conn.commit()
-    _run_migrations(c)
-    conn.commit()
-    conn.close()
-    print(f"💽 Database ready: {DB_NAME}")
-
-
-def _run_migrations(c):
-    """Non-destructively adds columns that may be missing in older DBs."""
-    c.execute("PRAGMA table_info(interviews)")
-    cols = [r[1] for r in c.fetchall()]
-    if "user_id" not in cols:
-        c.execute("ALTER TABLE interviews ADD COLUMN user_id INTEGER")
-        print("  ↳ Migrated: interviews.user_id")
-    if "language" not in cols:
-        c.execute("ALTER TABLE interviews ADD COLUMN language TEXT DEFAULT 'en'")
-        print("  ↳ Migrated: interviews.language")
-    if "resume_text" not in cols:
-        c.execute("ALTER TABLE interviews ADD COLUMN resume_text TEXT")
-        print("  ↳ Migrated: interviews.resume_text")
-    if "job_description" not in cols:
-        c.execute("ALTER TABLE interviews ADD COLUMN job_description TEXT")
-        print("  ↳ Migrated: interviews.job_description")
-
-    c.execute("PRAGMA table_info(responses)")
-    cols = [r[1] for r in c.fetchall()]
-    if "question_type" not in cols:
-        c.execute("ALTER TABLE responses ADD COLUMN question_type TEXT DEFAULT 'technical'")
-        print("  ↳ Migrated: responses.question_type")
+def _m_housekeeping_indexes(c):
+    _create_indexes(c, "idx_auth_sessions_expires", "idx_interviews_status_start")
+
+
+def _m_orphan_blobs(c):
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS orphan_blobs (
+            sha256 TEXT PRIMARY KEY,
+            since  TEXT NOT NULL
+        )
+    ''')
+    _create_indexes(c, "idx_orphan_blobs_since")
+
+
+def _pack_json_columns(c) -> int:
+    """Rewrites JSON columns still stored as plain TEXT through the codec, one row at a time."""
+    rewritten = 0
+    for table, (key, columns) in CODEC_COLUMNS.items():
+        pending = " OR ".join(f"typeof({col}) = 'text'" for col in columns)
+        keys = [r[0] for r in c.execute(f"SELECT {key} FROM {table} WHERE {pending}")]
+        for row_key in keys:
+            row = c.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE {key} = ?", (row_key,)).fetchone()
+            values = [_pack(v) if isinstance(v, str) else v for v in row]
+            c.execute(f"UPDATE {table} SET {', '.join(f'{col} = ?' for col in columns)} WHERE {key} = ?",
+                      (*values, row_key))
+        if keys:
+            print(f"  ↳ Migrated: {len(keys)} {table} row(s) to compressed JSON")
+        rewritten += len(keys)
+    return rewritten
+
+
+# Append only — the position of an entry is its schema version
+MIGRATIONS = [
+    ("base schema",                 _m_base_schema),
+    ("llm_usage",                   _m_llm_usage),
+    ("hot path indexes",            _m_hot_path_indexes),
+    ("PDFs to blob_store",          _m_pdf_files),
+    ("report graphs to blob_store", _m_report_graphs),
+    ("interviews.state_version",    _m_state_version),
+    ("compressed JSON columns",     _pack_json_columns),
+    ("session_summaries",           _m_session_summaries),
+    ("housekeeping indexes",        _m_housekeeping_indexes),
+    ("orphan_blobs",                _m_orphan_blobs),
+]
 
 
 # ─────────────────────────────────────────────
@@ -114,42 +481,34 @@ def _hash_password(password: str, salt: str) -> str:
 def register_user(username, email, password, full_name=""):
     salt = secrets.token_hex(32)
     pw_hash = _hash_password(password, salt)
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
+    conn = _connect()
     try:
-        c.execute(
-            "INSERT INTO users (username, email, password_hash, salt, full_name) VALUES (?, ?, ?, ?, ?)",
-            (username.lower().strip(), email.lower().strip(), pw_hash, salt, full_name)
-        )
-        conn.commit()
+        with conn:
+            c = conn.execute(
+                "INSERT INTO users (username, email, password_hash, salt, full_name) VALUES (?, ?, ?, ?, ?)",
+                (username.lower().strip(), email.lower().strip(), pw_hash, salt, full_name)
+            )
         return True, c.lastrowid
     except sqlite3.IntegrityError as e:
         if "username" in str(e): return False, "Username already taken."
         if "email" in str(e): return False, "An account with this email already exists."
         return False, "Registration failed."
-    finally:
-        conn.close()
 
 
 def login_user(username_or_email, password):
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    conn = _connect()
     identifier = username_or_email.lower().strip()
-    c.execute("SELECT * FROM users WHERE username = ? OR email = ?", (identifier, identifier))
-    user = c.fetchone()
+    user = conn.execute(SQL_USER_BY_LOGIN, (identifier, identifier)).fetchone()
     if not user or _hash_password(password, user["salt"]) != user["password_hash"]:
-        conn.close()
         return False, "Invalid username or password."
 
     token = secrets.token_urlsafe(48)
     expires_at = datetime.now().replace(hour=23, minute=59, second=59).isoformat()
-    c.execute(
-        "INSERT INTO auth_sessions (token, user_id, expires_at) VALUES (?, ?, ?)",
-        (token, user["id"], expires_at)
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            "INSERT INTO auth_sessions (token, user_id, expires_at) VALUES (?, ?, ?)",
+            (token, user["id"], expires_at)
+        )
     return True, {
         "token": token,
         "user_id": user["id"],
@@ -158,142 +517,284 @@ def login_user(username_or_email, password):
     }
 
 
+# Valid tokens seen recently: token -> (user_id, monotonic deadline). An entry
+# lives AUTH_CACHE_TTL_SECONDS at most and never past the token's own expiry.
+# logout_user() evicts it here; other worker processes keep theirs until the
+# TTL runs out, which bounds how long a logged-out token still works there.
+_token_cache      = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
 def validate_token(token):
     if not token:
         return None
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute("SELECT user_id, expires_at FROM auth_sessions WHERE token = ?", (token,))
-    row = c.fetchone()
-    conn.close()
-    if not row or datetime.fromisoformat(row["expires_at"]) < datetime.now():
+    now = time.monotonic()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached and cached[1] > now:
+            _token_cache.move_to_end(token)
+            hit = cached[0]
+        else:
+            hit = None
+    if hit is not None:
+        metrics.inc("prepspark_auth_cache_total", {"result": "hit"})
+        return hit
+    metrics.inc("prepspark_auth_cache_total", {"result": "miss"})
+
+    row = _connect().execute("SELECT user_id, expires_at FROM auth_sessions WHERE token = ?",
+                             (token,)).fetchone()
+    if not row:
+        return None
+    remaining = (datetime.fromisoformat(row["expires_at"]) - datetime.now()).total_seconds()
+    if remaining < 0:
         return None
+
+    if config.AUTH_CACHE_TTL_SECONDS > 0:
+        with _token_cache_lock:
+            _token_cache[token] = (row["user_id"], now + min(config.AUTH_CACHE_TTL_SECONDS, remaining))
+            _token_cache.move_to_end(token)
+            while len(_token_cache) > config.AUTH_CACHE_MAX_ENTRIES:
+                _token_cache.popitem(last=False)
     return row["user_id"]
 
 
 def logout_user(token):
-    conn = sqlite3.connect(DB_NAME)
-    conn.execute("DELETE FROM auth_sessions WHERE token = ?", (token,))
-    conn.commit()
-    conn.close()
+    with _token_cache_lock:
+        _token_cache.pop(token, None)
+    conn = _connect()
+    with conn:
+        conn.execute("DELETE FROM auth_sessions WHERE token = ?", (token,))
 
 
 # ─────────────────────────────────────────────
 # INTERVIEWS
 # ─────────────────────────────────────────────
 
+# Active interviews are a tight loop of requests against the same rows, so
+# each process keeps the interviews row and chat history of recent sessions.
+# Every write to either bumps interviews.state_version; a read checks the
+# cached version against that one integer (a primary-key lookup) and reloads
+# on mismatch, so a write made by another worker is never served stale.
+_session_cache      = OrderedDict()    # session_id -> {"version", "info", "chat_history"}
+_session_cache_lock = threading.Lock()
+
+
+def _chat_item(row) -> dict:
+    return {"q_index": row["question_index"], "q_text": row["q_text"], "q_type": row["question_type"],
+            "transcript": row["transcript"], "score": row["ai_score"]}
+
+
+def _cache_session(session_id: str, entry: dict):
+    if config.SESSION_CACHE_MAX_ENTRIES <= 0:
+        return
+    with _session_cache_lock:
+        _session_cache[session_id] = entry
+        _session_cache.move_to_end(session_id)
+        while len(_session_cache) > config.SESSION_CACHE_MAX_ENTRIES:
+            _session_cache.popitem(last=False)
+
+
+def _write_through(session_id: str, new_version: int, update):
+    """Applies `update(entry)` if the cache held the state just before this write, else drops the entry."""
+    with _session_cache_lock:
+        entry = _session_cache.get(session_id)
+        if entry and entry["version"] == new_version - 1:
+            update(entry)
+            entry["version"] = new_version
+        else:
+            _session_cache.pop(session_id, None)
+
+
+def _bump_state_version(conn, session_id: str) -> int:
+    conn.execute("UPDATE interviews SET state_version = state_version + 1 WHERE session_id = ?", (session_id,))
+    row = conn.execute("SELECT state_version FROM interviews WHERE session_id = ?", (session_id,)).fetchone()
+    return row[0] if row else -1
+
+
+def _cached_session(session_id: str):
+    """The validated cache entry for a session (loading it on a miss), or None if it doesn't exist."""
+    conn = _connect()
+    row = conn.execute("SELECT state_version FROM interviews WHERE session_id = ?", (session_id,)).fetchone()
+    if not row:
+        with _session_cache_lock:
+            _session_cache.pop(session_id, None)
+        return None
+
+    with _session_cache_lock:
+        entry = _session_cache.get(session_id)
+        if entry and entry["version"] == row[0]:
+            _session_cache.move_to_end(session_id)
+            metrics.inc("prepspark_session_cache_total", {"result": "hit"})
+            return entry
+    metrics.inc("prepspark_session_cache_total", {"result": "miss"})
+
+    header = conn.execute(SQL_SESSION_HEADER, (session_id,)).fetchone()
+    if not header:
+        return None
+    entry = {"version": header["state_version"], "info": dict(header), "chat_history": None}
+    _cache_session(session_id, entry)
+    return entry
+
+
+@timed("db.create_session")
 def create_session(session_id, name, role, user_id=None, language='en',
                    resume_text=None, job_description=None):
     """Creates a new interview session with optional resume and job description context."""
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute(
-        "INSERT INTO interviews "
-        "(session_id, user_id, candidate_name, target_role, start_time, status, language, resume_text, job_description) "
-        "VALUES (?, ?, ?, ?, ?, 'IN_PROGRESS', ?, ?, ?)",
-        (session_id, user_id, name, role, datetime.now().isoformat(),
-         language, resume_text, job_description)
-    )
-    conn.commit()
-    conn.close()
+    info = {
+        "session_id": session_id, "user_id": user_id, "candidate_name": name, "target_role": role,
+        "start_time": datetime.now().isoformat(), "status": "IN_PROGRESS", "language": language,
+        "resume_text": resume_text, "job_description": job_description, "state_version": 0,
+    }
+    conn = _connect()
+    with conn:
+        conn.execute(
+            "INSERT INTO interviews "
+            "(session_id, user_id, candidate_name, target_role, start_time, status, language, "
+            "resume_text, job_description, state_version) "
+            "VALUES (:session_id, :user_id, :candidate_name, :target_role, :start_time, :status, "
+            ":language, :resume_text, :job_description, :state_version)",
+            info
+        )
+        conn.execute(
+            "INSERT INTO session_summaries "
+            "(session_id, user_id, candidate_name, target_role, start_time, status, language, has_resume, has_jd) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (session_id, user_id, name, role, info["start_time"], info["status"], language,
+             int(bool(resume_text)), int(bool(job_description)))
+        )
+    _cache_session(session_id, {"version": 0, "info": info, "chat_history": []})
 
 
+@timed("db.mark_session_completed")
 def mark_session_completed(session_id: str):
-    conn = sqlite3.connect(DB_NAME)
-    conn.execute("UPDATE interviews SET status = 'COMPLETED' WHERE session_id = ?", (session_id,))
-    conn.commit()
-    conn.close()
+    conn = _connect()
+    with conn:
+        conn.execute("UPDATE interviews SET status = 'COMPLETED' WHERE session_id = ?", (session_id,))
+        conn.execute("UPDATE session_summaries SET status = 'COMPLETED' WHERE session_id = ?", (session_id,))
+        version = _bump_state_version(conn, session_id)
+    _write_through(session_id, version, lambda entry: entry["info"].update(status="COMPLETED"))
 
 
+@timed("db.save_response")
 def save_response(session_id, q_index, question, question_type, transcript,
                   audio_metrics, video_metrics, timeline, ai_feedback, ai_score):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('''
-        INSERT INTO responses
-        (session_id, question_index, question_text, question_type, transcript,
-         audio_metrics, video_metrics, timeline_json, ai_feedback, ai_score)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        session_id, q_index, question, question_type, transcript,
-        json.dumps(audio_metrics), json.dumps(video_metrics),
-        json.dumps(timeline), ai_feedback, ai_score
-    ))
-    conn.commit()
-    conn.close()
+    conn = _connect()
+    with conn:
+        conn.execute('''
+            INSERT INTO responses
+            (session_id, question_index, question_text, question_type, transcript,
+             audio_metrics, video_metrics, timeline_json, ai_feedback, ai_score)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            session_id, q_index, question, question_type, transcript,
+            encode_json(audio_metrics), encode_json(video_metrics),
+            encode_json(timeline), ai_feedback, ai_score
+        ))
+        conn.execute(
+            "UPDATE session_summaries SET response_count = response_count + 1, "
+            "score_total = score_total + COALESCE(?, 0), scored_count = scored_count + (? IS NOT NULL) "
+            "WHERE session_id = ?",
+            (ai_score, ai_score, session_id)
+        )
+        version = _bump_state_version(conn, session_id)
 
+    item = {"q_index": q_index, "q_text": question, "q_type": question_type,
+            "transcript": transcript, "score": ai_score}
 
+    def append(entry):
+        if entry["chat_history"] is not None:
+            entry["chat_history"] = sorted(entry["chat_history"] + [item], key=lambda i: i["q_index"])
+    _write_through(session_id, version, append)
+
+
+@timed("db.get_chat_history")
 def get_chat_history(session_id):
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute(
-        "SELECT question_text as q_text, question_type, transcript, ai_score FROM responses "
-        "WHERE session_id = ? ORDER BY question_index ASC",
-        (session_id,)
-    )
-    rows = c.fetchall()
-    conn.close()
-    return [{"q_text": r["q_text"], "q_type": r["question_type"],
-             "transcript": r["transcript"], "score": r["ai_score"]} for r in rows]
+    entry = _cached_session(session_id)
+    if not entry:
+        return []
+    history = entry["chat_history"]
+    if history is None:
+        version = entry["version"]
+        history = [_chat_item(r) for r in _connect().execute(SQL_CHAT_HISTORY, (session_id,))]
+        with _session_cache_lock:
+            # Kept only if nothing was written to the session in the meantime
+            if entry["version"] == version and entry["chat_history"] is None:
+                entry["chat_history"] = history
+    return [dict(item) for item in history]
 
 
+@timed("db.get_session_info")
 def get_session_info(session_id):
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute("SELECT * FROM interviews WHERE session_id = ?", (session_id,))
-    row = c.fetchone()
-    conn.close()
-    return dict(row) if row else None
+    """The interviews row only: enough for ownership, status and LLM context checks."""
+    entry = _cached_session(session_id)
+    return dict(entry["info"]) if entry else None
+
 
+class ResponseRecord:
+    """
+    One responses row. Plain columns read straight through; the JSON
+    columns are unpacked and decoded on first access (to {} if empty or malformed),
+    so callers that never touch them never pay for parsing them.
+    """
+
+    JSON_COLUMNS = ("audio_metrics", "video_metrics", "timeline_json")
+    __slots__ = ("_row", "_decoded")
+
+    def __init__(self, row: sqlite3.Row):
+        self._row     = row
+        self._decoded = {}
+
+    def __getitem__(self, key):
+        if key not in self.JSON_COLUMNS:
+            return self._row[key]
+        if key not in self._decoded:
+            try:
+                self._decoded[key] = decode_json(self._row[key] or "{}")
+            except (ValueError, zlib.error):
+                self._decoded[key] = {}
+        return self._decoded[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+    def keys(self):
+        return self._row.keys()
 
+
+@timed("db.get_full_session_data")
 def get_full_session_data(session_id):
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute("SELECT * FROM interviews WHERE session_id = ?", (session_id,))
-    session_row = c.fetchone()
+    """(session header, [ResponseRecord…]) — for report generation, which needs every answer."""
+    conn = _connect()
+    session_row = conn.execute(SQL_SESSION_HEADER, (session_id,)).fetchone()
     if not session_row:
-        conn.close()
         return None, []
-    session = dict(session_row)
-    c.execute(
-        "SELECT * FROM responses WHERE session_id = ? ORDER BY question_index ASC",
-        (session_id,)
-    )
-    responses = [dict(r) for r in c.fetchall()]
-    conn.close()
-    return session, responses
+    responses = [ResponseRecord(r) for r in conn.execute(SQL_SESSION_RESPONSES, (session_id,))]
+    return dict(session_row), responses
 
 
 # ─────────────────────────────────────────────
 # REPORT STORAGE
 # ─────────────────────────────────────────────
 
+@timed("db.save_report")
 def save_report(session_id: str, report_data: dict):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute(
-        "INSERT OR REPLACE INTO reports (session_id, report_json, generated_at) VALUES (?, ?, ?)",
-        (session_id, json.dumps(report_data), datetime.now().isoformat())
-    )
-    conn.commit()
-    conn.close()
+    conn = _connect()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO reports (session_id, report_json, generated_at) VALUES (?, ?, ?)",
+            (session_id, encode_json(report_data), datetime.now().isoformat())
+        )
 
 
 def get_stored_report(session_id: str):
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute("SELECT report_json FROM reports WHERE session_id = ?", (session_id,))
-    row = c.fetchone()
-    conn.close()
+    row = _connect().execute("SELECT report_json FROM reports WHERE session_id = ?", (session_id,)).fetchone()
     if not row:
         return None
     try:
-        return json.loads(row["report_json"])
+        return decode_json(row["report_json"])
     except Exception:
         return None
 
@@ -302,71 +803,287 @@ def get_stored_report(session_id: str):
 # DASHBOARD
 # ─────────────────────────────────────────────
 
-def get_user_interviews(user_id):
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute(
-        """
-        SELECT  i.session_id,
-                i.candidate_name,
-                i.target_role,
-                i.start_time,
-                i.status,
-                i.language,
-                CASE WHEN i.resume_text IS NOT NULL AND i.resume_text != '' THEN 1 ELSE 0 END AS has_resume,
-                CASE WHEN i.job_description IS NOT NULL AND i.job_description != '' THEN 1 ELSE 0 END AS has_jd,
-                COUNT(r.id)              AS response_count,
-                ROUND(AVG(r.ai_score),1) AS avg_score
-        FROM interviews i
-        LEFT JOIN responses r ON i.session_id = r.session_id
-        WHERE i.user_id = ?
-        GROUP BY i.session_id
-        HAVING response_count > 0
-        ORDER BY i.start_time DESC
-        """,
-        (user_id,)
-    )
-    rows = [dict(r) for r in c.fetchall()]
-    conn.close()
-    return rows
+@timed("db.get_user_interviews")
+def get_user_interviews(user_id, limit: int, after: tuple = None) -> tuple:
+    """
+    One dashboard page: ([interview…], next_cursor). `after` and next_cursor
+    are (start_time, session_id) of the last row shown; next_cursor is None
+    on the last page.
+    """
+    start_time, session_id = after or ("\uffff", "")
+    rows = _connect().execute(SQL_USER_INTERVIEWS, (user_id, start_time, session_id, limit + 1)).fetchall()
+    page = [dict(r) for r in rows[:limit]]
+    more = len(rows) > limit
+    return page, ((page[-1]["start_time"], page[-1]["session_id"]) if more else None)
 
 
 # ─────────────────────────────────────────────
 # PDF REPORT STORAGE
 # ─────────────────────────────────────────────
 
+@timed("db.save_pdf_report")
 def save_pdf_report(session_id: str, pdf_bytes: bytes, analytics: dict):
-    """Stores the generated PDF binary and its analytics data."""
-    conn = sqlite3.connect(DB_NAME)
-    c    = conn.cursor()
-    c.execute(
-        "INSERT OR REPLACE INTO pdf_reports "
-        "(session_id, pdf_data, analytics_json, generated_at) VALUES (?, ?, ?, ?)",
-        (session_id, pdf_bytes, json.dumps(analytics), datetime.now().isoformat())
-    )
-    conn.commit()
-    conn.close()
+    """Writes the PDF to blob_store and records its hash with the analytics data."""
+    digest = blob_store.put(pdf_bytes)
+    conn = _connect()
+    with conn:
+        previous = conn.execute("SELECT sha256 FROM pdf_files WHERE session_id = ?", (session_id,)).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO pdf_files "
+            "(session_id, sha256, size_bytes, analytics_json, generated_at) VALUES (?, ?, ?, ?, ?)",
+            (session_id, digest, len(pdf_bytes), json.dumps(analytics), datetime.now().isoformat())
+        )
+        if previous and previous["sha256"] != digest:
+            _mark_orphans(conn, [previous["sha256"]])
 
 
 def get_pdf_report(session_id: str) -> tuple:
     """
-    Returns (pdf_bytes, analytics_dict) or (None, None) if not found.
+    Returns (pdf_path, analytics_dict), or (None, None) if there is no PDF
+    for the session or its file has gone missing.
     """
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
-    c    = conn.cursor()
-    c.execute(
-        "SELECT pdf_data, analytics_json FROM pdf_reports WHERE session_id = ?",
+    row = _connect().execute(
+        "SELECT sha256, analytics_json FROM pdf_files WHERE session_id = ?",
         (session_id,)
-    )
-    row = c.fetchone()
-    conn.close()
-    if not row:
+    ).fetchone()
+    if not row or not blob_store.exists(row["sha256"]):
         return None, None
     analytics = {}
     try:
         analytics = json.loads(row['analytics_json'])
     except Exception:
         pass
-    return bytes(row['pdf_data']), analytics
\ No newline at end of file
+    return blob_store.path_for(row["sha256"]), analytics
+
+
+def _mark_orphans(conn, digests):
+    """Queues blobs that just lost a reference for purge_orphan_blobs() to check later."""
+    now = datetime.now().isoformat()
+    conn.executemany("INSERT OR IGNORE INTO orphan_blobs (sha256, since) VALUES (?, ?)",
+                     [(d, now) for d in set(digests)])
+
+
+def _unreferenced(conn, digests) -> list:
+    """The blobs in `digests` that no PDF or graph row points to any more."""
+    return [d for d in set(digests) if not conn.execute(
+        "SELECT 1 FROM pdf_files WHERE sha256 = ? UNION ALL SELECT 1 FROM report_graphs WHERE sha256 = ? LIMIT 1",
+        (d, d)
+    ).fetchone()]
+
+
+# ─────────────────────────────────────────────
+# REPORT GRAPHS
+# ─────────────────────────────────────────────
+
+def save_report_graphs(session_id: str, graphs: dict):
+    """Stores {name: png_bytes} for a session, replacing any earlier set."""
+    digests = {name: blob_store.put(png) for name, png in graphs.items()}
+    conn = _connect()
+    with conn:
+        previous = [r["sha256"] for r in conn.execute(
+            "SELECT sha256 FROM report_graphs WHERE session_id = ?", (session_id,))]
+        conn.execute("DELETE FROM report_graphs WHERE session_id = ?", (session_id,))
+        conn.executemany(
+            "INSERT INTO report_graphs (session_id, name, sha256, size_bytes) VALUES (?, ?, ?, ?)",
+            [(session_id, name, digests[name], len(png)) for name, png in graphs.items()]
+        )
+        _mark_orphans(conn, set(previous) - set(digests.values()))
+
+
+def get_report_graphs(session_id: str) -> dict:
+    """{graph name: sha256} for a session; the hash doubles as the image's version."""
+    rows = _connect().execute(
+        "SELECT name, sha256 FROM report_graphs WHERE session_id = ?", (session_id,)
+    ).fetchall()
+    return {r["name"]: r["sha256"] for r in rows}
+
+
+def has_report_graphs(session_id: str) -> bool:
+    """True if the session has graphs and every one of their files is present."""
+    rows = _connect().execute(
+        "SELECT sha256 FROM report_graphs WHERE session_id = ?", (session_id,)
+    ).fetchall()
+    return bool(rows) and all(blob_store.exists(r["sha256"]) for r in rows)
+
+
+def get_report_graph(session_id: str, name: str):
+    """Path of one graph PNG, or None if it doesn't exist."""
+    row = _connect().execute(
+        "SELECT sha256 FROM report_graphs WHERE session_id = ? AND name = ?", (session_id, name)
+    ).fetchone()
+    if not row or not blob_store.exists(row["sha256"]):
+        return None
+    return blob_store.path_for(row["sha256"])
+
+
+# ─────────────────────────────────────────────
+# LLM USAGE
+# ─────────────────────────────────────────────
+
+_USAGE_FIELDS = ("prompt_chars", "prompt_tokens", "response_chars", "response_tokens", "seconds")
+
+
+def record_llm_usage(session_id: str, usage: dict):
+    """Adds one Gemini call (as measured by LLMService) to the session's totals."""
+    conn = _connect()
+    with conn:
+        conn.execute(
+            """
+            INSERT INTO llm_usage (session_id, method, calls, failures, prompt_chars,
+                                   prompt_tokens, response_chars, response_tokens, seconds)
+            VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(session_id, method) DO UPDATE SET
+                calls           = calls + 1,
+                failures        = failures + excluded.failures,
+                prompt_chars    = prompt_chars + excluded.prompt_chars,
+                prompt_tokens   = prompt_tokens + excluded.prompt_tokens,
+                response_chars  = response_chars + excluded.response_chars,
+                response_tokens = response_tokens + excluded.response_tokens,
+                seconds         = seconds + excluded.seconds
+            """,
+            (session_id, usage["method"], 0 if usage["ok"] else 1,
+             *(usage[f] for f in _USAGE_FIELDS))
+        )
+
+
+def get_llm_usage(session_id: str) -> dict:
+    """
+    Returns {"methods": {method: totals}, "total": totals} for one session,
+    where totals holds calls, failures, the _USAGE_FIELDS sums and
+    avg_prompt_tokens.
+    """
+    rows = [dict(r) for r in _connect().execute(
+        "SELECT * FROM llm_usage WHERE session_id = ? ORDER BY method", (session_id,)
+    )]
+
+    total   = {f: 0 for f in ("calls", "failures") + _USAGE_FIELDS}
+    methods = {}
+    for row in rows:
+        row.pop("session_id")
+        method = row.pop("method")
+        for f in total:
+            total[f] += row[f]
+        methods[method] = row
+    for totals in list(methods.values()) + [total]:
+        totals["seconds"]           = round(totals["seconds"], 3)
+        totals["avg_prompt_tokens"] = round(totals["prompt_tokens"] / totals["calls"]) if totals["calls"] else 0
+    return {"methods": methods, "total": total}
+
+
+# ─────────────────────────────────────────────
+# HOUSEKEEPING
+# ─────────────────────────────────────────────
+# Each call deletes at most `batch_size` items in one short transaction, so
+# request writes queue behind it for milliseconds; housekeeping.py loops them.
+
+# Everything keyed by an interview's session_id, children first
+SESSION_TABLES = ("responses", "reports", "pdf_files", "report_graphs", "llm_usage",
+                  "session_summaries", "interviews")
+
+
+@timed("db.purge_expired_tokens")
+def purge_expired_tokens(batch_size: int) -> int:
+    conn = _connect()
+    with conn:
+        return conn.execute(
+            f"DELETE FROM auth_sessions WHERE token IN ({SQL_EXPIRED_TOKENS})",
+            (datetime.now().isoformat(), batch_size)
+        ).rowcount
+
+
+@timed("db.purge_abandoned_interviews")
+def purge_abandoned_interviews(older_than_days: float, batch_size: int) -> int:
+    """Deletes IN_PROGRESS interviews started more than `older_than_days` ago, with all their rows."""
+    cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat()
+    conn = _connect()
+    with conn:
+        sessions = [r[0] for r in conn.execute(SQL_STALE_SESSIONS, (cutoff, batch_size))]
+        if not sessions:
+            return 0
+        marks = ", ".join("?" * len(sessions))
+        blobs = [r[0] for r in conn.execute(
+            f"SELECT sha256 FROM pdf_files WHERE session_id IN ({marks}) "
+            f"UNION SELECT sha256 FROM report_graphs WHERE session_id IN ({marks})",
+            sessions + sessions
+        )]
+        for table in SESSION_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE session_id IN ({marks})", sessions)
+        _mark_orphans(conn, blobs)
+    with _session_cache_lock:
+        for session_id in sessions:
+            _session_cache.pop(session_id, None)
+    return len(sessions)
+
+
+@timed("db.purge_orphan_blobs")
+def purge_orphan_blobs(grace_seconds: float, batch_size: int) -> int:
+    """
+    Deletes blob files that lost their last reference more than
+    `grace_seconds` ago and have not been put() again since. Returns how
+    many files were removed.
+    """
+    cutoff = (datetime.now() - timedelta(seconds=grace_seconds)).isoformat()
+    conn = _connect()
+    with conn:
+        candidates = [r[0] for r in conn.execute(SQL_ORPHAN_BLOBS, (cutoff, batch_size))]
+        if not candidates:
+            return 0
+        orphaned = _unreferenced(conn, candidates)
+        conn.executemany("DELETE FROM orphan_blobs WHERE sha256 = ?", [(d,) for d in candidates])
+
+    # The mtime check catches a writer that put() the blob again but has not
+    # committed its row yet; that blob goes back in the queue
+    busy = [d for d in orphaned if not blob_store.delete(d, idle_seconds=grace_seconds)
+            and blob_store.exists(d)]
+    if busy:
+        with conn:
+            _mark_orphans(conn, busy)
+    return len(orphaned) - len(busy)
+
+
+# ─────────────────────────────────────────────
+# QUERY PLANS
+# ─────────────────────────────────────────────
+
+# name -> (query, placeholder parameters, whether an index must also supply the ORDER BY)
+HOT_QUERIES = {
+    "login":           (SQL_USER_BY_LOGIN,     ("someone", "someone"), False),
+    "session_header":  (SQL_SESSION_HEADER,    ("session",),           False),
+    "chat_history":    (SQL_CHAT_HISTORY,      ("session",),           True),
+    "session_answers": (SQL_SESSION_RESPONSES, ("session",),           True),
+    "dashboard":       (SQL_USER_INTERVIEWS,   (1, "\uffff", "", 21), True),
+    "expired_tokens":  (SQL_EXPIRED_TOKENS,    ("now", 500),           False),
+    "stale_sessions":  (SQL_STALE_SESSIONS,    ("now", 500),           False),
+    "orphan_blobs":    (SQL_ORPHAN_BLOBS,      ("now", 500),           False),
+}
+
+
+def check_query_plans() -> dict:
+    """
+    Runs EXPLAIN QUERY PLAN on every HOT_QUERIES entry and returns
+    {name: (plan_lines, problems)}. A problem is a full table scan, or a
+    temporary sort where the index should already give the order.
+    """
+    conn = _connect()
+    report = {}
+    for name, (sql, params, index_sorted) in HOT_QUERIES.items():
+        plan = [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        problems = [line for line in plan
+                    if (line.startswith("SCAN ") and "USING" not in line)
+                    or (index_sorted and "TEMP B-TREE FOR ORDER BY" in line)]
+        report[name] = (plan, problems)
+    return report
+
+
+# --- TEST BLOCK ---
+if __name__ == "__main__":
+    import sys
+
+    init_db()
+    failed = False
+    for name, (plan, problems) in check_query_plans().items():
+        print(f"{'❌' if problems else '✅'} {name}")
+        for line in plan:
+            print(f"     {line}")
+        failed |= bool(problems)
+    sys.exit(1 if failed else 0)
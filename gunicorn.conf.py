@@ -0,0 +1,62 @@
+"""
+gunicorn.conf.py
+────────────────
+    gunicorn -c gunicorn.conf.py
+
+Pre-fork production server: the master loads the app once (wsgi.create_app),
+then forks WEB_WORKERS workers. Each worker builds its own API clients and
+SQLite connections after the fork, and starts its own analysis pool, whose
+processes load the video models from that pool's forkserver (one copy per
+web worker, shared by its analysis processes).
+
+Environment:
+  BIND              address to listen on            (default 0.0.0.0:5000)
+  WEB_WORKERS       web worker processes            (default 2)
+  WEB_THREADS       threads per web worker          (default 8)
+  ANALYSIS_WORKERS  analysis cores *per web worker*; defaults to the spare
+                    cores split evenly between web workers (with the frame
+                    ring, half as many pool workers, each with a decoder)
+"""
+
+import os
+
+# Tells app.py it is being imported by a master that will fork (see config.PREFORK)
+os.environ["PREPSPARK_PREFORK"] = "1"
+
+wsgi_app = "wsgi:create_app()"
+bind     = os.getenv("BIND", "0.0.0.0:5000")
+workers  = int(os.getenv("WEB_WORKERS", 2))
+
+# Threads, not processes, for concurrency inside a worker: SSE progress streams
+# and uploads waiting on the analysis pool each hold one for minutes, mostly idle.
+worker_class = "gthread"
+threads      = int(os.getenv("WEB_THREADS", 8))
+timeout      = 120
+
+# Import the app once in the master; workers share its modules copy-on-write
+preload_app = True
+
+# Split the analysis CPU budget between web workers rather than giving each one
+# a pool sized for the whole machine. Must be set before the app is imported.
+os.environ.setdefault("ANALYSIS_WORKERS",
+                      str(max(1, ((os.cpu_count() or 2) - 1) // workers)))
+
+
+def post_fork(server, worker):
+    import app
+    app.reset_after_fork()
+
+
+def post_worker_init(worker):
+    import app
+    import config
+    import housekeeping
+    if config.EAGER_INIT:
+        app.start_warm_up()
+    # Threads don't survive the fork, so each worker runs its own purge loop
+    housekeeping.start()
+
+
+def worker_exit(server, worker):
+    import app
+    app.analysis_pool.shutdown()
@@ -0,0 +1,94 @@
+"""
+housekeeping.py
+───────────────
+Background purge of rows nobody will read again:
+
+  • auth_sessions — tokens past expires_at (every login adds one)
+  • interviews    — IN_PROGRESS sessions started more than
+                    ABANDONED_INTERVIEW_DAYS ago, with their answers, usage
+                    and any stored graphs / PDFs
+  • blob_store    — files no row references any more, once idle for
+                    BLOB_GC_GRACE_SECONDS
+
+Each app process runs a daemon thread that calls run_pass() every
+HOUSEKEEPING_INTERVAL_SECONDS (± 20 % so workers don't line up). A pass
+deletes in batches of HOUSEKEEPING_BATCH_SIZE, one short transaction each,
+pausing between them so request writes get the database in between.
+Deletes are idempotent, so several workers purging at once is harmless.
+
+Run one pass by hand:
+    python housekeeping.py
+"""
+
+import random
+import threading
+import time
+
+import config
+import database
+import metrics
+
+BATCH_PAUSE_SECONDS = 0.05
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def _purge_all(purge, batch_size: int) -> int:
+    total = 0
+    while True:
+        count = purge(batch_size)
+        total += count
+        if count < batch_size:
+            return total
+        time.sleep(BATCH_PAUSE_SECONDS)
+
+
+@metrics.timed("housekeeping")
+def run_pass() -> dict:
+    """Purges everything currently due; returns {kind: rows removed}."""
+    purged = {
+        "auth_tokens": _purge_all(database.purge_expired_tokens, config.HOUSEKEEPING_BATCH_SIZE),
+        "interviews":  _purge_all(
+            lambda n: database.purge_abandoned_interviews(config.ABANDONED_INTERVIEW_DAYS, n),
+            config.HOUSEKEEPING_BATCH_SIZE
+        ),
+        "blobs":       _purge_all(
+            lambda n: database.purge_orphan_blobs(config.BLOB_GC_GRACE_SECONDS, n),
+            config.HOUSEKEEPING_BATCH_SIZE
+        ),
+    }
+    for kind, count in purged.items():
+        metrics.inc("prepspark_purged_rows_total", {"kind": kind}, by=count)
+    if any(purged.values()):
+        print(f"🧹 Housekeeping: {purged['auth_tokens']} expired token(s), "
+              f"{purged['interviews']} abandoned interview(s), {purged['blobs']} orphaned blob(s) removed")
+    return purged
+
+
+def _loop():
+    while True:
+        time.sleep(config.HOUSEKEEPING_INTERVAL_SECONDS * random.uniform(0.8, 1.2))
+        try:
+            run_pass()
+        except Exception as e:
+            print(f"⚠️  Housekeeping pass failed: {e}")
+
+
+def start() -> bool:
+    """Starts this process's housekeeping thread (once; not at all if the interval is 0)."""
+    global _started
+    if config.HOUSEKEEPING_INTERVAL_SECONDS <= 0:
+        return False
+    with _start_lock:
+        if _started:
+            return False
+        _started = True
+    threading.Thread(target=_loop, daemon=True, name="housekeeping").start()
+    return True
+
+
+# --- TEST BLOCK ---
+if __name__ == "__main__":
+    database.init_db()
+    print(run_pass())
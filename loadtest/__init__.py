@@ -0,0 +1,17 @@
+"""
+Load testing without the paid APIs.
+
+    # 1. Local Gemini / Groq / OpenAI TTS stand-ins (prints the env vars to use)
+    python -m loadtest.fake_apis --latency gemini=0.8,groq=0.5,tts=0.3 --failure-rate gemini=0.02
+
+    # 2. The app, pointed at them (any entry point: app.py, gunicorn, uvicorn asgi:application)
+    GEMINI_API_ENDPOINT=http://127.0.0.1:8765 GROQ_BASE_URL=http://127.0.0.1:8765 \\
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 GEMINI_API_KEY=fake GROQ_API_KEY=fake OPENAI_API_KEY=fake \\
+    gunicorn -c gunicorn.conf.py
+
+    # 3. Full interviews against it
+    python -m loadtest.run --users 16 --answers 5
+
+Video and Praat analysis, ffmpeg, SQLite and report generation are real;
+only the network calls are faked.
+"""
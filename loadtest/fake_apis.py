@@ -0,0 +1,276 @@
+"""
+fake_apis.py
+────────────
+One local HTTP server standing in for the three paid APIs the app calls:
+
+  • Gemini        POST /v1beta/models/<model>:generateContent
+  • Groq Whisper  POST /openai/v1/audio/transcriptions
+  • OpenAI TTS    POST /v1/audio/speech
+
+Each service has its own latency (with jitter) and failure rate. Delays and
+failures come from a seeded RNG, so the same seed gives the same sequence.
+Gemini answers are canned but have the shape each prompt asks for, so a
+whole interview runs through: analyze_response declares the interview
+complete at --questions.
+
+Run from the repo root:
+    python -m loadtest.fake_apis [--port 8765] [--latency gemini=0.8,groq=0.5,tts=0.3]
+                                 [--failure-rate gemini=0.02] [--questions 5] [--seed 1]
+
+then start the app with the environment it prints.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SERVICES = ("gemini", "groq", "tts")
+
+DEFAULT_LATENCY = {"gemini": 0.8, "groq": 0.5, "tts": 0.3}   # seconds, before jitter
+
+ANSWERS = [
+    "I would start by profiling the service to find where the time actually goes, "
+    "then cache the hot reads and move the slow writes onto a queue.",
+    "In my last project I owned the payments integration, and the hardest part was "
+    "making retries idempotent so customers were never charged twice.",
+    "I usually split the problem into smaller pieces, write a test for the edge cases "
+    "first, and then refactor once the behaviour is pinned down.",
+]
+
+# A few MPEG-1 Layer III frame headers followed by silence: enough to base64 and ship
+SILENT_MP3 = (b"\xff\xfb\x90\x64" + b"\x00" * 413) * 8
+
+
+class Behaviour:
+    """Seeded latency / failure decisions, shared by all handler threads."""
+
+    def __init__(self, latency: dict, failure_rate: dict, jitter: float, seed: int, questions: int):
+        self.latency      = latency
+        self.failure_rate = failure_rate
+        self.jitter       = jitter
+        self.questions    = questions
+        self._rng         = random.Random(seed)
+        self._lock        = threading.Lock()
+        self.calls        = {s: 0 for s in SERVICES}
+        self.failures     = {s: 0 for s in SERVICES}
+
+    def draw(self, service: str) -> tuple:
+        """(delay_seconds, should_fail) for one call."""
+        with self._lock:
+            spread = self._rng.uniform(-self.jitter, self.jitter)
+            fail   = self._rng.random() < self.failure_rate.get(service, 0.0)
+            self.calls[service] += 1
+            self.failures[service] += fail
+        return max(0.0, self.latency.get(service, 0.0) * (1 + spread)), fail
+
+
+# ─────────────────────────────────────────────
+# CANNED RESPONSES
+# ─────────────────────────────────────────────
+
+def gemini_text(prompt: str, json_mode: bool, questions: int) -> str:
+    """Picks a reply with the shape the prompt asks for."""
+    if not json_mode:
+        if "closing message" in prompt:
+            return "That wraps up our practice session — your report is ready."
+        return "Hi there, welcome to PrepSpark! Could you start by walking me through your background?"
+
+    if '"interview_complete"' in prompt:
+        match = re.search(r"Question (\d+) \[", prompt)
+        q_index = int(match.group(1)) if match else 1
+        done = q_index >= questions
+        return json.dumps({
+            "feedback":           "Solid structure; name a concrete metric next time to make the impact clear.",
+            "next_question":      "Thanks, that's everything for today." if done else
+                                  f"How would you design a rate limiter for an API with {q_index * 1000} clients?",
+            "next_q_type":        "closing" if done else "technical",
+            "score":              5 + q_index % 4,
+            "interview_complete": done,
+        })
+
+    if '"executive_summary"' in prompt:
+        return json.dumps({
+            "executive_summary":     "Clear, structured answers with good technical grounding.",
+            "recommendation":        "Getting There — Keep Practising",
+            "technical_depth":       "Covered caching and queues; trade-offs could go deeper.",
+            "communication_style":   "Steady pace and clear delivery.",
+            "behavioural_signals":   "Composed, with consistent eye contact.",
+            "strengths":             ["Structured thinking", "Ownership", "Clear delivery"],
+            "areas_for_improvement": ["Quantify impact", "Discuss trade-offs", "Shorter intros"],
+            "coaching_tips":         "Lead with the result, then the approach; prepare two metrics per project.",
+        })
+
+    if '"skill_match"' in prompt:
+        q_indexes = [int(i) for i in re.findall(r'"q_index": (\d+)', prompt.split("Generate a structured")[0])]
+        return json.dumps({
+            "skills_from_resume": ["Python", "SQL"],
+            "skills_from_jd":     ["Python", "System Design"],
+            "skills_matched":     ["Python"],
+            "skills_missing":     ["System Design"],
+            "projects_detected":  ["Payments integration"],
+            "experience_summary": "Backend engineer with hands-on service ownership.",
+            "skill_match": [
+                {"skill": "Python",          "candidate_score": 7, "jd_requirement": 9},
+                {"skill": "System Design",   "candidate_score": 5, "jd_requirement": 8},
+                {"skill": "Communication",   "candidate_score": 7, "jd_requirement": 7},
+                {"skill": "Problem Solving", "candidate_score": 6, "jd_requirement": 8},
+                {"skill": "Databases",       "candidate_score": 6, "jd_requirement": 7},
+            ],
+            "jd_match": {"required_skills_pct": 70, "preferred_skills_pct": 55,
+                         "experience_pct": 65, "overall_fit_pct": 63},
+            "answer_quality": [
+                {"q_index": i, "clarity": 7, "technical_depth": 5 + i % 3, "relevance": 8, "confidence": 6}
+                for i in q_indexes
+            ],
+        })
+
+    if '"question"' in prompt:   # resumed interview
+        q_type = re.search(r'"q_type": "(\w+)"', prompt)
+        return json.dumps({"question": "Tell me about a production incident you handled end to end.",
+                           "q_type": q_type.group(1) if q_type else "technical"})
+
+    return "{}"
+
+
+def transcription(seq: int) -> dict:
+    """Groq verbose_json with word timestamps at ~150 WPM."""
+    text  = ANSWERS[seq % len(ANSWERS)]
+    words = [{"word": w, "start": round(i * 0.4, 2), "end": round(i * 0.4 + 0.35, 2)}
+             for i, w in enumerate(text.split())]
+    duration = words[-1]["end"]
+    return {
+        "task":     "transcribe",
+        "language": "english",
+        "duration": duration,
+        "text":     text,
+        "words":    words,
+        "segments": [{"id": 0, "start": 0.0, "end": duration, "text": text}],
+    }
+
+
+# ─────────────────────────────────────────────
+# HTTP
+# ─────────────────────────────────────────────
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    behaviour: Behaviour = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_):   # one line per call would drown the load test output
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+        path = self.path.split("?")[0]
+
+        if ":generateContent" in path:
+            service = "gemini"
+        elif path.endswith("/audio/transcriptions"):
+            service = "groq"
+        elif path.endswith("/audio/speech"):
+            service = "tts"
+        else:
+            return self._json(404, {"error": {"message": f"Unknown path {path}"}})
+
+        delay, fail = self.behaviour.draw(service)
+        time.sleep(delay)
+        if fail:
+            return self._json(500, {"error": {"code": 500, "message": "Injected failure.",
+                                              "status": "INTERNAL"}})
+
+        if service == "gemini":
+            request = json.loads(body or b"{}")
+            prompt  = "".join(part.get("text", "")
+                              for content in request.get("contents", [])
+                              for part in content.get("parts", []))
+            config  = request.get("generationConfig") or request.get("generation_config") or {}
+            json_mode = (config.get("responseMimeType") or config.get("response_mime_type")) == "application/json"
+            text = gemini_text(prompt, json_mode, self.behaviour.questions)
+            return self._json(200, {
+                "candidates": [{"content": {"role": "model", "parts": [{"text": text}]},
+                                "finishReason": "STOP", "index": 0}],
+                "usageMetadata": {"promptTokenCount": len(prompt) // 4,
+                                  "candidatesTokenCount": len(text) // 4,
+                                  "totalTokenCount": (len(prompt) + len(text)) // 4},
+            })
+        if service == "groq":
+            return self._json(200, transcription(self.behaviour.calls["groq"]))
+        return self._send(200, SILENT_MP3, "audio/mpeg")
+
+    def _json(self, status: int, payload: dict):
+        self._send(status, json.dumps(payload).encode(), "application/json")
+
+    def _send(self, status: int, data: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def environment(port: int) -> dict:
+    """What the app needs in its environment to talk to this server instead."""
+    base = f"http://127.0.0.1:{port}"
+    return {
+        "GEMINI_API_ENDPOINT": base,
+        "GEMINI_API_KEY":      "fake",
+        "GROQ_BASE_URL":       base,
+        "GROQ_API_KEY":        "fake",
+        "OPENAI_BASE_URL":     f"{base}/v1",
+        "OPENAI_API_KEY":      "fake",
+    }
+
+
+def serve(port: int, behaviour: Behaviour) -> ThreadingHTTPServer:
+    """Starts the server on a daemon thread and returns it (call .shutdown() to stop)."""
+    handler = type("Handler", (FakeAPIHandler,), {"behaviour": behaviour})
+    server  = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _per_service(spec: str, defaults: dict = None) -> dict:
+    """'gemini=0.8,tts=0.2' → {"gemini": 0.8, "tts": 0.2} over `defaults`."""
+    values = dict(defaults or {})
+    for item in filter(None, (spec or "").split(",")):
+        name, _, value = item.partition("=")
+        if name.strip() not in SERVICES:
+            raise argparse.ArgumentTypeError(f"Unknown service '{name}' (expected one of {SERVICES})")
+        values[name.strip()] = float(value)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-ins for Gemini, Groq and OpenAI TTS.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="", help="per service, e.g. gemini=0.8,groq=0.5,tts=0.3")
+    parser.add_argument("--jitter", type=float, default=0.25, help="± fraction of the latency")
+    parser.add_argument("--failure-rate", default="", help="per service, e.g. gemini=0.02")
+    parser.add_argument("--questions", type=int, default=5, help="answers before the interview completes")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    behaviour = Behaviour(_per_service(args.latency, DEFAULT_LATENCY), _per_service(args.failure_rate),
+                          args.jitter, args.seed, args.questions)
+    server = serve(args.port, behaviour)
+
+    print(f"🎭 Fake APIs on http://127.0.0.1:{args.port} — latency {behaviour.latency}, "
+          f"failures {behaviour.failure_rate or 'none'}")
+    print("Start the app with:")
+    for key, value in environment(args.port).items():
+        print(f"  export {key}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\n📊 Calls {behaviour.calls} | injected failures {behaviour.failures}")
+
+
+if __name__ == "__main__":
+    main()
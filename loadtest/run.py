@@ -0,0 +1,253 @@
+"""
+run.py
+──────
+Drives complete interviews against a running app and reports throughput,
+p50 / p95 / p99 latency and errors per endpoint.
+
+Each virtual user registers, logs in, starts an interview, answers with a
+synthetic WebM clip until the server says the interview is complete (or
+--answers is reached), then fetches the report and the PDF. A 429 from
+submit_response is counted as "busy" and retried after its Retry-After.
+
+Start the fakes and the app first (see loadtest/__init__.py), then from the
+repo root:
+    python -m loadtest.run [--base-url http://127.0.0.1:5000] [--users 8]
+                           [--interviews 1] [--answers 5] [--clip answer.webm] [--out path.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import save_results, print_table
+
+ENDPOINTS = ["auth/register", "auth/login", "start_interview", "submit_response",
+             "generate_report", "download_report"]
+
+
+def make_clip(path: str, seconds: float = 8.0, width: int = 640, height: int = 480):
+    """A synthetic answer: ffmpeg's test pattern plus a 140 Hz tone, VP8/Opus WebM like Chrome records."""
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc2=size={width}x{height}:rate=30:duration={seconds}",
+        "-f", "lavfi", "-i", f"sine=frequency=140:sample_rate=48000:duration={seconds}",
+        "-c:v", "libvpx", "-b:v", "1M", "-c:a", "libopus", "-shortest", path,
+    ]
+    subprocess.run(cmd, check=True)
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    """Latency samples and outcome counts per endpoint, shared by all users."""
+
+    def __init__(self):
+        self.samples = {e: [] for e in ENDPOINTS}
+        self.errors  = {e: 0 for e in ENDPOINTS}
+        self.busy    = {e: 0 for e in ENDPOINTS}
+        self.completed_interviews = 0
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, status: int):
+        with self._lock:
+            if status == 429:
+                self.busy[endpoint] += 1
+            elif status >= 400 or status == 0:
+                self.errors[endpoint] += 1
+            else:
+                self.samples[endpoint].append(seconds)
+
+    def interview_done(self):
+        with self._lock:
+            self.completed_interviews += 1
+
+    def rows(self, wall_seconds: float) -> list:
+        rows = []
+        for endpoint in ENDPOINTS:
+            ms = sorted(s * 1000 for s in self.samples[endpoint])
+            rows.append({
+                "endpoint": endpoint,
+                "ok":       len(ms),
+                "errors":   self.errors[endpoint],
+                "busy_429": self.busy[endpoint],
+                "rps":      round(len(ms) / wall_seconds, 2) if wall_seconds else 0,
+                "p50_ms":   round(percentile(ms, 50), 1),
+                "p95_ms":   round(percentile(ms, 95), 1),
+                "p99_ms":   round(percentile(ms, 99), 1),
+                "max_ms":   round(ms[-1], 1) if ms else 0,
+            })
+        return rows
+
+
+# ─────────────────────────────────────────────
+# HTTP
+# ─────────────────────────────────────────────
+
+def _multipart(fields: dict, files: dict) -> tuple:
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, data, content_type) in files.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                     f'filename="{filename}"\r\nContent-Type: {content_type}\r\n\r\n'.encode())
+        parts.append(data + b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+class Client:
+    def __init__(self, base_url: str, recorder: Recorder, timeout: float):
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.timeout  = timeout
+        self.token    = None
+
+    def call(self, method: str, endpoint: str, json_body=None, form=None, files=None, query=""):
+        """Returns (status, headers, body bytes) and records the timing under `endpoint`."""
+        data, headers = None, {}
+        if json_body is not None:
+            data, headers["Content-Type"] = json.dumps(json_body).encode(), "application/json"
+        elif files is not None:
+            data, headers["Content-Type"] = _multipart(form or {}, files)
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        req = urllib.request.Request(f"{self.base_url}/{endpoint}{query}", data=data,
+                                     headers=headers, method=method)
+        t0 = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                status, resp_headers, body = resp.status, dict(resp.headers), resp.read()
+        except urllib.error.HTTPError as e:
+            status, resp_headers, body = e.code, dict(e.headers), e.read()
+        except Exception as e:
+            status, resp_headers, body = 0, {}, str(e).encode()
+        self.recorder.record(endpoint, time.perf_counter() - t0, status)
+        return status, resp_headers, body
+
+
+def _json(body: bytes) -> dict:
+    try:
+        return json.loads(body)
+    except ValueError:
+        return {}
+
+
+# ─────────────────────────────────────────────
+# ONE VIRTUAL USER
+# ─────────────────────────────────────────────
+
+def run_user(user_no: int, args, clip: bytes, recorder: Recorder, run_id: str):
+    client   = Client(args.base_url, recorder, args.timeout)
+    username = f"lt_{run_id}_{user_no}"
+    password = "loadtest-password"
+
+    client.call("POST", "auth/register", {"username": username, "email": f"{username}@loadtest.dev",
+                                          "password": password, "full_name": f"Load Test {user_no}"})
+    status, _, body = client.call("POST", "auth/login", {"username_or_email": username, "password": password})
+    client.token = _json(body).get("token")
+    if status != 200 or not client.token:
+        return
+
+    for _ in range(args.interviews):
+        status, _, body = client.call("POST", "start_interview",
+                                      {"name": f"Load Test {user_no}", "role": args.role, "language": "en"})
+        start = _json(body)
+        if status != 200:
+            continue
+        session_id, question, q_index, q_type = start["session_id"], start["question"], 1, "intro"
+
+        completed = False
+        while q_index <= args.answers:
+            status, headers, body = client.call(
+                "POST", "submit_response",
+                form={"session_id": session_id, "question_index": q_index,
+                      "question_text": question, "question_type": q_type},
+                files={"video": ("answer.webm", clip, "video/webm")}
+            )
+            if status == 429:
+                time.sleep(float(headers.get("Retry-After", 5)))
+                continue
+            result = _json(body)
+            if status != 200:
+                break
+            if result.get("status") == "completed":
+                completed = True
+                break
+            question, q_type, q_index = result["next_question"], result.get("next_type", "technical"), q_index + 1
+
+        if completed:
+            client.call("GET", "generate_report", query=f"?session_id={session_id}")
+            client.call("GET", "download_report", query=f"?session_id={session_id}")
+            recorder.interview_done()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-interview load test.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--users", type=int, default=8, help="concurrent virtual users")
+    parser.add_argument("--interviews", type=int, default=1, help="interviews per user")
+    parser.add_argument("--answers", type=int, default=5,
+                        help="stop an interview after this many answers if the server hasn't completed it")
+    parser.add_argument("--role", default="Backend Engineer")
+    parser.add_argument("--clip", default=None, help="WebM to upload (default: a generated 8 s clip)")
+    parser.add_argument("--clip-seconds", type=float, default=8.0)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    if args.clip:
+        with open(args.clip, "rb") as f:
+            clip = f.read()
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "answer.webm")
+            make_clip(path, args.clip_seconds)
+            with open(path, "rb") as f:
+                clip = f.read()
+    print(f"🎬 Clip: {len(clip) // 1024} KB | {args.users} users × {args.interviews} interview(s) "
+          f"against {args.base_url}")
+
+    recorder = Recorder()
+    run_id   = uuid.uuid4().hex[:6]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        futures = [pool.submit(run_user, n, args, clip, recorder, run_id) for n in range(args.users)]
+        for f in futures:
+            f.result()
+    wall = time.perf_counter() - t0
+
+    rows = recorder.rows(wall)
+    print()
+    print_table(rows, ["endpoint", "ok", "errors", "busy_429", "rps", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+    per_minute = recorder.completed_interviews / wall * 60 if wall else 0
+    print(f"\n⏱  {wall:.1f}s wall | {recorder.completed_interviews} interviews completed "
+          f"({per_minute:.2f}/min) | {sum(r['errors'] for r in rows)} errors")
+
+    save_results("loadtest", {
+        "config":     {k: v for k, v in vars(args).items() if k != "out"},
+        "wall_seconds": round(wall, 3),
+        "interviews_completed": recorder.completed_interviews,
+        "interviews_per_minute": round(per_minute, 3),
+        "endpoints":  rows,
+    }, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+metrics.py
+──────────
+In-process latency histograms and counters, served in Prometheus text
+format on /metrics.
+
+  • span(stage)            — context manager timing one stage
+  • timed(stage)           — the same, as a decorator (sync or async functions)
+  • observe(stage, secs)   — records a duration measured elsewhere (e.g. a pool future)
+  • trace(name) / begin()  — groups the stages of one request; its breakdown is
+                             logged when it ends
+  • inc(name, labels)      — counter
+  • gauge(name, fn)        — value read from `fn` at scrape time
+
+Numbers are per process. Under several web workers every worker exports its
+own series, so scrape each worker or aggregate in Prometheus.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# Upper bounds in seconds: from a DB write up to a multi-minute answer
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+HELP = {
+    "prepspark_stage_seconds":         "Duration of one processing stage.",
+    "prepspark_stage_failures_total":  "Stages that raised.",
+    "prepspark_request_seconds":       "Duration of one HTTP request.",
+    "prepspark_auth_cache_total":      "Token validations answered from the in-process cache (hit) or SQLite (miss).",
+    "prepspark_session_cache_total":   "Session state reads answered from the in-process cache (hit) or SQLite (miss).",
+    "prepspark_purged_rows_total":     "Items removed by housekeeping: expired auth tokens, abandoned interviews, orphaned blobs.",
+    "prepspark_report_regenerations_total": "Requests that found a report artifact missing: ran the regeneration (leader) or waited for one in flight (waiter).",
+}
+
+_lock       = threading.Lock()
+_histograms = {}    # (name, labels) -> Histogram
+_counters   = {}    # (name, labels) -> float
+_gauges     = {}    # name -> (fn, help)
+_trace      = contextvars.ContextVar("prepspark_trace", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts  = [0] * len(buckets)   # per bucket, made cumulative when rendered
+        self.sum     = 0.0
+        self.count   = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum   += value
+        self.count += 1
+
+
+def _key(name: str, labels: dict = None) -> tuple:
+    return name, tuple(sorted((labels or {}).items()))
+
+
+# ─────────────────────────────────────────────
+# RECORDING
+# ─────────────────────────────────────────────
+
+def observe_histogram(name: str, value: float, labels: dict = None, buckets=BUCKETS):
+    """`buckets` only matters for the first observation of a series."""
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = Histogram(buckets)
+        hist.observe(value)
+
+
+def inc(name: str, labels: dict = None, by: float = 1):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + by
+
+
+def gauge(name: str, fn, help_text: str = ""):
+    """Registers a gauge whose value is `fn()` at scrape time."""
+    _gauges[name] = (fn, help_text)
+
+
+def observe(stage: str, seconds: float, ok: bool = True, trace=None):
+    """Records one stage duration, in the current request's trace too (or `trace`)."""
+    observe_histogram("prepspark_stage_seconds", seconds, {"stage": stage})
+    if not ok:
+        inc("prepspark_stage_failures_total", {"stage": stage})
+    trace = trace if trace is not None else _trace.get()
+    if trace is not None:
+        trace.add(stage, seconds, ok)
+
+
+@contextmanager
+def span(stage: str):
+    t0, ok = time.perf_counter(), False
+    try:
+        yield
+        ok = True
+    finally:
+        observe(stage, time.perf_counter() - t0, ok=ok)
+
+
+def timed(stage: str):
+    def decorate(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(stage):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# ─────────────────────────────────────────────
+# PER-REQUEST TRACES
+# ─────────────────────────────────────────────
+
+class Trace:
+    """The stages recorded while handling one request (or one background job)."""
+
+    def __init__(self, name: str):
+        self.name    = name
+        self.started = time.perf_counter()
+        self.spans   = []
+        self._lock   = threading.Lock()
+
+    def add(self, stage: str, seconds: float, ok: bool = True):
+        with self._lock:
+            self.spans.append((stage, seconds, ok))
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        with self._lock:
+            parts = [f"{stage} {secs:.2f}s{'' if ok else ' ✗'}" for stage, secs, ok in self.spans]
+        return f"⏱  {self.name} {self.elapsed():.2f}s — " + ", ".join(parts)
+
+
+def current_trace():
+    return _trace.get()
+
+
+def begin(name: str):
+    """Starts a trace in the current context; pass the returned token to end()."""
+    return _trace.set(Trace(name))
+
+
+def end(token, status=None):
+    trace = _trace.get()
+    _trace.reset(token)
+    if trace is None:
+        return
+    labels = {"endpoint": trace.name}
+    if status is not None:
+        labels["status"] = str(status)
+    observe_histogram("prepspark_request_seconds", trace.elapsed(), labels)
+    if trace.spans:
+        print(trace.summary())
+
+
+@contextmanager
+def trace(name: str):
+    token = begin(name)
+    try:
+        yield _trace.get()
+    finally:
+        end(token)
+
+
+# ─────────────────────────────────────────────
+# PROMETHEUS EXPOSITION
+# ─────────────────────────────────────────────
+
+def _fmt_labels(labels: tuple, extra: tuple = ()) -> str:
+    items = list(labels) + list(extra)
+    if not items:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in items)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(items, escaped)) + "}"
+
+
+def _fmt_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def render() -> str:
+    with _lock:
+        histograms = {k: (list(h.counts), h.sum, h.count, h.buckets) for k, h in _histograms.items()}
+        counters   = dict(_counters)
+
+    lines, declared = [], set()
+
+    def declare(name, kind, help_text=None):
+        if name not in declared:
+            declared.add(name)
+            lines.append(f"# HELP {name} {help_text or HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} {kind}")
+
+    for (name, labels), (counts, total, count, buckets) in sorted(histograms.items()):
+        declare(name, "histogram")
+        cumulative = 0
+        for bound, n in zip(buckets, counts):
+            cumulative += n
+            lines.append(f"{name}_bucket{_fmt_labels(labels, (('le', bound),))} {cumulative}")
+        lines.append(f"{name}_bucket{_fmt_labels(labels, (('le', '+Inf'),))} {count}")
+        lines.append(f"{name}_sum{_fmt_labels(labels)} {total:.6f}")
+        lines.append(f"{name}_count{_fmt_labels(labels)} {count}")
+
+    for (name, labels), value in sorted(counters.items()):
+        declare(name, "counter")
+        lines.append(f"{name}{_fmt_labels(labels)} {_fmt_value(value)}")
+
+    for name, (fn, help_text) in sorted(_gauges.items()):
+        try:
+            value = fn()
+        except Exception:
+            continue
+        declare(name, "gauge", help_text)
+        lines.append(f"{name} {_fmt_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Drops every recorded value (gauges stay registered)."""
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
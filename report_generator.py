@@ -13,6 +13,8 @@ import textwrap
 from datetime import datetime
 from typing import Optional
 
+from metrics import timed
+
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
@@ -447,6 +449,7 @@ def graph_confidence_progress(responses: list) -> bytes:
 # MASTER GRAPH BUILDER
 # ─────────────────────────────────────────────
 
+@timed("graphs")
 def build_graphs(responses: list, analytics: dict) -> dict:
     """Generates all 6 charts. Returns {key: png_bytes}."""
     results = {}
@@ -1045,6 +1048,7 @@ def _add_final_recommendation(story, styles, report: dict, analytics: dict):
 # MASTER PDF BUILDER
 # ─────────────────────────────────────────────
 
+@timed("pdf")
 def build_pdf(session_info: dict, analytics: dict,
               report: dict, responses: list,
               graphs: dict) -> bytes:
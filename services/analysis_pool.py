@@ -0,0 +1,311 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import config
+import metrics
+from services.shared_media import FrameRing, SharedArray, attach
+
+
+# Imported once by the forkserver that every analysis process is forked from
+FORKSERVER_PRELOAD = ["services.analysis_preload"]
+
+
+class PoolSaturated(Exception):
+    """Raised when every analysis slot and queue position is taken."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Analysis capacity exhausted.")
+        self.retry_after = retry_after
+
+
+# ─────────────────────────────────────────────
+# WORKER SIDE  (runs inside the pool processes)
+# ─────────────────────────────────────────────
+
+_worker_services = {}
+
+
+def _init_worker(preload: bool):
+    """
+    Runs once in every new worker process. Each worker gets its own MediaPipe
+    graph and ONNX net up front and runs a synthetic frame and clip through
+    them, so no answer pays model start-up. Native libraries are pinned to one
+    thread — parallelism comes from the processes.
+    """
+    import cv2
+    cv2.setNumThreads(1)
+    if preload:
+        from services.audio_service import AudioService
+        _worker_video_service().warm_up()
+        AudioService.warm_up()
+
+
+def _worker_video_service():
+    svc = _worker_services.get("video")
+    if svc is None:
+        from services.video_service import VideoService
+        svc = _worker_services["video"] = VideoService()
+    return svc
+
+
+def run_video_analysis(video_path: str) -> dict:
+    """VideoService.analyze in a worker process (one MediaPipe graph per worker)."""
+    return _worker_video_service().analyze(video_path)
+
+
+def run_video_analysis_with_decoder(video_path: str, ring_shape: tuple, start_method: str) -> dict:
+    """
+    VideoService.analyze_frames fed by a decoder process this worker starts.
+    The ring and the decoder only exist once a worker has picked the answer
+    up, so an answer waiting in the pool queue holds neither memory nor a
+    process, and the decoder is never blocked waiting for a consumer.
+    """
+    ring = FrameRing.create(*ring_shape)
+    decoder = multiprocessing.get_context(start_method).Process(
+        target=decode_into_ring, args=(video_path, ring.handle()), daemon=True
+    )
+    try:
+        decoder.start()
+        return _worker_video_service().analyze_frames(ring)
+    finally:
+        ring.abort()            # unblocks a decoder still waiting for a free slot
+        if decoder.pid is not None:
+            decoder.join(timeout=1)
+            if decoder.is_alive():
+                decoder.kill()
+        ring.close()
+
+
+def decode_into_ring(video_path: str, ring_handle: dict, stride: int = 2):
+    """
+    Decoder process body: decodes `video_path` and fills the ring with every
+    `stride`-th frame (the ones VideoService analyses), downscaling anything
+    larger than a slot. Blocks whenever the ring is full.
+    """
+    import cv2
+    cv2.setNumThreads(1)
+    ring = FrameRing.attach(ring_handle)
+    cap = cv2.VideoCapture(video_path)
+    frame_count, failed = 0, False
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        size = None
+        while cap.isOpened():
+            if frame_count % stride != 0:
+                if not cap.grab(): break
+                frame_count += 1
+                continue
+            success, image = cap.read()
+            if not success: break
+            if size is None:
+                size = ring.fit(*image.shape[:2])
+                ring.set_format(size[0], size[1], fps)
+            slot = ring.slot_for_write()
+            if slot is None:
+                break   # consumer gave up
+            if image.shape[:2] == size:
+                slot[...] = image
+            else:
+                cv2.resize(image, (size[1], size[0]), dst=slot, interpolation=cv2.INTER_AREA)
+            ring.commit(frame_count)
+            frame_count += 1
+    except Exception as e:
+        print(f"❌ Frame decoder error: {e}")
+        failed = True
+    finally:
+        cap.release()
+        ring.finish(frame_count, failed=failed)
+        ring.close()
+
+
+def run_audio_metrics(samples_handle: dict, sample_rate: int, transcript: str) -> tuple:
+    """AudioService.measure_samples (Parselmouth) on PCM shared by the app process."""
+    from services.audio_service import AudioService
+    with attach(samples_handle) as samples:
+        return AudioService.measure_samples(samples, sample_rate, transcript)
+
+
+def _ping():
+    return os.getpid()
+
+
+# ─────────────────────────────────────────────
+# APP SIDE
+# ─────────────────────────────────────────────
+
+class AnalysisPool:
+    """
+    One process pool per app process for the CPU-bound half of answer analysis.
+
+    `ANALYSIS_WORKERS` bounds how many cores the analysis keeps busy (decoders
+    included, see FRAME_RING_ENABLED); on top of that at
+    most `ANALYSIS_QUEUE_SIZE` answers may wait. An answer holds its admission
+    slot from upload until its analysis is finished, and uploads arriving when
+    every slot is taken are turned away with PoolSaturated instead of piling
+    more work onto an already busy box.
+    """
+
+    def __init__(self, workers: int = None, queue_size: int = None,
+                 retry_after: int = None, start_method: str = None,
+                 preload: bool = None):
+        self.cpus         = workers or config.ANALYSIS_WORKERS
+        self.use_decoder  = config.FRAME_RING_ENABLED
+        # Each decoder runs alongside its worker, so it counts against the same cores
+        self.workers      = max(1, self.cpus // 2) if self.use_decoder else self.cpus
+        self.queue_size   = config.ANALYSIS_QUEUE_SIZE if queue_size is None else queue_size
+        self.retry_after  = retry_after or config.ANALYSIS_RETRY_AFTER_SECONDS
+        self.start_method = start_method or config.ANALYSIS_START_METHOD
+        self.preload      = config.ANALYSIS_PRELOAD_MODELS if preload is None else preload
+
+        self._slots    = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._in_use   = 0                  # for the slots gauge
+        self._in_use_lock = threading.Lock()
+        self._executor = None
+        self._lock     = threading.Lock()
+
+        metrics.gauge("prepspark_analysis_slots_in_use", lambda: self._in_use,
+                      "Answers holding an analysis slot (running or queued).")
+        metrics.gauge("prepspark_analysis_slots_total", lambda: self.workers + self.queue_size,
+                      "Analysis slots (workers + queue).")
+
+    # ── Admission control ──
+
+    def admit(self):
+        """Takes one answer slot or raises PoolSaturated. Pair with release()."""
+        if not self._slots.acquire(blocking=False):
+            metrics.inc("prepspark_admission_rejected_total")
+            raise PoolSaturated(self.retry_after)
+        with self._in_use_lock:
+            self._in_use += 1
+
+    def release(self):
+        with self._in_use_lock:
+            self._in_use -= 1
+        self._slots.release()
+
+    # ── Execution ──
+
+    def analyze_video(self, video_path: str):
+        """
+        Returns a Future for the video analysis of one answer. With the frame
+        ring enabled the worker starts a decoder process that decodes while it
+        runs FaceMesh, the two overlapping on different cores.
+        """
+        if not self.use_decoder:
+            return self._timed_video(self.submit(run_video_analysis, video_path))
+
+        ring_shape = (config.FRAME_RING_SLOTS, config.FRAME_RING_MAX_HEIGHT, config.FRAME_RING_MAX_WIDTH)
+        return self._timed_video(
+            self.submit(run_video_analysis_with_decoder, video_path, ring_shape, self.start_method)
+        )
+
+    @staticmethod
+    def _timed_video(future):
+        # Recorded when the worker finishes, against the trace of the request that asked
+        t0, trace = time.perf_counter(), metrics.current_trace()
+        future.add_done_callback(lambda f: metrics.observe(
+            "video_analysis", time.perf_counter() - t0,
+            ok=not f.cancelled() and f.exception() is None, trace=trace))
+        return future
+
+    def measure_audio(self, audio_path: str, transcript: str) -> tuple:
+        """Blocks for (global_metrics, frame_log) — see submit_audio_metrics()."""
+        return self.submit_audio_metrics(audio_path, transcript).result()
+
+    async def measure_audio_async(self, audio_path: str, transcript: str) -> tuple:
+        """
+        measure_audio() for the ASGI app: awaits the worker instead of blocking.
+        Reading the WAV and copying it to shared memory happen in a thread.
+        """
+        future = await asyncio.to_thread(self.submit_audio_metrics, audio_path, transcript)
+        return await asyncio.wrap_future(future)
+
+    def submit_audio_metrics(self, audio_path: str, transcript: str):
+        """
+        Decodes the extracted WAV here and hands the samples to a worker through
+        shared memory. Returns a Future for (global_metrics, frame_log); the
+        shared block is freed when it completes.
+        """
+        from services.audio_service import AudioService
+        samples, sample_rate = AudioService.load_samples(audio_path)
+        shared = SharedArray.from_array(samples)
+        try:
+            future = self.submit(run_audio_metrics, shared.handle(), sample_rate, transcript)
+        except Exception:
+            shared.close()
+            raise
+        future.add_done_callback(lambda _: shared.close())
+        return future
+
+    def start(self, timeout: float = 300) -> int:
+        """
+        Starts the worker processes now rather than on the first upload and
+        waits until each has been through its initializer (i.e. is warm).
+        Returns how many workers answered before `timeout`.
+        """
+        executor = self._get_executor()
+        seen, deadline = set(), time.monotonic() + timeout
+        try:
+            while len(seen) < self.workers and time.monotonic() < deadline:
+                # A warm worker can answer several pings while a sibling is still
+                # initialising, so keep asking until every pid has been seen.
+                seen.update(f.result() for f in [executor.submit(_ping) for _ in range(self.workers)])
+                if len(seen) < self.workers:
+                    time.sleep(0.05)
+        except BrokenProcessPool:
+            # A worker died in its initializer — drop the pool so the next start() retries
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+        return len(seen)
+
+    def submit(self, fn, *args):
+        try:
+            return self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. native crash in a decoder) — replace the pool once
+            print("⚠️  Analysis pool broken — restarting workers.")
+            with self._lock:
+                self._executor = None
+            return self._get_executor().submit(fn, *args)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def after_fork(self):
+        """
+        In a freshly forked web worker: forget any executor and locks copied
+        from the parent (its worker processes belong to the parent) so this
+        process starts its own pool on first use.
+        """
+        self._executor = None
+        self._lock     = threading.Lock()
+        self._slots    = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._in_use   = 0
+        self._in_use_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                if self.start_method == "forkserver":
+                    # Must be set before this process starts its forkserver (on first submit)
+                    multiprocessing.set_forkserver_preload(FORKSERVER_PRELOAD)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                    initargs=(self.preload,),
+                )
+                decoders = " + frame decoders" if self.use_decoder else ""
+                print(f"⚙️  Analysis pool: {self.workers} workers{decoders} on {self.cpus} cores, "
+                      f"{self.queue_size} queued answers max ({self.start_method}).")
+            return self._executor
@@ -0,0 +1,34 @@
+"""
+analysis_preload.py
+───────────────────
+Imported once by the analysis forkserver (AnalysisPool registers it with
+multiprocessing.set_forkserver_preload). Every pool worker and frame decoder
+is forked from that server, so the heavy libraries and the raw model weights
+loaded here are shared copy-on-write between all of one web worker's
+analysis processes instead of being imported and read by each of them.
+
+Each process still builds its own MediaPipe graph and emotion net from
+these weights (see analysis_pool._init_worker).
+"""
+
+import gc
+import importlib
+
+MODULES = ["cv2", "services.audio_service", "services.video_service"]
+
+# An exception escaping this module would take the forkserver down with it
+for _name in MODULES:
+    try:
+        importlib.import_module(_name)
+    except Exception as e:
+        print(f"⚠️  Analysis preload of {_name} skipped: {e}")
+try:
+    from services.video_service import preload_model_weights
+    preload_model_weights()
+except Exception as e:
+    print(f"⚠️  Model weight preload skipped: {e}")
+
+# Keep the preloaded objects out of the GC's reach so a collection in a
+# forked child does not write to (and un-share) their pages
+gc.collect()
+gc.freeze()
@@ -1,13 +1,17 @@
+import asyncio
 import os
 import time
 import json
 import subprocess
+import wave
 import numpy as np
 import parselmouth
 from parselmouth.praat import call
-from groq import Groq
+from groq import Groq, AsyncGroq
 from dotenv import load_dotenv
 
+import metrics
+
 load_dotenv()
 
 
@@ -18,6 +22,13 @@ class AudioService:
             api_key=os.getenv("GROQ_API_KEY"),
             timeout=360.0
         )
+        self._async_client = None   # AsyncGroq, built by the async path on first use
+
+    @property
+    def async_client(self) -> AsyncGroq:
+        if self._async_client is None:
+            self._async_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"), timeout=360.0)
+        return self._async_client
 
     def extract_audio_from_video(self, video_path):
         """
@@ -69,72 +80,87 @@ class AudioService:
             print(f"❌ Audio Extraction Error: {e}")
             return None
 
-    def analyze(self, video_path, language: str = 'en'):
+    def analyze(self, video_path, language: str = 'en', on_progress=None,
+                metrics_runner=None):
         """
         Analyzes audio from the given video path.
 
         Args:
-            video_path: Path to the video file.
-            language:   ISO 639-1 language code (e.g. 'hi', 'ta', 'en').
-                        Pass 'auto' to let Whisper detect automatically —
-                        useful for code-switching (Hinglish, Tanglish, etc.).
+            video_path:  Path to the video file.
+            language:    ISO 639-1 language code (e.g. 'hi', 'ta', 'en').
+                         Pass 'auto' to let Whisper detect automatically —
+                         useful for code-switching (Hinglish, Tanglish, etc.).
+            on_progress: Optional callback(stage, data) fired as soon as the
+                         audio is extracted and the transcript is ready.
+            metrics_runner: Optional callable(audio_path, transcript) returning
+                         (global_metrics, frame_log). Lets the caller run the
+                         CPU-bound Parselmouth work elsewhere; defaults to measure().
         """
         print(f"🎙️ Analyzing Audio: {video_path} | Language: {language}")
+        notify = on_progress or (lambda stage, data=None: None)
 
         # 1. Extract .wav
-        audio_path = self.extract_audio_from_video(video_path)
+        with metrics.span("audio_extract"):
+            audio_path = self.extract_audio_from_video(video_path)
         if not audio_path:
             # Return a safe fallback so the rest of the pipeline doesn't crash
-            return {
-                "transcript": "",
-                "groq_json": {},
-                "global_metrics": {
-                    "wpm": 0, "avg_pitch_hz": 0, "pitch_variance": 0,
-                    "jitter_percent": 0, "duration_seconds": 0
-                },
-                "frame_log": [],
-                "error": "Audio extraction failed"
-            }
+            return self._extraction_failed()
 
+        notify("audio_extracted", {})
         print("Starting transcription...")
 
         # 2. Groq Transcription (Whisper Large v3)
-        transcript_text = ""
-        groq_json = {}
+        with metrics.span("transcription"):
+            transcript_text, groq_json = self.transcribe(audio_path, language)
+        notify("transcript_ready", {"transcript": transcript_text})
+
+        # 3 + 4. Acoustic and frame-level metrics
+        runner = metrics_runner or self.measure
         try:
-            with open(audio_path, "rb") as file:
-                # Build kwargs — only pass language when it's not 'auto'
-                # Whisper Large v3 auto-detects when language is omitted.
-                # Passing a specific language improves accuracy and speed
-                # for single-language speakers (e.g. pure Tamil or pure Hindi).
-                transcription_kwargs = {
-                    "file": (os.path.basename(audio_path), file.read()),
-                    "model": "whisper-large-v3",
-                    "response_format": "verbose_json",
-                    "timestamp_granularities": ["word"],
-                }
-                if language and language.lower() != 'auto':
-                    transcription_kwargs["language"] = language
-
-                transcription = self.client.audio.transcriptions.create(
-                    **transcription_kwargs
-                )
-            transcript_text = transcription.text or ""
-            groq_json = transcription.to_dict() if hasattr(transcription, 'to_dict') else {}
-            print(f"✅ Groq transcription success: '{transcript_text[:60]}...'")
-        except Exception as e:
-            print(f"❌ Groq API Error: {e}")
-            # Don't crash — continue with empty transcript
+            with metrics.span("acoustic_metrics"):
+                global_metrics, frame_log = runner(audio_path, transcript_text)
+        finally:
+            # Cleanup
+            if os.path.exists(audio_path):
+                os.remove(audio_path)
 
-        # 3. Acoustic Metrics
-        global_metrics = self._get_acoustic_metrics(audio_path, transcript_text)
+        return {
+            "transcript": transcript_text,
+            "groq_json": groq_json,
+            "global_metrics": global_metrics,
+            "frame_log": frame_log
+        }
+
+    async def analyze_async(self, video_path, language: str = 'en', on_progress=None,
+                            metrics_runner=None):
+        """
+        analyze() for the ASGI app: transcription goes through AsyncGroq, so
+        the event loop is free while Whisper runs. ffmpeg runs in a thread;
+        `metrics_runner` is an async callable(audio_path, transcript) and
+        defaults to measure() in a thread.
+        """
+        print(f"🎙️ Analyzing Audio (async): {video_path} | Language: {language}")
+        notify = on_progress or (lambda stage, data=None: None)
+
+        with metrics.span("audio_extract"):
+            audio_path = await asyncio.to_thread(self.extract_audio_from_video, video_path)
+        if not audio_path:
+            return self._extraction_failed()
 
-        # 4. Frame-Level Metrics
-        frame_log = self._get_frame_metrics(audio_path)
+        notify("audio_extracted", {})
+        with metrics.span("transcription"):
+            transcript_text, groq_json = await self.transcribe_async(audio_path, language)
+        notify("transcript_ready", {"transcript": transcript_text})
 
-        # Cleanup
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
+        try:
+            with metrics.span("acoustic_metrics"):
+                if metrics_runner:
+                    global_metrics, frame_log = await metrics_runner(audio_path, transcript_text)
+                else:
+                    global_metrics, frame_log = await asyncio.to_thread(self.measure, audio_path, transcript_text)
+        finally:
+            if os.path.exists(audio_path):
+                os.remove(audio_path)
 
         return {
             "transcript": transcript_text,
@@ -143,11 +169,116 @@ class AudioService:
             "frame_log": frame_log
         }
 
-    def _get_acoustic_metrics(self, audio_path, transcript):
+    # ── Transcription (Groq Whisper) ──
+
+    def transcribe(self, audio_path, language: str = 'en'):
+        """Returns (transcript_text, groq_json); ("", {}) if the API call fails."""
+        try:
+            transcription = self.client.audio.transcriptions.create(
+                **self._transcription_kwargs(audio_path, language)
+            )
+            return self._read_transcription(transcription)
+        except Exception as e:
+            print(f"❌ Groq API Error: {e}")
+            # Don't crash — continue with empty transcript
+            return "", {}
+
+    async def transcribe_async(self, audio_path, language: str = 'en'):
+        """transcribe() through AsyncGroq."""
+        try:
+            transcription = await self.async_client.audio.transcriptions.create(
+                **self._transcription_kwargs(audio_path, language)
+            )
+            return self._read_transcription(transcription)
+        except Exception as e:
+            print(f"❌ Groq API Error: {e}")
+            return "", {}
+
+    @staticmethod
+    def _transcription_kwargs(audio_path, language):
+        with open(audio_path, "rb") as file:
+            # Build kwargs — only pass language when it's not 'auto'
+            # Whisper Large v3 auto-detects when language is omitted.
+            # Passing a specific language improves accuracy and speed
+            # for single-language speakers (e.g. pure Tamil or pure Hindi).
+            kwargs = {
+                "file": (os.path.basename(audio_path), file.read()),
+                "model": "whisper-large-v3",
+                "response_format": "verbose_json",
+                "timestamp_granularities": ["word"],
+            }
+        if language and language.lower() != 'auto':
+            kwargs["language"] = language
+        return kwargs
+
+    @staticmethod
+    def _read_transcription(transcription):
+        transcript_text = transcription.text or ""
+        groq_json = transcription.to_dict() if hasattr(transcription, 'to_dict') else {}
+        print(f"✅ Groq transcription success: '{transcript_text[:60]}...'")
+        return transcript_text, groq_json
+
+    @staticmethod
+    def _extraction_failed():
+        return {
+            "transcript": "",
+            "groq_json": {},
+            "global_metrics": {
+                "wpm": 0, "avg_pitch_hz": 0, "pitch_variance": 0,
+                "jitter_percent": 0, "duration_seconds": 0
+            },
+            "frame_log": [],
+            "error": "Audio extraction failed"
+        }
+
+    @staticmethod
+    def warm_up():
+        """
+        Pushes one second of a synthetic voiced tone through measure_samples()
+        so Praat's pitch / jitter / intensity code paths are loaded before the
+        first real answer.
+        """
+        sample_rate = 16000
+        t = np.arange(sample_rate) / sample_rate
+        tone = (0.3 * np.sin(2 * np.pi * 140 * t) * 32767).astype(np.int16)
+        AudioService.measure_samples(tone, sample_rate, "warm up")
+
+    @staticmethod
+    def measure(audio_path, transcript):
+        """
+        The Parselmouth half of analyze(): returns (global_metrics, frame_log).
+        Needs no API client, so it can run in an analysis worker process.
+        """
+        return AudioService.measure_samples(*AudioService.load_samples(audio_path), transcript)
+
+    @staticmethod
+    def load_samples(audio_path):
+        """
+        Decodes the mono 16-bit WAV written by extract_audio_from_video().
+        Returns (int16 samples, sample_rate).
+        """
+        with wave.open(audio_path, "rb") as wav:
+            sample_rate = wav.getframerate()
+            pcm = wav.readframes(wav.getnframes())
+        return np.frombuffer(pcm, dtype="<i2"), sample_rate
+
+    @staticmethod
+    def measure_samples(samples, sample_rate, transcript):
+        """measure() on already-decoded int16 samples — builds one Sound for both passes."""
+        try:
+            sound = parselmouth.Sound(samples.astype(np.float64) / 32768.0,
+                                      sampling_frequency=sample_rate)
+        except Exception as e:
+            print(f"❌ Could not load audio samples: {e}")
+            return AudioService._get_acoustic_metrics(None, transcript), []
+        return (AudioService._get_acoustic_metrics(sound, transcript),
+                AudioService._get_frame_metrics(sound))
+
+    @staticmethod
+    def _get_acoustic_metrics(sound, transcript):
         """Global Averages for Jitter, Pitch, WPM"""
         print("Getting acoustic metrics...")
         try:
-            sound = parselmouth.Sound(audio_path)
             duration = sound.get_total_duration()
 
             word_count = len(transcript.split()) if transcript else 0
@@ -184,11 +315,11 @@ class AudioService:
                 "jitter_percent": 0, "duration_seconds": 0
             }
 
-    def _get_frame_metrics(self, audio_path):
+    @staticmethod
+    def _get_frame_metrics(sound):
         """Slices audio into 100ms chunks to sync with video analysis."""
         print("Getting frame metrics...")
         try:
-            sound = parselmouth.Sound(audio_path)
             pitch_obj = sound.to_pitch(time_step=0.1)
             intensity_obj = sound.to_intensity(time_step=0.1)
 
@@ -0,0 +1,45 @@
+import importlib
+import threading
+
+
+class LazyService:
+    """
+    Stands in for a service instance and builds it on first use.
+
+    Both the module import and the constructor are deferred, so importing
+    app.py does not pull in MediaPipe, Groq, Gemini, etc. Attribute access is
+    forwarded to the real instance, so call sites look exactly the same.
+    """
+
+    def __init__(self, target: str, *args, **kwargs):
+        # target: "package.module:ClassName"
+        self._target   = target
+        self._args     = args
+        self._kwargs   = kwargs
+        self._instance = None
+        self._lock     = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def get(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    module_name, class_name = self._target.split(":")
+                    cls = getattr(importlib.import_module(module_name), class_name)
+                    self._instance = cls(*self._args, **self._kwargs)
+        return self._instance
+
+    def reset(self):
+        """Forgets the instance (e.g. one inherited across a fork); the next use builds a new one."""
+        self._instance = None
+        self._lock     = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyService {self._target} ({state})>"
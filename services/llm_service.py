@@ -1,22 +1,189 @@
 import google.generativeai as genai
+import asyncio
 import json
 import os
+import time
 from dotenv import load_dotenv
 
+import metrics
+
 load_dotenv()
 
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+if os.getenv("GEMINI_API_ENDPOINT"):
+    # Another Gemini-compatible endpoint (e.g. loadtest.fake_apis); only the REST transport accepts one
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"), transport="rest",
+                    client_options={"api_endpoint": os.getenv("GEMINI_API_ENDPOINT")})
+else:
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
 # ─────────────────────────────────────────────
 # CONSTANTS
 # ─────────────────────────────────────────────
-MIN_QUESTIONS = 5   # LLM cannot end the session before this many answers
-MAX_QUESTIONS = 15  # Session is force-ended at this count regardless
+from config import MIN_QUESTIONS, MAX_QUESTIONS
+
+
+# ─────────────────────────────────────────────
+# CALL TELEMETRY
+# ─────────────────────────────────────────────
+# Every Gemini call records its prompt/response size, token counts and
+# outcome, labelled by method. Latency is the llm.<method> stage histogram.
+
+# Upper bounds in tokens: a one-line closing message up to a full report prompt
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+metrics.HELP.update({
+    "prepspark_llm_calls_total":           "Gemini calls, by method and outcome.",
+    "prepspark_llm_prompt_tokens":         "Prompt tokens per Gemini call.",
+    "prepspark_llm_response_tokens":       "Response tokens per Gemini call.",
+    "prepspark_llm_prompt_chars_total":    "Prompt characters sent to Gemini.",
+    "prepspark_llm_response_chars_total":  "Response characters received from Gemini.",
+})
+
+
+def _call_usage(method: str, prompt: str, response, text, seconds: float) -> dict:
+    """
+    Measures one call and records it in the metrics. Token counts come from
+    the response's usage_metadata; when there is none (the call failed) they
+    are estimated at ~4 characters per token.
+    """
+    meta            = getattr(response, "usage_metadata", None)
+    prompt_tokens   = getattr(meta, "prompt_token_count", None) or len(prompt) // 4
+    response_tokens = getattr(meta, "candidates_token_count", None) or len(text or "") // 4
+    usage = {
+        "method":          method,
+        "ok":              text is not None,
+        "seconds":         seconds,
+        "prompt_chars":    len(prompt),
+        "prompt_tokens":   prompt_tokens,
+        "response_chars":  len(text or ""),
+        "response_tokens": response_tokens,
+    }
+
+    labels = {"method": method}
+    metrics.inc("prepspark_llm_calls_total", {**labels, "outcome": "ok" if usage["ok"] else "error"})
+    metrics.observe_histogram("prepspark_llm_prompt_tokens", prompt_tokens, labels, TOKEN_BUCKETS)
+    metrics.inc("prepspark_llm_prompt_chars_total", labels, usage["prompt_chars"])
+    if usage["ok"]:
+        metrics.observe_histogram("prepspark_llm_response_tokens", response_tokens, labels, TOKEN_BUCKETS)
+        metrics.inc("prepspark_llm_response_chars_total", labels, usage["response_chars"])
+    return usage
 
 
 class LLMService:
-    def __init__(self):
-        self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
+    def __init__(self, usage_sink=None):
+        """
+        usage_sink(session_id, usage) receives the measurements of every call
+        made with a session_id — app.py passes database.record_llm_usage.
+        """
+        self.model      = genai.GenerativeModel('gemini-2.5-flash-lite')
+        self.usage_sink = usage_sink
+
+    # ─────────────────────────────────────────────
+    # PUBLIC API  (blocking and async entry points)
+    # ─────────────────────────────────────────────
+    # Arguments are those of the matching generator further down, plus an
+    # optional session_id that the call's token usage is attributed to.
+
+    def generate_opening_question(self, *args, session_id=None, **kwargs) -> str:
+        return self._run(self._opening_question(*args, **kwargs), session_id)
+
+    async def generate_opening_question_async(self, *args, session_id=None, **kwargs) -> str:
+        return await self._run_async(self._opening_question(*args, **kwargs), session_id)
+
+    def analyze_response(self, *args, session_id=None, **kwargs) -> dict:
+        return self._run(self._analyze_response(*args, **kwargs), session_id)
+
+    async def analyze_response_async(self, *args, session_id=None, **kwargs) -> dict:
+        return await self._run_async(self._analyze_response(*args, **kwargs), session_id)
+
+    def generate_resume_question(self, *args, session_id=None, **kwargs) -> dict:
+        return self._run(self._resume_question(*args, **kwargs), session_id)
+
+    async def generate_resume_question_async(self, *args, session_id=None, **kwargs) -> dict:
+        return await self._run_async(self._resume_question(*args, **kwargs), session_id)
+
+    def generate_final_report(self, *args, session_id=None, **kwargs) -> dict:
+        return self._run(self._final_report(*args, **kwargs), session_id)
+
+    async def generate_final_report_async(self, *args, session_id=None, **kwargs) -> dict:
+        return await self._run_async(self._final_report(*args, **kwargs), session_id)
+
+    def generate_report_analytics(self, *args, session_id=None, **kwargs) -> dict:
+        return self._run(self._report_analytics(*args, **kwargs), session_id)
+
+    async def generate_report_analytics_async(self, *args, session_id=None, **kwargs) -> dict:
+        return await self._run_async(self._report_analytics(*args, **kwargs), session_id)
+
+    # ─────────────────────────────────────────────
+    # GEMINI CALLS
+    # ─────────────────────────────────────────────
+    # Each prompt below is written once, as a generator: it yields
+    # (method, prompt, json_mode) where it needs Gemini and is sent the
+    # response text back — or has the call's exception raised at that point,
+    # so its own try/except fallbacks still apply. _run() drives it with the
+    # blocking client, _run_async() with generate_content_async().
+
+    JSON_RESPONSE = {"response_mime_type": "application/json"}
+
+    def _run(self, flow, session_id=None):
+        reply, error = None, None
+        while True:
+            try:
+                call = flow.throw(error) if error else flow.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply, error = None, None
+            try:
+                reply = self._call(*call, session_id=session_id)
+            except Exception as e:
+                error = e
+
+    async def _run_async(self, flow, session_id=None):
+        reply, error = None, None
+        while True:
+            try:
+                call = flow.throw(error) if error else flow.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply, error = None, None
+            try:
+                reply = await self._call_async(*call, session_id=session_id)
+            except Exception as e:
+                error = e
+
+    def _call(self, method: str, prompt: str, json_mode: bool, session_id=None) -> str:
+        config = self.JSON_RESPONSE if json_mode else None
+        response, text, t0 = None, None, time.perf_counter()
+        try:
+            with metrics.span(f"llm.{method}"):
+                response = self.model.generate_content(prompt, generation_config=config)
+                text = response.text
+            return text
+        finally:
+            usage = _call_usage(method, prompt, response, text, time.perf_counter() - t0)
+            self._report_usage(session_id, usage)
+
+    async def _call_async(self, method: str, prompt: str, json_mode: bool, session_id=None) -> str:
+        config = self.JSON_RESPONSE if json_mode else None
+        response, text, t0 = None, None, time.perf_counter()
+        try:
+            with metrics.span(f"llm.{method}"):
+                response = await self.model.generate_content_async(prompt, generation_config=config)
+                text = response.text
+            return text
+        finally:
+            usage = _call_usage(method, prompt, response, text, time.perf_counter() - t0)
+            if session_id and self.usage_sink:   # the sink writes to SQLite
+                await asyncio.to_thread(self._report_usage, session_id, usage)
+
+    def _report_usage(self, session_id, usage: dict):
+        """Hands one call's usage to the sink (the per-session ledger); never raises."""
+        if not session_id or not self.usage_sink:
+            return
+        try:
+            self.usage_sink(session_id, usage)
+        except Exception as e:
+            print(f"⚠️  LLM usage not recorded for {session_id}: {e}")
 
     # ─────────────────────────────────────────────
     # LANGUAGE SUPPORT
@@ -80,10 +247,10 @@ class LLMService:
     # OPENING QUESTION
     # ─────────────────────────────────────────────
 
-    def generate_opening_question(self, candidate_name: str, target_role: str,
-                                   resume_text: str = None,
-                                   job_description: str = None,
-                                   language: str = 'en') -> str:
+    def _opening_question(self, candidate_name: str, target_role: str,
+                          resume_text: str = None,
+                          job_description: str = None,
+                          language: str = 'en'):
         """Generates a warm, personalised opening greeting for the interview."""
         lang_name = self._lang_name(language)
         lang_instruction = self._lang_instruction(language)
@@ -116,8 +283,8 @@ The greeting should:
 Respond with ONLY the greeting text. No JSON, no labels, no extra commentary."""
 
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            text = yield "generate_opening_question", prompt, False
+            return text.strip()
         except Exception as e:
             print(f"❌ Opening question error: {e}")
             return (
@@ -130,10 +297,10 @@ Respond with ONLY the greeting text. No JSON, no labels, no extra commentary."""
     # ANALYSE RESPONSE + GENERATE NEXT QUESTION
     # ─────────────────────────────────────────────
 
-    def analyze_response(self, transcript, timeline, audio_summary, video_summary,
-                         current_question, current_q_type, chat_history,
-                         target_role, current_q_index, language: str = 'en',
-                         resume_text: str = None, job_description: str = None):
+    def _analyze_response(self, transcript, timeline, audio_summary, video_summary,
+                          current_question, current_q_type, chat_history,
+                          target_role, current_q_index, language: str = 'en',
+                          resume_text: str = None, job_description: str = None):
         """
         Evaluates the candidate's answer and either generates the next question
         or signals that the interview is complete.
@@ -275,11 +442,8 @@ Respond ONLY with valid JSON (no markdown, no code fences):
 }}"""
 
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config={"response_mime_type": "application/json"}
-            )
-            result = json.loads(response.text)
+            text = yield "analyze_response", prompt, True
+            result = json.loads(text)
 
             # Force override if at max questions
             if force_complete:
@@ -292,7 +456,7 @@ Respond ONLY with valid JSON (no markdown, no code fences):
                                      'what is', 'what are', 'how would', 'walk me',
                                      'could you', 'give me', 'have you')
                 if any(nq.lower().startswith(s) for s in suspicious_starts):
-                    result['next_question'] = self._generate_closing_message(language)
+                    result['next_question'] = yield from self._generate_closing_message(language)
                 result['next_q_type'] = 'closing'
 
             return result
@@ -303,7 +467,7 @@ Respond ONLY with valid JSON (no markdown, no code fences):
             return {
                 "feedback": "Could not analyse this response due to a system error.",
                 "next_question": (
-                    self._generate_closing_message(language)
+                    (yield from self._generate_closing_message(language))
                     if is_last else
                     f"Let's continue. For a {target_role} role, can you walk me through "
                     f"how you would approach designing a scalable, fault-tolerant system?"
@@ -313,7 +477,7 @@ Respond ONLY with valid JSON (no markdown, no code fences):
                 "interview_complete": is_last
             }
 
-    def _generate_closing_message(self, language: str) -> str:
+    def _generate_closing_message(self, language: str):
         lang_instruction = self._lang_instruction(language)
         lang_name = self._lang_name(language)
         prompt = (
@@ -322,8 +486,8 @@ Respond ONLY with valid JSON (no markdown, no code fences):
             f"Be warm and encouraging. Write only in {lang_name}. No JSON, no labels."
         )
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            text = yield "closing_message", prompt, False
+            return text.strip()
         except Exception:
             return (
                 "That wraps up our practice session! Your report is ready — "
@@ -334,11 +498,11 @@ Respond ONLY with valid JSON (no markdown, no code fences):
     # RESUME INTERVIEW (continue interrupted session)
     # ─────────────────────────────────────────────
 
-    def generate_resume_question(self, target_role: str, q_index: int,
-                                  q_type: str, chat_history: list,
-                                  language: str = 'en',
-                                  resume_text: str = None,
-                                  job_description: str = None) -> dict:
+    def _resume_question(self, target_role: str, q_index: int,
+                         q_type: str, chat_history: list,
+                         language: str = 'en',
+                         resume_text: str = None,
+                         job_description: str = None):
         """Generates the next question when a candidate resumes an interrupted session."""
         lang_instruction = self._lang_instruction(language)
         lang_name = self._lang_name(language)
@@ -363,11 +527,8 @@ The question MUST be written in {lang_name}.
 Respond ONLY with JSON: {{"question": "Your question here in {lang_name}",  "q_type": "{q_type}"}}"""
 
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config={"response_mime_type": "application/json"}
-            )
-            return json.loads(response.text)
+            text = yield "generate_resume_question", prompt, True
+            return json.loads(text)
         except Exception as e:
             print(f"❌ Resume question error: {e}")
             return {"question": "Can you describe a challenging technical problem you solved recently and walk me through your approach?", "q_type": q_type}
@@ -376,9 +537,9 @@ Respond ONLY with JSON: {{"question": "Your question here in {lang_name}",  "q_t
     # FINAL REPORT
     # ─────────────────────────────────────────────
 
-    def generate_final_report(self, interview_log: list, language: str = 'en',
-                               resume_text: str = None,
-                               job_description: str = None) -> dict:
+    def _final_report(self, interview_log: list, language: str = 'en',
+                      resume_text: str = None,
+                      job_description: str = None):
         """
         Generates the executive performance report once, after the interview ends.
         Incorporates resume and JD context for a more personalised analysis.
@@ -452,11 +613,8 @@ Rules:
 - Output ONLY the JSON object, no markdown fences."""
 
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config={"response_mime_type": "application/json"}
-            )
-            return json.loads(response.text)
+            text = yield "generate_final_report", prompt, True
+            return json.loads(text)
         except Exception as e:
             print(f"❌ Report generation error: {e}")
             return {
@@ -469,11 +627,11 @@ Rules:
     # REPORT ANALYTICS  (structured data for graphs)
     # ─────────────────────────────────────────────
 
-    def generate_report_analytics(self, interview_log: list,
-                                   target_role: str,
-                                   resume_text: str = None,
-                                   job_description: str = None,
-                                   language: str = 'en') -> dict:
+    def _report_analytics(self, interview_log: list,
+                          target_role: str,
+                          resume_text: str = None,
+                          job_description: str = None,
+                          language: str = 'en'):
         """
         Generates structured analytics data used to draw the 6 report graphs.
 
@@ -559,11 +717,8 @@ Rules:
 - Output ONLY the JSON. No explanatory text."""
 
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config={"response_mime_type": "application/json"}
-            )
-            data = json.loads(response.text)
+            text = yield "generate_report_analytics", prompt, True
+            data = json.loads(text)
             # Ensure required keys exist with safe defaults
             defaults = {
                 'skills_from_resume': [], 'skills_from_jd': [],
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+import time
+import uuid
+
+
+class ProgressService:
+    """
+    Per-submission progress channels streamed to the browser as Server-Sent Events.
+
+    Each channel keeps its event history, so a client that opens the stream
+    after processing has started still receives every stage in order. Large
+    values (the base64 TTS audio) are only kept until a stream has delivered
+    them; a later replay gets the event with those values set to null.
+    Channels live in process memory — the events stream must be served by the
+    same worker that accepted the upload.
+    """
+
+    TERMINAL_EVENTS = ("done", "error")
+    CHANNEL_TTL_SECONDS = 600     # Finished channels are dropped after 10 minutes
+    KEEPALIVE_SECONDS = 15        # Comment line to stop proxies closing idle streams
+    RETAINED_VALUE_CHARS = 4096   # Longer string values are dropped once delivered
+
+    def __init__(self):
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def open_channel(self, owner_id) -> str:
+        """Creates a new channel owned by `owner_id` and returns its id."""
+        self._gc()
+        channel_id = uuid.uuid4().hex
+        with self._lock:
+            self._channels[channel_id] = {
+                "owner_id":  owner_id,
+                "events":    [],
+                "closed_at": None,
+                "cond":      threading.Condition(),
+                "waiters":   set(),     # (loop, asyncio.Event) of async streams
+            }
+        return channel_id
+
+    def publish(self, channel_id: str, event: str, data: dict = None):
+        """Appends an event to the channel and wakes up any listening stream."""
+        channel = self._channels.get(channel_id)
+        if not channel:
+            return
+        with channel["cond"]:
+            if channel["closed_at"] is not None:
+                return
+            channel["events"].append((event, data or {}))
+            if event in self.TERMINAL_EVENTS:
+                channel["closed_at"] = time.monotonic()
+            channel["cond"].notify_all()
+            waiters = list(channel["waiters"])
+        for loop, wakeup in waiters:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:    # loop already closed
+                pass
+        if event in self.TERMINAL_EVENTS:
+            self._gc()
+
+    def is_owner(self, channel_id: str, owner_id) -> bool:
+        channel = self._channels.get(channel_id)
+        return bool(channel) and channel["owner_id"] == owner_id
+
+    def stream(self, channel_id: str):
+        """
+        Generator of SSE-formatted strings for one channel.
+        Replays past events, then blocks for new ones until a terminal event.
+        """
+        channel = self._channels.get(channel_id)
+        if not channel:
+            return
+        sent = 0
+        while True:
+            with channel["cond"]:
+                if sent >= len(channel["events"]):
+                    channel["cond"].wait(timeout=self.KEEPALIVE_SECONDS)
+                pending = self._take(channel, sent)
+            if not pending:
+                yield ": keep-alive\n\n"
+                continue
+            for event, message in pending:
+                sent += 1
+                yield message
+                if event in self.TERMINAL_EVENTS:
+                    return
+
+    async def stream_async(self, channel_id: str):
+        """
+        stream() for the ASGI app. Waits on an asyncio.Event that publish()
+        sets from the worker thread, so a long-lived stream costs no thread.
+        """
+        channel = self._channels.get(channel_id)
+        if not channel:
+            return
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with channel["cond"]:
+            channel["waiters"].add(waiter)
+        try:
+            sent = 0
+            while True:
+                with channel["cond"]:
+                    waiter[1].clear()   # cleared under the lock: no publish is missed
+                    pending = self._take(channel, sent)
+                if not pending:
+                    try:
+                        await asyncio.wait_for(waiter[1].wait(), timeout=self.KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+                    continue
+                for event, message in pending:
+                    sent += 1
+                    yield message
+                    if event in self.TERMINAL_EVENTS:
+                        return
+        finally:
+            with channel["cond"]:
+                channel["waiters"].discard(waiter)
+
+    def _take(self, channel: dict, start: int) -> list:
+        """
+        Formats events[start:] as SSE messages and swaps the stored copies for
+        ones without large values. Called with channel["cond"] held.
+        """
+        pending = []
+        events = channel["events"]
+        for i in range(start, len(events)):
+            event, data = events[i]
+            pending.append((event, f"event: {event}\ndata: {json.dumps(data)}\n\n"))
+            events[i] = (event, {key: None if isinstance(value, str) and len(value) > self.RETAINED_VALUE_CHARS
+                                 else value for key, value in data.items()})
+        return pending
+
+    def _gc(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [cid for cid, ch in self._channels.items()
+                       if ch["closed_at"] is not None
+                       and now - ch["closed_at"] > self.CHANNEL_TTL_SECONDS]
+            for cid in expired:
+                del self._channels[cid]
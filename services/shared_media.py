@@ -0,0 +1,228 @@
+"""
+shared_media.py
+────────────────
+Decoded media passed between the app process and analysis workers through
+multiprocessing.shared_memory instead of being pickled through the pool.
+Only a small handle dict ({name, shape, dtype}) crosses the process boundary.
+"""
+
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedArray:
+    """A NumPy array that lives in a named shared-memory block."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, shape: tuple, dtype):
+        self.shm   = shm
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+
+    @classmethod
+    def allocate(cls, shape: tuple, dtype) -> "SharedArray":
+        nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        return cls(shared_memory.SharedMemory(create=True, size=nbytes), shape, dtype)
+
+    @classmethod
+    def from_array(cls, source: np.ndarray) -> "SharedArray":
+        shared = cls.allocate(source.shape, source.dtype)
+        shared.array[...] = source
+        return shared
+
+    def handle(self) -> dict:
+        """Picklable description a worker passes to attach()."""
+        return {"name": self.shm.name, "shape": self.shape, "dtype": self.dtype.str}
+
+    def close(self):
+        """Owner side: release the mapping and free the block."""
+        self.array = None
+        _close_quietly(self.shm)
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+@contextmanager
+def attach(handle: dict):
+    """
+    Worker side: yields a zero-copy ndarray view of a block created elsewhere.
+    The view must not be used after the `with` block ends.
+    """
+    shm = shared_memory.SharedMemory(name=handle["name"])
+    try:
+        yield np.ndarray(tuple(handle["shape"]), dtype=np.dtype(handle["dtype"]), buffer=shm.buf)
+    finally:
+        _close_quietly(shm)
+
+
+def _close_quietly(shm: shared_memory.SharedMemory):
+    # A caller still holding a view keeps the mapping alive; it is then
+    # released when the SharedMemory object is garbage-collected instead.
+    try:
+        shm.close()
+    except BufferError:
+        pass
+
+
+# ─────────────────────────────────────────────
+# FRAME RING  (decoder process → VideoService worker)
+# ─────────────────────────────────────────────
+
+class FrameRingStalled(Exception):
+    """The other side of a FrameRing stopped making progress."""
+
+
+class FrameRing:
+    """
+    Single-producer / single-consumer ring of fixed-size frame slots in one
+    shared-memory block. A decoder process put()s BGR frames; a VideoService
+    worker iterates the ring and receives each frame as a zero-copy ndarray
+    view of its slot. put() blocks while every slot is unread (backpressure),
+    so memory stays at `slots` frames however far decoding runs ahead.
+
+    Block layout: int64 header | int64 frame index per slot | frame slots.
+    Each counter has exactly one writer, so no lock is needed — the producer
+    fills a slot before publishing it by bumping `write`, and the consumer
+    only bumps `read` once it has moved on to the next frame.
+
+    As a frame source the ring exposes `fps` and `frame_count` like
+    video_service.CaptureFrames, so VideoService.analyze_frames() takes either.
+    """
+
+    # Header fields
+    _WRITE, _READ, _READY, _DONE, _CLOSED, _HEIGHT, _WIDTH, _FPS_MILLI, _FRAME_COUNT, _FAILED = range(10)
+    HEADER_FIELDS = 16
+
+    POLL_SECONDS  = 0.001
+    STALL_SECONDS = 60.0
+
+    def __init__(self, shm: shared_memory.SharedMemory, slots: int,
+                 max_height: int, max_width: int, owner: bool):
+        self.shm        = shm
+        self.slots      = slots
+        self.max_height = max_height
+        self.max_width  = max_width
+        self.owner      = owner
+
+        slot_bytes = max_height * max_width * 3
+        index_off  = self.HEADER_FIELDS * 8
+        data_off   = index_off + slots * 8
+        self.header  = np.ndarray((self.HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        self.indices = np.ndarray((slots,), dtype=np.int64, buffer=shm.buf, offset=index_off)
+        self.data    = np.ndarray((slots, slot_bytes), dtype=np.uint8, buffer=shm.buf, offset=data_off)
+
+    @classmethod
+    def create(cls, slots: int, max_height: int, max_width: int) -> "FrameRing":
+        size = (cls.HEADER_FIELDS + slots) * 8 + slots * max_height * max_width * 3
+        ring = cls(shared_memory.SharedMemory(create=True, size=size),
+                   slots, max_height, max_width, owner=True)
+        ring.header[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, handle: dict) -> "FrameRing":
+        return cls(shared_memory.SharedMemory(name=handle["name"]),
+                   handle["slots"], handle["max_height"], handle["max_width"], owner=False)
+
+    def handle(self) -> dict:
+        return {"name": self.shm.name, "slots": self.slots,
+                "max_height": self.max_height, "max_width": self.max_width}
+
+    # ── Producer side ──
+
+    def fit(self, height: int, width: int) -> tuple:
+        """Largest (height, width) with the same aspect ratio that fits a slot."""
+        scale = min(1.0, self.max_height / height, self.max_width / width)
+        return max(int(height * scale), 1), max(int(width * scale), 1)
+
+    def set_format(self, height: int, width: int, fps: float):
+        self.header[self._HEIGHT]    = height
+        self.header[self._WIDTH]     = width
+        self.header[self._FPS_MILLI] = int(round((fps or 0) * 1000))
+        self.header[self._READY]     = 1
+
+    def slot_for_write(self, timeout: float = None):
+        """
+        Waits for a free slot and returns a writable (height, width, 3) view of
+        it, or None if the consumer has gone away. Publish it with commit().
+        """
+        deadline = time.monotonic() + (timeout or self.STALL_SECONDS)
+        while self.header[self._WRITE] - self.header[self._READ] >= self.slots:
+            if self.header[self._CLOSED]:
+                return None
+            if time.monotonic() > deadline:
+                raise FrameRingStalled("Frame consumer stopped reading.")
+            time.sleep(self.POLL_SECONDS)
+        if self.header[self._CLOSED]:
+            return None
+        return self._slot_view(int(self.header[self._WRITE]) % self.slots)
+
+    def commit(self, frame_index: int):
+        seq = int(self.header[self._WRITE])
+        self.indices[seq % self.slots] = frame_index
+        self.header[self._WRITE] = seq + 1
+
+    def finish(self, frame_count: int, failed: bool = False):
+        self.header[self._FRAME_COUNT] = frame_count
+        self.header[self._FAILED]      = int(failed)
+        self.header[self._READY]       = 1
+        self.header[self._DONE]        = 1
+
+    # ── Consumer side ──
+
+    @property
+    def fps(self) -> float:
+        return float(self.header[self._FPS_MILLI]) / 1000.0
+
+    @property
+    def frame_count(self) -> int:
+        return int(self.header[self._FRAME_COUNT])
+
+    def __iter__(self):
+        """
+        Yields (frame_index, view) in decode order. A view is only valid until
+        the next iteration — that is when its slot is handed back to the decoder.
+        """
+        last_progress = time.monotonic()
+        while True:
+            read = int(self.header[self._READ])
+            if read < self.header[self._WRITE]:
+                yield int(self.indices[read % self.slots]), self._slot_view(read % self.slots)
+                self.header[self._READ] = read + 1
+                last_progress = time.monotonic()
+                continue
+            if self.header[self._DONE]:
+                # Re-check: the last frame may have landed just before DONE was set
+                if read >= self.header[self._WRITE]:
+                    break
+                continue
+            if time.monotonic() - last_progress > self.STALL_SECONDS:
+                raise FrameRingStalled("Frame decoder stopped producing.")
+            time.sleep(self.POLL_SECONDS)
+        if self.header[self._FAILED]:
+            raise FrameRingStalled("Frame decoder failed.")
+
+    # ── Both sides ──
+
+    def abort(self):
+        """Tells the producer to stop; a blocked slot_for_write() returns None."""
+        self.header[self._CLOSED] = 1
+
+    def close(self):
+        self.header = self.indices = self.data = None
+        _close_quietly(self.shm)
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _slot_view(self, slot: int) -> np.ndarray:
+        h = int(self.header[self._HEIGHT])
+        w = int(self.header[self._WIDTH])
+        return self.data[slot, :h * w * 3].reshape(h, w, 3)
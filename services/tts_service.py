@@ -1,7 +1,10 @@
+import asyncio
 import os
 import io
 from dotenv import load_dotenv
 
+from metrics import timed
+
 load_dotenv()
 
 
@@ -9,8 +12,21 @@ class TTSService:
     def __init__(self):
         self.openai_key = os.getenv("OPENAI_API_KEY")
         self.mode = "openai" if self.openai_key else "gtts"
+        self._async_client = None   # AsyncOpenAI, built by synthesize_async() on first use
         print(f"🔊 TTS Service initialized — using {'OpenAI TTS' if self.mode == 'openai' else 'gTTS (free fallback)'}.")
 
+    def warm_up(self):
+        """Imports the active backend (and builds the OpenAI client) without making a request."""
+        try:
+            if self.mode == "openai":
+                from openai import OpenAI
+                OpenAI(api_key=self.openai_key)
+            else:
+                import gtts  # noqa: F401
+        except Exception as e:
+            print(f"⚠️  TTS warm-up skipped: {e}")
+
+    @timed("tts")
     def synthesize(self, text: str, voice: str = "onyx",
                    language: str = "en") -> bytes | None:
         """
@@ -34,6 +50,29 @@ class TTSService:
         else:
             return self._synthesize_gtts(text, language)
 
+    @timed("tts")
+    async def synthesize_async(self, text: str, voice: str = "onyx",
+                               language: str = "en") -> bytes | None:
+        """
+        synthesize() for the ASGI app. OpenAI TTS goes through AsyncOpenAI;
+        gTTS has no async client, so it runs in a thread.
+        """
+        if self.mode == "openai":
+            try:
+                if self._async_client is None:
+                    from openai import AsyncOpenAI
+                    self._async_client = AsyncOpenAI(api_key=self.openai_key)
+                response = await self._async_client.audio.speech.create(
+                    model="tts-1",
+                    voice=voice,
+                    input=text,
+                    response_format="mp3"
+                )
+                return response.content
+            except Exception as e:
+                print(f"❌ OpenAI TTS Error: {e}. Falling back to gTTS.")
+        return await asyncio.to_thread(self._synthesize_gtts, text, language)
+
     def _synthesize_openai(self, text: str, voice: str,
                             language: str = "en") -> bytes | None:
         try:
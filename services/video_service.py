@@ -5,6 +5,49 @@ import math
 import os
 
 
+EMOTION_MODEL_PATH = os.path.join("services", "emotion-ferplus-8.onnx")
+
+# Raw model files read once by the analysis forkserver (services/analysis_preload.py).
+# Every analysis process forked from it parses its own net from these same
+# copy-on-write pages.
+_model_weights = {}
+
+
+def preload_model_weights():
+    """Reads the read-only model weights into memory; call before forking."""
+    if "emotion" not in _model_weights and os.path.exists(EMOTION_MODEL_PATH):
+        with open(EMOTION_MODEL_PATH, "rb") as f:
+            _model_weights["emotion"] = f.read()
+        print(f"   ✅ Emotion weights preloaded ({len(_model_weights['emotion']) // 1024} KB)")
+
+
+# --- FRAME SOURCE ---
+class CaptureFrames:
+    """Decodes a video file in-process, yielding (index, frame) for every `stride`-th frame."""
+
+    def __init__(self, video_path, stride=2):
+        self.cap = cv2.VideoCapture(video_path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.stride = stride
+        self.frame_count = 0
+
+    def __iter__(self):
+        try:
+            while self.cap.isOpened():
+                idx = self.frame_count
+                if idx % self.stride != 0:
+                    # grab() advances without converting a frame we won't analyse
+                    if not self.cap.grab(): break
+                    self.frame_count += 1
+                    continue
+                success, image = self.cap.read()
+                if not success: break
+                self.frame_count += 1
+                yield idx, image
+        finally:
+            self.cap.release()
+
+
 # --- STABILIZER ---
 class Stabilizer:
     def __init__(self, alpha=0.15):
@@ -59,23 +102,43 @@ class VideoService:
         self.PnP_INDICES = [1, 199, 33, 263, 61, 291]
 
         # 4. Emotion Model (ONNX)
-        model_path = os.path.join("services", "emotion-ferplus-8.onnx")
+        weights = _model_weights.get("emotion")
         self.has_emotion_net = False
-        if os.path.exists(model_path):
+        if weights is not None or os.path.exists(EMOTION_MODEL_PATH):
             try:
-                self.emotion_net = cv2.dnn.readNetFromONNX(model_path)
+                if weights is not None:
+                    self.emotion_net = cv2.dnn.readNetFromONNX(np.frombuffer(weights, dtype=np.uint8))
+                else:
+                    self.emotion_net = cv2.dnn.readNetFromONNX(EMOTION_MODEL_PATH)
                 self.has_emotion_net = True
                 print("   ✅ Emotion Model Loaded")
             except:
                 pass
         self.EMOTIONS = ['Neutral', 'Happy', 'Surprise', 'Sad', 'Anger', 'Disgust', 'Fear', 'Contempt']
 
+    def warm_up(self):
+        """
+        Runs one synthetic frame through FaceMesh and one blob through the
+        emotion net, so graph set-up and the first ONNX inference happen now
+        rather than on a candidate's first answer.
+        """
+        frame = np.full((480, 640, 3), 127, dtype=np.uint8)
+        self.face_mesh.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if self.has_emotion_net:
+            blob = cv2.dnn.blobFromImage(np.zeros((64, 64), dtype=np.uint8), 1.0, (64, 64))
+            self.emotion_net.setInput(blob)
+            self.emotion_net.forward()
+
     def analyze(self, video_path):
         print(f"🎥 Processing Video: {video_path}")
-        cap = cv2.VideoCapture(video_path)
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        if fps == 0: fps = 30
-
+        return self.analyze_frames(CaptureFrames(video_path))
+
+    def analyze_frames(self, frames):
+        """
+        Runs the per-frame analysis over a frame source: any iterable of
+        (frame_index, BGR image) that also exposes `fps` and, once exhausted,
+        `frame_count` (see CaptureFrames and shared_media.FrameRing).
+        """
         stats = {
             "frames_analyzed": 0,
             "blinks": 0,
@@ -98,15 +161,13 @@ class VideoService:
         blink_active = False
         brow_raise_values = []
         current_emotion = "Neutral"
+        fps = None
 
-        while cap.isOpened():
-            success, image = cap.read()
-            if not success: break
-
-            # Skip every 2nd frame
-            current_frame_idx = stats["frames_analyzed"]
-            stats["frames_analyzed"] += 1
-            if current_frame_idx % 2 != 0: continue
+        # Sources only yield every 2nd frame; indices still count every frame
+        for current_frame_idx, image in frames:
+            if fps is None:
+                fps = frames.fps or 30
+            stats["frames_analyzed"] = current_frame_idx + 1
 
             timestamp = round(current_frame_idx * (1 / fps), 2)
 
@@ -159,7 +220,8 @@ class VideoService:
 
             frame_log.append(frame_data)
 
-        cap.release()
+        fps = frames.fps or 30
+        stats["frames_analyzed"] = frames.frame_count
 
         # --- SUMMARY ---
         duration_min = max((stats["frames_analyzed"] * 2 / fps) / 60, 0.01)
@@ -29,6 +29,9 @@ function getLangLabel(code) {
 // DASHBOARD
 // ─────────────────────────────────────────────
 
+// Pages of /my_interviews are appended as the user scrolls to the bottom
+const dash = { cursor: null, loading: false, done: false, completed: 0, observer: null, generation: 0 };
+
 async function loadDashboard() {
   const user = state.user;
   if (!user) return;
@@ -38,15 +41,80 @@ async function loadDashboard() {
   if (nameEl) nameEl.textContent = user.full_name || user.username;
   if (userEl) userEl.textContent = '@' + user.username;
 
+  Object.assign(dash, { cursor: null, loading: false, done: false, completed: 0 });
+  dash.generation++;
+  resetDashboard();
+  await loadDashboardPage();
+  watchDashboardEnd();
+}
+
+async function loadDashboardPage() {
+  if (dash.loading || dash.done) return;
+  dash.loading = true;
+  const generation = dash.generation;
+  const query = dash.cursor ? `?cursor=${encodeURIComponent(dash.cursor)}` : '';
   try {
-    const res  = await fetch(`${API}/my_interviews`, { headers: authHeaders() });
+    const res  = await fetch(`${API}/my_interviews${query}`, { headers: authHeaders() });
     const data = await res.json();
+    if (!res.ok) throw new Error(data.error || `HTTP ${res.status}`);
+    if (generation !== dash.generation) return;   // dashboard reloaded meanwhile
     renderDashboard(data.interviews || []);
+    dash.cursor = data.next_cursor;
+    dash.done   = !data.next_cursor;
   } catch (e) {
     console.error('Dashboard load failed:', e);
+  } finally {
+    if (generation === dash.generation) dash.loading = false;
+  }
+  if (generation !== dash.generation) return;
+  const more = document.getElementById('dash-more');
+  if (more) more.style.display = dash.done ? 'none' : 'block';
+  if (dash.done && dash.completed === 0) renderNoCompleted();
+}
+
+/** Loads the next page whenever the marker below the grid scrolls into view. */
+function watchDashboardEnd() {
+  const marker = document.getElementById('dash-more');
+  if (!marker || !('IntersectionObserver' in window)) return;
+  if (dash.observer) dash.observer.disconnect();
+  dash.observer = new IntersectionObserver(async entries => {
+    if (!entries.some(e => e.isIntersecting)) return;
+    await loadDashboardPage();
+    // Still visible (short page on a tall screen): keep going
+    if (!dash.done) { dash.observer.unobserve(marker); dash.observer.observe(marker); }
+  }, { rootMargin: '400px' });
+  dash.observer.observe(marker);
+}
+
+function resetDashboard() {
+  const completedGrid     = document.getElementById('dash-grid');
+  const inProgressGrid    = document.getElementById('dash-inprogress-grid');
+  const inProgressSection = document.getElementById('dash-inprogress-section');
+
+  if (inProgressGrid)    inProgressGrid.innerHTML = '';
+  if (inProgressSection) inProgressSection.style.display = 'none';
+  if (completedGrid) {
+    completedGrid.innerHTML = `
+      <div class="dash-card new-interview-card" onclick="goToSetup()">
+        <div class="new-interview-icon">＋</div>
+        <div class="new-interview-label">Start a Practice Session</div>
+      </div>
+    `;
   }
 }
 
+function renderNoCompleted() {
+  const completedGrid = document.getElementById('dash-grid');
+  if (!completedGrid) return;
+  completedGrid.innerHTML += `
+    <div style="grid-column:1/-1;text-align:center;padding:48px 0;color:var(--text-dim);
+                font-size:14px;font-family:'DM Mono',monospace;">
+      No completed sessions yet. Start your first practice!
+    </div>
+  `;
+}
+
+/** Appends one page of interviews to the in-progress and completed grids. */
 function renderDashboard(interviews) {
   const completedGrid     = document.getElementById('dash-grid');
   const inProgressGrid    = document.getElementById('dash-inprogress-grid');
@@ -56,11 +124,11 @@ function renderDashboard(interviews) {
 
   const completed  = interviews.filter(iv => iv.status === 'COMPLETED');
   const inProgress = interviews.filter(iv => iv.status !== 'COMPLETED');
+  dash.completed += completed.length;
 
   // ── IN-PROGRESS section ──
   if (inProgress.length > 0 && inProgressGrid && inProgressSection) {
     inProgressSection.style.display = 'block';
-    inProgressGrid.innerHTML = '';
     inProgress.forEach(iv => {
       const card = document.createElement('div');
       card.className = 'dash-card resumable';
@@ -93,27 +161,9 @@ function renderDashboard(interviews) {
       card.onclick = () => resumeInterview(iv.session_id);
       inProgressGrid.appendChild(card);
     });
-  } else if (inProgressSection) {
-    inProgressSection.style.display = 'none';
   }
 
   // ── COMPLETED section ──
-  completedGrid.innerHTML = `
-    <div class="dash-card new-interview-card" onclick="goToSetup()">
-      <div class="new-interview-icon">＋</div>
-      <div class="new-interview-label">Start a Practice Session</div>
-    </div>
-  `;
-
-  if (completed.length === 0) {
-    completedGrid.innerHTML += `
-      <div style="grid-column:1/-1;text-align:center;padding:48px 0;color:var(--text-dim);
-                  font-size:14px;font-family:'DM Mono',monospace;">
-        No completed sessions yet. Start your first practice!
-      </div>
-    `;
-  }
-
   completed.forEach(iv => {
     const card = document.createElement('div');
     card.className = 'dash-card';
@@ -368,6 +368,17 @@ function stopRecord() {
 
 // ─── Submit Response ──────────────────────────────
 
+// Server progress events → processing overlay steps they update.
+const SUBMISSION_STEP_EVENTS = {
+  upload_received:   [['step-upload', 'done'], ['step-audio', 'active'], ['step-video', 'active']],
+  transcript_ready:  [['step-audio', 'done']],
+  video_analyzed:    [['step-video', 'done']],
+  timeline_fused:    [['step-timeline', 'done'], ['step-ai', 'active']],
+  evaluation_ready:  [['step-ai', 'done']],
+  tts_ready:         [['step-voice', 'done']],
+  report_generating: [['step-report', 'active']],
+};
+
 async function submitResponse() {
   if (state.recordedChunks.length === 0) {
     toast('Please record your answer first.', 'error');
@@ -381,21 +392,49 @@ async function submitResponse() {
   fd.append('question_index', state.currentQIndex);
   fd.append('question_text',  state.currentQText);
   fd.append('question_type',  state.currentQType);
+  fd.append('stream',         'inline');
 
   showProcessing();
 
+  // The transcript is shown as soon as the server has it, not when the whole answer is processed
+  let transcriptShown = false;
+  const answeredIndex = state.currentQIndex;
+  const answeredText  = state.currentQText;
+  const answeredType  = state.currentQType;
+
   try {
     const res  = await fetch(`${API}/submit_response`, {
       method:  'POST',
       headers: authHeaders(),
       body:    fd
     });
-    const data = await res.json();
+    const isStream = (res.headers.get('Content-Type') || '').startsWith('text/event-stream');
+    let data = isStream ? null : await res.json();
+
+    if (!res.ok) { hideProcessing(); toast(data.error || 'Submission failed.', 'error'); return; }
+
+    if (isStream) {
+      data = await readSubmissionEvents(res, (event, payload) => {
+        (SUBMISSION_STEP_EVENTS[event] || []).forEach(([id, status]) => setProcessingStep(id, status));
+
+        if (event === 'transcript_ready' && !transcriptShown) {
+          addToTranscript(answeredIndex, answeredText, answeredType, payload.transcript || '');
+          transcriptShown = true;
+        }
+        if (event === 'evaluation_ready' && payload.status === 'next_question') {
+          setProcessingStep('step-voice', 'active');
+          updateQuestionCard(payload.next_index, payload.next_question, payload.next_type || 'technical');
+        }
+        if (event === 'evaluation_ready' && payload.status === 'completed') showReportStep();
+      });
+    }
     hideProcessing();
 
-    if (!res.ok) { toast(data.error || 'Submission failed.', 'error'); return; }
+    if (data.error) { toast(data.error, 'error'); return; }
 
-    addToTranscript(state.currentQIndex, state.currentQText, state.currentQType, data.transcript || '');
+    if (!transcriptShown) {
+      addToTranscript(answeredIndex, answeredText, answeredType, data.transcript || '');
+    }
 
     if (data.status === 'completed') {
       // Show closing message if the LLM provided one
@@ -446,6 +485,47 @@ async function submitResponse() {
   }
 }
 
+/**
+ * Reads the Server-Sent Events stream for one submission from a fetch
+ * Response — the upload's own response when sent with stream=inline.
+ * (fetch rather than EventSource, so the Authorization header can be sent.)
+ * Calls onEvent(name, payload) per event; resolves with the `done` payload,
+ * or with `{ error }` if the server reported a failure.
+ */
+async function readSubmissionEvents(res, onEvent) {
+  if (!res.body) throw new Error('Progress stream unavailable.');
+
+  const reader  = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let sep;
+    while ((sep = buffer.indexOf('\n\n')) !== -1) {
+      const raw = buffer.slice(0, sep);
+      buffer    = buffer.slice(sep + 2);
+
+      let event = 'message';
+      let body  = '';
+      raw.split('\n').forEach(line => {
+        if (line.startsWith('event:'))     event = line.slice(6).trim();
+        else if (line.startsWith('data:')) body += line.slice(5).trim();
+      });
+      if (!body) continue;   // keep-alive comment
+
+      const payload = JSON.parse(body);
+      if (event === 'done')  { reader.cancel(); return payload; }
+      if (event === 'error') { reader.cancel(); return { error: payload.error || 'Processing failed.' }; }
+      onEvent(event, payload);
+    }
+  }
+  throw new Error('Progress stream closed before processing finished.');
+}
+
 // ─── Transcript ───────────────────────────────────
 
 function addToTranscript(qIndex, question, qType, transcript) {
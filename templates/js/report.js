@@ -1,6 +1,6 @@
 /* ═══════════════════════════════════════════════════
    PrepSpark — Report Module
-   Renders text report + embedded graph images.
+   Renders text report + graph images (fetched from /report_graph).
    Provides PDF download via /download_report endpoint.
    ═══════════════════════════════════════════════════ */
 
@@ -95,7 +95,7 @@ async function loadReport(sessionId) {
 
 function renderReport(data) {
   const { candidate, role, session_id, start_time, responses,
-          report, language, graphs_b64, analytics } = data;
+          report, language, graphs, analytics } = data;
 
   // ── Header ──
   document.getElementById('rpt-title').textContent = candidate;
@@ -207,8 +207,8 @@ function renderReport(data) {
   }, 120);
 
   // ── Graphs ──
-  if (graphs_b64 && Object.keys(graphs_b64).length > 0) {
-    renderGraphs(graphs_b64);
+  if (graphs && Object.keys(graphs).length > 0) {
+    renderGraphs(session_id, graphs);
   }
 
   // ── AI Insights ──
@@ -298,7 +298,12 @@ function toggleQA(header) {
 // GRAPHS
 // ─────────────────────────────────────────────
 
-function renderGraphs(graphs_b64) {
+/**
+ * `graphs` maps graph name → content hash. Each image is fetched with the
+ * auth header (an <img src> can't send it); the hash in the URL lets the
+ * browser cache serve it on later visits.
+ */
+function renderGraphs(sessionId, graphs) {
   const section = document.getElementById('graphs-section');
   const grid    = document.getElementById('graphs-grid');
   if (!section || !grid) return;
@@ -313,8 +318,8 @@ function renderGraphs(graphs_b64) {
   ];
 
   order.forEach(key => {
-    const b64 = graphs_b64[key];
-    if (!b64) return;
+    const version = graphs[key];
+    if (!version) return;
 
     const meta  = GRAPH_META[key] || { title: key, desc: '' };
     const card  = document.createElement('div');
@@ -322,10 +327,10 @@ function renderGraphs(graphs_b64) {
     card.innerHTML = `
       <div class="graph-card-title">${meta.title}</div>
       <div class="graph-card-desc">${meta.desc}</div>
-      <img class="graph-img" src="data:image/png;base64,${b64}"
-           alt="${meta.title}" loading="lazy">
+      <img class="graph-img" alt="${meta.title}">
     `;
     grid.appendChild(card);
+    loadGraphImage(card.querySelector('img'), sessionId, key, version);
     rendered++;
   });
 
@@ -335,6 +340,23 @@ function renderGraphs(graphs_b64) {
 }
 
 
+async function loadGraphImage(img, sessionId, name, version) {
+  try {
+    const res = await fetch(
+      `${API}/report_graph?session_id=${sessionId}&name=${name}&v=${version}`,
+      { headers: authHeaders() }
+    );
+    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+    const url = URL.createObjectURL(await res.blob());
+    img.onload = () => URL.revokeObjectURL(url);
+    img.src    = url;
+  } catch (e) {
+    img.closest('.graph-card')?.remove();
+    console.error(`Graph ${name} failed to load`, e);
+  }
+}
+
+
 // ─────────────────────────────────────────────
 // PDF DOWNLOAD
 // ─────────────────────────────────────────────
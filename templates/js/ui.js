@@ -31,8 +31,8 @@ function hideError(el) {
 }
 
 // ─── Processing Overlay ───
-const PROC_STEPS = ['step-video', 'step-audio', 'step-timeline', 'step-ai'];
-let stepTimer = null;
+// Steps are driven by real server events (see SUBMISSION_STEP_EVENTS in interview.js).
+const PROC_STEPS = ['step-upload', 'step-audio', 'step-video', 'step-timeline', 'step-ai', 'step-voice', 'step-report'];
 
 function showProcessing() {
   const overlay = document.getElementById('processing-overlay');
@@ -41,26 +41,26 @@ function showProcessing() {
     const el = document.getElementById(id);
     if (el) el.classList.remove('done', 'active');
   });
+  // The final answer swaps "next question" for "report" (see showReportStep)
+  document.getElementById('step-voice')?.classList.remove('hidden');
+  document.getElementById('step-report')?.classList.add('hidden');
   const first = document.getElementById(PROC_STEPS[0]);
   if (first) first.classList.add('active');
+}
+
+function setProcessingStep(id, status) {
+  const el = document.getElementById(id);
+  if (!el || el.classList.contains('done')) return;
+  el.classList.remove('active');
+  el.classList.add(status);
+}
 
-  let i = 0;
-  clearInterval(stepTimer);
-  stepTimer = setInterval(() => {
-    if (i < PROC_STEPS.length) {
-      if (i > 0) {
-        const prev = document.getElementById(PROC_STEPS[i - 1]);
-        if (prev) { prev.classList.remove('active'); prev.classList.add('done'); }
-      }
-      const cur = document.getElementById(PROC_STEPS[i]);
-      if (cur) cur.classList.add('active');
-      i++;
-    }
-  }, 4500);
+function showReportStep() {
+  document.getElementById('step-voice')?.classList.add('hidden');
+  document.getElementById('step-report')?.classList.remove('hidden');
 }
 
 function hideProcessing() {
-  clearInterval(stepTimer);
   PROC_STEPS.forEach(id => {
     const el = document.getElementById(id);
     if (el) { el.classList.remove('active'); el.classList.add('done'); }
@@ -69,4 +69,4 @@ function hideProcessing() {
     const overlay = document.getElementById('processing-overlay');
     if (overlay) overlay.classList.remove('active');
   }, 400);
-}
\ No newline at end of file
+}
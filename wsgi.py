@@ -0,0 +1,58 @@
+"""
+wsgi.py
+───────
+Production entry point for a pre-fork server:
+
+    gunicorn -c gunicorn.conf.py
+
+With preload_app the master calls create_app() once before forking. It
+imports the libraries the web workers themselves use (Parselmouth,
+matplotlib, reportlab), so every worker shares that code copy-on-write
+instead of importing its own copy.
+
+The video models are not loaded here: only analysis processes use them, and
+those are forked from each web worker's own forkserver, which imports them
+and reads the weights once for all of that worker's analysis processes
+(services/analysis_preload.py). Anything that must not cross a fork — API
+clients, the analysis pool, SQLite connections — is built per worker after
+the fork (app.reset_after_fork, called from gunicorn.conf.py).
+"""
+
+import gc
+import importlib
+import time
+
+# Imported in the master purely so their code and module state are shared
+SHARED_MODULES = [
+    "services.audio_service",
+    "report_generator",
+]
+
+
+def create_app(preload_models: bool = True):
+    import app as application
+    import database
+    if preload_models:
+        preload_shared_models()
+    database.close_connection()     # workers open their own after the fork
+    return application.app
+
+
+def preload_shared_models():
+    t0 = time.perf_counter()
+    for name in SHARED_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"⚠️  Pre-fork import of {name} skipped: {e}")
+
+    # Move everything loaded so far out of the GC's reach: a collection in a
+    # worker would otherwise write to these objects and un-share their pages.
+    gc.collect()
+    gc.freeze()
+    print(f"📦 Pre-fork preload done in {time.perf_counter() - t0:.2f}s.")
+
+
+if __name__ == "__main__":
+    # Same app without gunicorn, e.g. for checking the preload on its own
+    create_app().run(port=5000)